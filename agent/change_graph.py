@@ -18,6 +18,7 @@ Workflow Steps:
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from typing import Any, Optional, List, Dict
 from enum import Enum
 
@@ -124,6 +125,7 @@ class ChangePlanningState(BaseModel):
 # =============================================================================
 
 
+@lru_cache(maxsize=1)
 def get_llm():
     """Get the configured LLM instance."""
     provider = os.getenv("LLM_PROVIDER", "openai")
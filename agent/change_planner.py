@@ -15,6 +15,7 @@ from __future__ import annotations
 
 import json
 import os
+from functools import lru_cache
 from typing import Any, Optional, List
 
 from dotenv import load_dotenv
@@ -146,6 +147,7 @@ Return a JSON object with the revised "changes" array."""
 # =============================================================================
 
 
+@lru_cache(maxsize=1)
 def get_llm():
     """Get the configured LLM instance."""
     provider = os.getenv("LLM_PROVIDER", "openai")
@@ -16,12 +16,25 @@ from typing import Any
 
 from dotenv import load_dotenv
 from neo4j import Driver, GraphDatabase
+from neo4j.exceptions import Neo4jError
 
 # Load .env from project root
 env_path = Path(__file__).parent.parent / ".env"
 load_dotenv(env_path)
 
 
+# (constraint name, label) pairs applied by Neo4jClient.ensure_id_constraints
+ID_CONSTRAINTS = (
+    ("constraint_boundedcontext_id", "BoundedContext"),
+    ("constraint_aggregate_id", "Aggregate"),
+    ("constraint_command_id", "Command"),
+    ("constraint_event_id", "Event"),
+    ("constraint_policy_id", "Policy"),
+    ("constraint_readmodel_id", "ReadModel"),
+    ("constraint_ui_id", "UI"),
+)
+
+
 @dataclass
 class Neo4jConfig:
     """Neo4j connection configuration."""
@@ -68,6 +81,25 @@ class Neo4jClient:
         except Exception:
             return False
 
+    def ensure_id_constraints(self) -> None:
+        """
+        Create the unique id constraints for the labels matched by id in graph
+        expansion (same names as schema/01_constraints.cypher). Each constraint
+        also creates the index backing `MATCH (n:Label {id: $id})`.
+        
+        A failing constraint (e.g. duplicate ids in an existing database) is
+        logged and skipped so the remaining labels still get theirs.
+        """
+        with self.session() as session:
+            for name, label in ID_CONSTRAINTS:
+                try:
+                    session.run(
+                        f"CREATE CONSTRAINT {name} IF NOT EXISTS "
+                        f"FOR (n:{label}) REQUIRE n.id IS UNIQUE"
+                    ).consume()
+                except Neo4jError as e:
+                    print(f"⚠️ Could not create constraint {name} on {label}.id: {e.code} {e.message}")
+
     # =========================================================================
     # User Story Operations
     # =========================================================================
@@ -152,6 +184,48 @@ class Neo4jClient:
             )
             return dict(result.single()["user_story"])
 
+    def create_user_stories_bulk(self, user_stories: list[dict[str, Any]]) -> int:
+        """
+        Create many user stories in a single round-trip.
+
+        Same semantics as create_user_story per item: ids that already exist
+        (or repeat within the batch) are skipped, never overwritten.
+        Each item needs id, role and action; the remaining fields are optional.
+        Returns the number of user stories created.
+        """
+        if not user_stories:
+            return 0
+
+        query = """
+        UNWIND $rows as r
+        OPTIONAL MATCH (existing:UserStory {id: r.id})
+        WITH r WHERE existing IS NULL
+        CREATE (us:UserStory {
+            id: r.id,
+            role: r.role,
+            action: r.action,
+            benefit: r.benefit,
+            priority: r.priority,
+            status: r.status,
+            uiDescription: r.ui_description
+        })
+        RETURN count(us) as created
+        """
+        rows_by_id: dict[str, dict[str, Any]] = {}
+        for us in user_stories:
+            rows_by_id.setdefault(us["id"], {
+                "id": us["id"],
+                "role": us["role"],
+                "action": us["action"],
+                "benefit": us.get("benefit"),
+                "priority": us.get("priority", "medium"),
+                "status": us.get("status", "draft"),
+                "ui_description": us.get("ui_description") or "",
+            })
+        with self.session() as session:
+            record = session.run(query, rows=list(rows_by_id.values())).single()
+            return record["created"] if record else 0
+
     # =========================================================================
     # Bounded Context Operations
     # =========================================================================
@@ -196,6 +270,32 @@ class Neo4jClient:
             )
             return dict(result.single()["bounded_context"])
 
+    def create_bounded_contexts_bulk(self, bounded_contexts: list[dict[str, Any]]) -> int:
+        """Create many bounded contexts in a single round-trip."""
+        if not bounded_contexts:
+            return 0
+
+        query = """
+        UNWIND $rows as r
+        MERGE (bc:BoundedContext {id: r.id})
+        SET bc.name = r.name,
+            bc.description = r.description,
+            bc.owner = r.owner
+        RETURN count(bc) as created
+        """
+        rows = [
+            {
+                "id": bc["id"],
+                "name": bc["name"],
+                "description": bc.get("description"),
+                "owner": bc.get("owner"),
+            }
+            for bc in bounded_contexts
+        ]
+        with self.session() as session:
+            record = session.run(query, rows=rows).single()
+            return record["created"] if record else 0
+
     def link_user_story_to_bc(
         self, user_story_id: str, bc_id: str, confidence: float = 0.9
     ) -> bool:
@@ -214,6 +314,28 @@ class Neo4jClient:
             )
             return result.single() is not None
 
+    def link_user_stories_to_bc(
+        self, user_story_ids: list[str], bc_id: str, confidence: float = 0.9
+    ) -> int:
+        """Link many user stories to one bounded context in a single round-trip."""
+        if not user_story_ids:
+            return 0
+
+        query = """
+        MATCH (bc:BoundedContext {id: $bc_id})
+        UNWIND $user_story_ids as us_id
+        MATCH (us:UserStory {id: us_id})
+        MERGE (us)-[r:IMPLEMENTS]->(bc)
+        SET r.confidence = $confidence,
+            r.createdAt = datetime()
+        RETURN count(r) as linked
+        """
+        with self.session() as session:
+            record = session.run(
+                query, user_story_ids=user_story_ids, bc_id=bc_id, confidence=confidence
+            ).single()
+            return record["linked"] if record else 0
+
     # =========================================================================
     # Aggregate Operations
     # =========================================================================
@@ -287,6 +409,53 @@ class Neo4jClient:
             )
             return dict(result.single()["aggregate"])
 
+    def create_aggregates_bulk(self, bc_id: str, aggregates: list[dict[str, Any]]) -> int:
+        """Create all aggregates of one bounded context in a single round-trip.
+
+        Same ownership rule as create_aggregate: raises ValueError if any of the
+        aggregates already belongs to a different bounded context.
+        """
+        if not aggregates:
+            return 0
+
+        check_query = """
+        UNWIND $ids as agg_id
+        MATCH (existing:Aggregate {id: agg_id})<-[:HAS_AGGREGATE]-(otherBC:BoundedContext)
+        WHERE otherBC.id <> $bc_id
+        RETURN existing.id as id, otherBC.id as existing_bc
+        LIMIT 1
+        """
+        query = """
+        MATCH (bc:BoundedContext {id: $bc_id})
+        UNWIND $rows as r
+        MERGE (agg:Aggregate {id: r.id})
+        SET agg.name = r.name,
+            agg.rootEntity = r.root_entity,
+            agg.invariants = r.invariants
+        MERGE (bc)-[:HAS_AGGREGATE {isPrimary: false}]->(agg)
+        RETURN count(agg) as created
+        """
+        rows = [
+            {
+                "id": agg["id"],
+                "name": agg["name"],
+                "root_entity": agg.get("root_entity") or agg["name"],
+                "invariants": agg.get("invariants") or [],
+            }
+            for agg in aggregates
+        ]
+        with self.session() as session:
+            record = session.run(
+                check_query, ids=[row["id"] for row in rows], bc_id=bc_id
+            ).single()
+            if record:
+                raise ValueError(
+                    f"Aggregate {record['id']} already belongs to BC {record['existing_bc']}. "
+                    f"An Aggregate can only belong to ONE Bounded Context."
+                )
+            record = session.run(query, bc_id=bc_id, rows=rows).single()
+            return record["created"] if record else 0
+
     def link_user_story_to_aggregate(
         self, user_story_id: str, aggregate_id: str, confidence: float = 0.9
     ) -> bool:
@@ -392,6 +561,34 @@ class Neo4jClient:
             )
             return dict(result.single()["command"])
 
+    def create_commands_bulk(self, aggregate_id: str, commands: list[dict[str, Any]]) -> int:
+        """Create all commands of one aggregate in a single round-trip."""
+        if not commands:
+            return 0
+
+        query = """
+        MATCH (agg:Aggregate {id: $aggregate_id})
+        UNWIND $rows as r
+        MERGE (cmd:Command {id: r.id})
+        SET cmd.name = r.name,
+            cmd.actor = r.actor,
+            cmd.inputSchema = r.input_schema
+        MERGE (agg)-[:HAS_COMMAND]->(cmd)
+        RETURN count(cmd) as created
+        """
+        rows = [
+            {
+                "id": cmd["id"],
+                "name": cmd["name"],
+                "actor": cmd.get("actor", "user"),
+                "input_schema": cmd.get("input_schema"),
+            }
+            for cmd in commands
+        ]
+        with self.session() as session:
+            record = session.run(query, aggregate_id=aggregate_id, rows=rows).single()
+            return record["created"] if record else 0
+
     def get_commands_by_aggregate(self, aggregate_id: str) -> list[dict[str, Any]]:
         """Fetch commands belonging to an aggregate."""
         query = """
@@ -445,6 +642,40 @@ class Neo4jClient:
             )
             return dict(result.single()["event"])
 
+    def create_events_bulk(self, events: list[dict[str, Any]]) -> int:
+        """
+        Create many events in a single round-trip.
+
+        Each item needs id, name and command_id (the emitting command).
+        """
+        if not events:
+            return 0
+
+        query = """
+        UNWIND $rows as r
+        MATCH (cmd:Command {id: r.command_id})
+        MERGE (evt:Event {id: r.id})
+        SET evt.name = r.name,
+            evt.version = r.version,
+            evt.schema = r.schema,
+            evt.isBreaking = false
+        MERGE (cmd)-[:EMITS {isGuaranteed: true}]->(evt)
+        RETURN count(evt) as created
+        """
+        rows = [
+            {
+                "id": evt["id"],
+                "name": evt["name"],
+                "command_id": evt["command_id"],
+                "version": evt.get("version", "1.0.0"),
+                "schema": evt.get("schema"),
+            }
+            for evt in events
+        ]
+        with self.session() as session:
+            record = session.run(query, rows=rows).single()
+            return record["created"] if record else 0
+
     # =========================================================================
     # Policy Operations
     # =========================================================================
@@ -483,6 +714,45 @@ class Neo4jClient:
             )
             return dict(result.single()["policy"])
 
+    def create_policies_bulk(self, policies: list[dict[str, Any]]) -> list[str]:
+        """
+        Create many policies in a single round-trip.
+
+        Each item needs id, name, bc_id, trigger_event_id and invoke_command_id.
+        Returns the ids of the policies written; rows whose BC, trigger event or
+        invoked command does not exist are skipped.
+        """
+        if not policies:
+            return []
+
+        query = """
+        UNWIND $rows as r
+        MATCH (bc:BoundedContext {id: r.bc_id})
+        MATCH (evt:Event {id: r.trigger_event_id})
+        MATCH (cmd:Command {id: r.invoke_command_id})
+        MERGE (pol:Policy {id: r.id})
+        SET pol.name = r.name,
+            pol.description = r.description
+        MERGE (bc)-[:HAS_POLICY]->(pol)
+        MERGE (evt)-[:TRIGGERS {priority: 1, isEnabled: true}]->(pol)
+        MERGE (pol)-[:INVOKES {isAsync: true}]->(cmd)
+        RETURN collect(pol.id) as created_ids
+        """
+        rows = [
+            {
+                "id": pol["id"],
+                "name": pol["name"],
+                "bc_id": pol["bc_id"],
+                "trigger_event_id": pol["trigger_event_id"],
+                "invoke_command_id": pol["invoke_command_id"],
+                "description": pol.get("description"),
+            }
+            for pol in policies
+        ]
+        with self.session() as session:
+            record = session.run(query, rows=rows).single()
+            return record["created_ids"] if record else []
+
     # =========================================================================
     # Property Operations
     # =========================================================================
@@ -531,6 +801,50 @@ class Neo4jClient:
             record = result.single()
             return dict(record["property"]) if record else {}
 
+    def create_properties_bulk(
+        self,
+        parent_id: str,
+        parent_type: str,
+        properties: list[dict[str, Any]],
+    ) -> int:
+        """
+        Create all Property nodes of one parent in a single round-trip.
+
+        Each item needs id, name and type; description and is_required are optional.
+        Returns the number of properties linked to the parent.
+        """
+        if not properties:
+            return 0
+
+        query = f"""
+        MATCH (parent:{parent_type} {{id: $parent_id}})
+        UNWIND $props as p
+        MERGE (prop:Property {{id: p.id}})
+        SET prop.name = p.name,
+            prop.type = p.type,
+            prop.description = p.description,
+            prop.isRequired = p.is_required,
+            prop.parentId = $parent_id,
+            prop.parentType = $parent_type
+        MERGE (parent)-[:HAS_PROPERTY]->(prop)
+        RETURN count(prop) as created
+        """
+        props = [
+            {
+                "id": p["id"],
+                "name": p["name"],
+                "type": p.get("type", "String"),
+                "description": p.get("description"),
+                "is_required": p.get("is_required", True),
+            }
+            for p in properties
+        ]
+        with self.session() as session:
+            record = session.run(
+                query, parent_id=parent_id, parent_type=parent_type, props=props
+            ).single()
+            return record["created"] if record else 0
+
     def get_properties_by_parent(self, parent_id: str) -> list[dict[str, Any]]:
         """Fetch properties belonging to a parent node."""
         query = """
@@ -1154,6 +1468,63 @@ class Neo4jClient:
             record = result.single()
             return dict(record["analysis"]) if record else {}
 
+    def get_label_counts(self, labels: list[str] | None = None) -> dict[str, int]:
+        """
+        Count nodes per label using Neo4j's count store.
+        
+        `MATCH (n:Label) RETURN count(n)` is answered from store statistics
+        without scanning nodes, so the cost depends on the number of labels,
+        not the graph size. Defaults to every label in the database.
+        Labels without nodes are omitted.
+        """
+        with self.session() as session:
+            if labels is None:
+                result = session.run("CALL db.labels() YIELD label RETURN label")
+                labels = [record["label"] for record in result]
+            if not labels:
+                return {}
+            
+            query = "\nUNION ALL\n".join(
+                f"MATCH (n:`{label.replace('`', '``')}`) RETURN $labels[{i}] as label, count(n) as count"
+                for i, label in enumerate(labels)
+            )
+            result = session.run(query, labels=labels)
+            return {record["label"]: record["count"] for record in result if record["count"]}
+
+    def get_node_count(self) -> int:
+        """Count all nodes once each (answered from the count store)."""
+        with self.session() as session:
+            return session.run("MATCH (n) RETURN count(n) as count").single()["count"]
+
+    def delete_nodes_by_label(self, labels: list[str], batch_size: int = 10000) -> dict[str, int]:
+        """
+        DETACH DELETE every node whose primary label is in `labels`, in batches.
+        
+        Each batch runs as its own auto-commit transaction, so transaction
+        state stays bounded however large the graph is (no APOC needed).
+        Batches match one label at a time so they use the label index instead
+        of scanning every node (legacy nodes included) on each pass.
+        Returns the number of nodes deleted per label, counted by the delete
+        statements themselves.
+        """
+        counts: dict[str, int] = {}
+        with self.session() as session:
+            for label in labels:
+                query = f"""
+                MATCH (n:`{label.replace('`', '``')}`)
+                WHERE labels(n)[0] = $label
+                WITH n LIMIT $batch_size
+                DETACH DELETE n
+                RETURN count(*) as deleted
+                """
+                while True:
+                    deleted = session.run(query, label=label, batch_size=batch_size).single()["deleted"]
+                    if deleted:
+                        counts[label] = counts.get(label, 0) + deleted
+                    if deleted < batch_size:
+                        break
+        return counts
+
     def get_graph_statistics(self) -> dict[str, int]:
         """Get statistics about the current graph."""
         query = """
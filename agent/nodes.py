@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import json
 import os
+from functools import lru_cache
 from typing import Any, List, Dict
 
 from dotenv import load_dotenv
@@ -106,9 +107,72 @@ class UIList(BaseModel):
     )
 
 
+# Keyed wrappers for answering several extraction tasks in one LLM call
+class AggregateBatchItem(BaseModel):
+    """Aggregates extracted for one task of a batch."""
+    key: str = Field(description="Task key, copied verbatim from the prompt")
+    aggregates: List[AggregateCandidate] = Field(
+        description="List of identified aggregates"
+    )
+
+
+class AggregateBatch(BaseModel):
+    """Aggregate results for every task of a batch."""
+    results: List[AggregateBatchItem] = Field(description="One result per task")
+
+
+class CommandBatchItem(BaseModel):
+    """Commands extracted for one task of a batch."""
+    key: str = Field(description="Task key, copied verbatim from the prompt")
+    commands: List[CommandCandidate] = Field(
+        description="List of identified commands"
+    )
+
+
+class CommandBatch(BaseModel):
+    """Command results for every task of a batch."""
+    results: List[CommandBatchItem] = Field(description="One result per task")
+
+
+class EventBatchItem(BaseModel):
+    """Events extracted for one task of a batch."""
+    key: str = Field(description="Task key, copied verbatim from the prompt")
+    events: List[EventCandidate] = Field(
+        description="List of identified events"
+    )
+
+
+class EventBatch(BaseModel):
+    """Event results for every task of a batch."""
+    results: List[EventBatchItem] = Field(description="One result per task")
+
+
 load_dotenv()
 
 
+def _build_system_message() -> SystemMessage:
+    """
+    Build the system message shared by every extraction call.
+
+    On Anthropic the block is marked as a cache breakpoint, so the bound tool
+    schema plus SYSTEM_PROMPT prefix is reused across calls. OpenAI caches
+    stable prefixes automatically, which only requires the prompt to stay
+    byte-identical.
+    """
+    if os.getenv("LLM_PROVIDER", "openai") == "anthropic":
+        return SystemMessage(content=[{
+            "type": "text",
+            "text": SYSTEM_PROMPT,
+            "cache_control": {"type": "ephemeral"},
+        }])
+    return SystemMessage(content=SYSTEM_PROMPT)
+
+
+# SYSTEM_PROMPT never changes, so every LLM call shares one message instance
+SYSTEM_MESSAGE = _build_system_message()
+
+
+@lru_cache(maxsize=1)
 def get_llm():
     """Get the configured LLM instance."""
     provider = os.getenv("LLM_PROVIDER", "openai")
@@ -197,7 +261,7 @@ def identify_bc_node(state: EventStormingState) -> Dict[str, Any]:
     # Use structured output for BC candidates
     structured_llm = llm.with_structured_output(BoundedContextList)
 
-    response = structured_llm.invoke([SystemMessage(content=SYSTEM_PROMPT), HumanMessage(content=prompt)])
+    response = structured_llm.invoke([SYSTEM_MESSAGE, HumanMessage(content=prompt)])
 
     # Parse response into BC candidates
     bc_candidates = response.bounded_contexts
@@ -287,7 +351,7 @@ def breakdown_user_story_node(state: EventStormingState) -> Dict[str, Any]:
 
         structured_llm = llm.with_structured_output(UserStoryBreakdown)
 
-        response = structured_llm.invoke([SystemMessage(content=SYSTEM_PROMPT), HumanMessage(content=prompt)])
+        response = structured_llm.invoke([SYSTEM_MESSAGE, HumanMessage(content=prompt)])
         # Ensure correct ID
         response.user_story_id = us["id"]
         breakdowns.append(response)
@@ -337,7 +401,7 @@ def extract_aggregates_node(state: EventStormingState) -> Dict[str, Any]:
     )
 
     # Extract short BC ID for aggregate naming (e.g., BC-ORDER -> ORDER)
-    bc_id_short = current_bc.id.replace("BC-", "")
+    bc_id_short = current_bc.short_id
 
     prompt = EXTRACT_AGGREGATES_PROMPT.format(
         bc_name=current_bc.name,
@@ -349,7 +413,7 @@ def extract_aggregates_node(state: EventStormingState) -> Dict[str, Any]:
 
     structured_llm = llm.with_structured_output(AggregateList)
 
-    response = structured_llm.invoke([SystemMessage(content=SYSTEM_PROMPT), HumanMessage(content=prompt)])
+    response = structured_llm.invoke([SYSTEM_MESSAGE, HumanMessage(content=prompt)])
     aggregates = response.aggregates
 
     # Store aggregates for this BC
@@ -429,7 +493,7 @@ def extract_commands_node(state: EventStormingState) -> Dict[str, Any]:
         if not bc:
             continue
 
-        bc_id_short = bc.id.replace("BC-", "")
+        bc_id_short = bc.short_id
 
         for agg in aggregates:
             # Get user stories that this aggregate implements
@@ -450,7 +514,7 @@ def extract_commands_node(state: EventStormingState) -> Dict[str, Any]:
 
             structured_llm = llm.with_structured_output(CommandList)
 
-            response = structured_llm.invoke([SystemMessage(content=SYSTEM_PROMPT), HumanMessage(content=prompt)])
+            response = structured_llm.invoke([SYSTEM_MESSAGE, HumanMessage(content=prompt)])
             command_candidates[agg.id] = response.commands
 
     return {
@@ -476,7 +540,7 @@ def extract_readmodels_node(state: EventStormingState) -> Dict[str, Any]:
 
     for bc in state.approved_bcs:
         bc_id = bc.id
-        bc_id_short = bc.id.replace("BC-", "")
+        bc_id_short = bc.short_id
         
         # Get commands for this BC
         bc_commands = []
@@ -498,7 +562,7 @@ def extract_readmodels_node(state: EventStormingState) -> Dict[str, Any]:
         for other_bc in state.approved_bcs:
             if other_bc.id == bc_id:
                 continue
-            other_bc_short = other_bc.id.replace("BC-", "")
+            other_bc_short = other_bc.short_id
             for agg in state.approved_aggregates.get(other_bc.id, []):
                 for evt_list in [state.event_candidates.get(agg.id, [])]:
                     for evt in evt_list:
@@ -531,7 +595,7 @@ def extract_readmodels_node(state: EventStormingState) -> Dict[str, Any]:
         try:
             structured_llm = llm.with_structured_output(ReadModelList)
             response = structured_llm.invoke([
-                SystemMessage(content=SYSTEM_PROMPT),
+                SYSTEM_MESSAGE,
                 HumanMessage(content=prompt)
             ])
             readmodels = response.readmodels
@@ -580,7 +644,7 @@ def extract_events_node(state: EventStormingState) -> Dict[str, Any]:
                     bc = next((b for b in state.approved_bcs if b.id == bc_id), None)
                     if bc:
                         bc_name = bc.name
-                        bc_short = bc.id.replace("BC-", "")
+                        bc_short = bc.short_id
                     break
 
         prompt = EXTRACT_EVENTS_PROMPT.format(
@@ -592,7 +656,7 @@ def extract_events_node(state: EventStormingState) -> Dict[str, Any]:
 
         structured_llm = llm.with_structured_output(EventList)
 
-        response = structured_llm.invoke([SystemMessage(content=SYSTEM_PROMPT), HumanMessage(content=prompt)])
+        response = structured_llm.invoke([SYSTEM_MESSAGE, HumanMessage(content=prompt)])
         event_candidates[agg_id] = response.events
 
     return {
@@ -619,7 +683,7 @@ def generate_ui_node(state: EventStormingState) -> Dict[str, Any]:
     for bc in state.approved_bcs:
         bc_id = bc.id
         bc_name = bc.name
-        bc_short = bc.id.replace("BC-", "")
+        bc_short = bc.short_id
         bc_uis = []
 
         # Get user stories for this BC
@@ -670,7 +734,7 @@ def generate_ui_node(state: EventStormingState) -> Dict[str, Any]:
                         try:
                             structured_llm = llm.with_structured_output(UICandidate)
                             response = structured_llm.invoke([
-                                SystemMessage(content=SYSTEM_PROMPT),
+                                SYSTEM_MESSAGE,
                                 HumanMessage(content=prompt)
                             ])
 
@@ -714,7 +778,7 @@ def generate_ui_node(state: EventStormingState) -> Dict[str, Any]:
                     try:
                         structured_llm = llm.with_structured_output(UICandidate)
                         response = structured_llm.invoke([
-                            SystemMessage(content=SYSTEM_PROMPT),
+                            SYSTEM_MESSAGE,
                             HumanMessage(content=prompt)
                         ])
 
@@ -806,7 +870,7 @@ def identify_policies_node(state: EventStormingState) -> Dict[str, Any]:
 
     structured_llm = llm.with_structured_output(PolicyList)
 
-    response = structured_llm.invoke([SystemMessage(content=SYSTEM_PROMPT), HumanMessage(content=prompt)])
+    response = structured_llm.invoke([SYSTEM_MESSAGE, HumanMessage(content=prompt)])
     policies = response.policies
 
     return {
@@ -5,6 +5,8 @@ These prompts guide the LLM to generate Event Storming artifacts
 from User Stories in a structured, domain-driven design approach.
 """
 
+import string
+
 # =============================================================================
 # System Prompts
 # =============================================================================
@@ -198,11 +200,6 @@ Output should be a list of CommandCandidate objects."""
 
 EXTRACT_EVENTS_PROMPT = """Identify Events emitted by Commands in this Aggregate.
 
-Aggregate: {aggregate_name}
-Bounded Context: {bc_name}
-Commands (with their user stories):
-{commands}
-
 Guidelines for identifying Events:
 1. Events represent facts that happened (past tense)
 2. Name events as NounPastVerb (OrderCreated, PaymentProcessed)
@@ -222,7 +219,13 @@ Example:
 
 This creates traceability: UserStory -> Command -> Event
 
-Output should be a list of EventCandidate objects."""
+Output should be a list of EventCandidate objects.
+
+Commands (with their user stories):
+{commands}
+
+Aggregate: {aggregate_name}
+Bounded Context: {bc_name}"""
 
 # =============================================================================
 # Policy Identification
@@ -307,6 +310,21 @@ Please review and provide feedback:
 If approved, respond with "APPROVED".
 If changes needed, describe the changes."""
 
+# =============================================================================
+# Batched Extraction
+# =============================================================================
+
+BATCH_EXTRACTION_PROMPT = """The following {count} tasks are independent of each other.
+Solve each task exactly as if it had been asked on its own.
+
+Return one result per task and copy the task key verbatim into the result's `key` field.
+
+{tasks}"""
+
+BATCH_TASK_TEMPLATE = """=== Task {key} ===
+{prompt}
+"""
+
 # =============================================================================
 # Property Extraction Prompts
 # =============================================================================
@@ -608,3 +626,35 @@ Example for PlaceOrder Command:
 
 Output should be a UICandidate object with a valid 'template' field containing Vue template HTML."""
 
+
+
+# =============================================================================
+# Pre-split Templates (hot loops)
+# =============================================================================
+
+def _compile_template(template: str):
+    """Split a str.format template once so rendering is a plain join.
+
+    Returns a function taking the template's fields as keyword arguments and
+    producing the same text as template.format(**fields).
+    """
+    literals = []
+    fields = []
+    for literal, field_name, _, _ in string.Formatter().parse(template):
+        literals.append(literal)
+        fields.append(field_name)
+
+    def render(**values) -> str:
+        parts = []
+        for literal, field_name in zip(literals, fields):
+            parts.append(literal)
+            if field_name is not None:
+                parts.append(str(values[field_name]))
+        return "".join(parts)
+
+    return render
+
+
+# Rendered once per Event / ReadModel during the properties phase
+build_event_properties_prompt = _compile_template(EXTRACT_EVENT_PROPERTIES_PROMPT)
+build_readmodel_properties_prompt = _compile_template(EXTRACT_READMODEL_PROPERTIES_PROMPT)
@@ -59,6 +59,11 @@ class BoundedContextCandidate(BaseModel):
         default_factory=list, description="User Story IDs that belong to this BC"
     )
 
+    @property
+    def short_id(self) -> str:
+        """ID without the BC- prefix (BC-ORDER -> ORDER), used in child IDs."""
+        return self.id.removeprefix("BC-")
+
 
 class AggregateCandidate(BaseModel):
     """A candidate Aggregate within a Bounded Context."""
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import os
 import uuid
+from functools import lru_cache
 from typing import Any, Optional, List, Dict
 from enum import Enum
 
@@ -98,6 +99,7 @@ class UserStoryPlanningState(BaseModel):
 # =============================================================================
 
 
+@lru_cache(maxsize=1)
 def get_llm():
     """Get the configured LLM instance."""
     provider = os.getenv("LLM_PROVIDER", "openai")
@@ -24,6 +24,8 @@ from fastapi import APIRouter, HTTPException
 from neo4j import GraphDatabase
 from pydantic import BaseModel, Field
 
+from api.graph_cache import invalidate_event_triggers_cache
+
 load_dotenv()
 
 router = APIRouter(prefix="/api/change", tags=["change"])
@@ -469,6 +471,7 @@ async def apply_changes(request: ApplyChangesRequest) -> ApplyChangesResponse:
                     "success": False,
                     "error": str(e)
                 })
+    invalidate_event_triggers_cache()
     
     return ApplyChangesResponse(
         success=len(errors) == 0,
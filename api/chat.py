@@ -16,6 +16,7 @@ from __future__ import annotations
 import os
 import json
 import asyncio
+import re
 from typing import Any, List, Dict, Optional, AsyncGenerator
 
 from dotenv import load_dotenv
@@ -26,6 +27,8 @@ from pydantic import BaseModel, Field
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
 
+from api.graph_cache import invalidate_event_triggers_cache
+
 load_dotenv()
 
 router = APIRouter(prefix="/api/chat", tags=["chat"])
@@ -276,8 +279,6 @@ For "connect" actions, include:
 
 def extract_section(text: str, section_name: str) -> Optional[str]:
     """Extract content for a specific section from the text."""
-    import re
-    
     # Look for section followed by newline or next section
     patterns = [
         rf"(?:💭|⚡|👁️)?\s*{section_name}:\s*(.+?)(?=(?:💭|⚡|👁️)?\s*(?:THOUGHT|ACTION|OBSERVATION|SUMMARY)|```|\n\n|$)",
@@ -549,12 +550,15 @@ async def modify_nodes(request: ModifyRequest):
         raise HTTPException(status_code=400, detail="Prompt is required")
     
     async def generate():
-        async for event in stream_react_response(
-            request.prompt,
-            request.selectedNodes,
-            request.conversationHistory
-        ):
-            yield event
+        try:
+            async for event in stream_react_response(
+                request.prompt,
+                request.selectedNodes,
+                request.conversationHistory
+            ):
+                yield event
+        finally:
+            invalidate_event_triggers_cache()
         yield "data: [DONE]\n\n"
     
     return StreamingResponse(
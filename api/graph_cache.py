@@ -0,0 +1,54 @@
+"""
+Caches of expanded graph views shared by the API routers.
+
+Read endpoints run in the threadpool, so every access goes through a lock.
+Endpoints and background tasks that write Event Storming nodes call
+invalidate_event_triggers_cache() once their writes are done.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+# Expanded event triggers, keyed by event id: event_id -> (stored_at, payload)
+EVENT_TRIGGERS_CACHE_TTL_SECONDS = 60
+EVENT_TRIGGERS_CACHE_SIZE = 512
+
+_event_triggers_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+_event_triggers_lock = threading.Lock()
+# Bumped on every invalidation so a read that started before it is not cached
+_event_triggers_generation = 0
+
+
+def get_cached_event_triggers(event_id: str) -> tuple[Optional[dict], int]:
+    """Return (payload or None, generation); pass the generation to cache_event_triggers."""
+    with _event_triggers_lock:
+        cached = _event_triggers_cache.get(event_id)
+        if cached is None:
+            return None, _event_triggers_generation
+        if time.monotonic() - cached[0] >= EVENT_TRIGGERS_CACHE_TTL_SECONDS:
+            del _event_triggers_cache[event_id]
+            return None, _event_triggers_generation
+        _event_triggers_cache.move_to_end(event_id)
+        return cached[1], _event_triggers_generation
+
+
+def cache_event_triggers(event_id: str, payload: dict, generation: int):
+    """Store a payload unless the cache was invalidated since it was read."""
+    with _event_triggers_lock:
+        if generation != _event_triggers_generation:
+            return
+        _event_triggers_cache[event_id] = (time.monotonic(), payload)
+        _event_triggers_cache.move_to_end(event_id)
+        if len(_event_triggers_cache) > EVENT_TRIGGERS_CACHE_SIZE:
+            _event_triggers_cache.popitem(last=False)
+
+
+def invalidate_event_triggers_cache():
+    global _event_triggers_generation
+    with _event_triggers_lock:
+        _event_triggers_generation += 1
+        _event_triggers_cache.clear()
@@ -11,23 +11,63 @@ Provides:
 from __future__ import annotations
 
 import asyncio
+import codecs
+import io
 import json
 import os
+import re
 import sys
+import time
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, Literal, Optional
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile
+from fastapi import APIRouter, File, Form, HTTPException, Request, UploadFile
 from pydantic import BaseModel
 from sse_starlette.sse import EventSourceResponse
 
 # Add parent directory to path for agent imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from agent.neo4j_client import get_neo4j_client
+from agent.nodes import (
+    SYSTEM_MESSAGE,
+    AggregateBatch,
+    AggregateList,
+    BoundedContextList,
+    CommandBatch,
+    CommandList,
+    EventBatch,
+    EventList,
+    PolicyList,
+    PropertyList,
+    ReadModelList,
+)
+from agent.prompts import (
+    BATCH_EXTRACTION_PROMPT,
+    BATCH_TASK_TEMPLATE,
+    EXTRACT_AGGREGATE_PROPERTIES_PROMPT,
+    EXTRACT_AGGREGATES_PROMPT,
+    EXTRACT_COMMAND_PROPERTIES_PROMPT,
+    EXTRACT_COMMANDS_PROMPT,
+    EXTRACT_EVENTS_PROMPT,
+    EXTRACT_READMODELS_PROMPT,
+    GENERATE_UI_PROMPT,
+    IDENTIFY_BC_FROM_STORIES_PROMPT,
+    IDENTIFY_POLICIES_PROMPT,
+    build_event_properties_prompt,
+    build_readmodel_properties_prompt,
+)
+from agent.state import EventCandidate, UICandidate
+from api.graph_cache import invalidate_event_triggers_cache
+
 router = APIRouter(prefix="/api/ingest", tags=["ingestion"])
 
 # =============================================================================
@@ -55,6 +95,15 @@ def enable_langchain_cache():
         _cache_enabled = True
         print(f"✅ LangChain cache enabled: {cache_file}")
         return True
+    except ImportError:
+        # langchain-community missing: keep hits for the lifetime of the process
+        from langchain_core.caches import InMemoryCache
+        from langchain_core.globals import set_llm_cache
+        
+        set_llm_cache(InMemoryCache())
+        _cache_enabled = True
+        print("✅ LangChain cache enabled (in-memory)")
+        return True
     except Exception as e:
         print(f"⚠️ LangChain cache setup failed: {e}")
         return False
@@ -77,6 +126,12 @@ def is_cache_enabled():
     return _cache_enabled
 
 
+# Extraction runs at temperature 0, so identical prompts (re-uploads of the same
+# document) can be answered from the cache. Opt out with LLM_CACHE=false.
+if os.getenv("LLM_CACHE", "true").lower() == "true":
+    enable_langchain_cache()
+
+
 # =============================================================================
 # Models
 # =============================================================================
@@ -122,49 +177,273 @@ class CreatedObject(BaseModel):
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class IngestionSession:
     """Tracks state of an ingestion session."""
     id: str
     status: IngestionPhase = IngestionPhase.UPLOAD
     progress: int = 0
     message: str = ""
-    events: list[dict] = field(default_factory=list)
+    events: list[str] = field(default_factory=list)  # Serialized ProgressEvent payloads
     created_objects: list[CreatedObject] = field(default_factory=list)
     error: Optional[str] = None
     content: str = ""
     is_paused: bool = False  # Pause state
+    resumed: asyncio.Event = field(default_factory=asyncio.Event)  # Set by /resume
     is_workflow_running: bool = False  # Track if workflow is already running
     event_queues: list = field(default_factory=list)  # List of asyncio.Queue for subscribers
+    last_active: float = field(default_factory=time.monotonic)  # For idle eviction
+
+
+# Active sessions (LRU order, bounded by count and idle time)
+SESSION_MAX_ENTRIES = 1024
+SESSION_TTL_SECONDS = 3600
+
+
+SESSION_ID_PATTERN = re.compile(r"[0-9a-f]{8}")
+FINAL_PHASES = (IngestionPhase.COMPLETE, IngestionPhase.ERROR)
+
+
+class SessionStore:
+    """
+    JSON checkpoints of ingestion sessions (one file per session) so their
+    progress survives a server restart. A workflow cannot continue from a
+    checkpoint: sessions restored mid-run come back as interrupted errors,
+    with their events still available for replay.
+    """
+    
+    def __init__(self, directory: Path, ttl_seconds: float):
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+    
+    def _path(self, session_id: str) -> Path:
+        return self.directory / f"{session_id}.json"
+    
+    def snapshot(self, session: IngestionSession) -> dict[str, Any]:
+        """Copy the checkpointed fields; cheap enough to take on the event loop."""
+        return {
+            "id": session.id,
+            "status": session.status.value,
+            "progress": session.progress,
+            "message": session.message,
+            "error": session.error,
+            "content": session.content,
+            "events": list(session.events),
+            "saved_at": time.time()
+        }
+    
+    def write(self, data: dict[str, Any]):
+        """Serialize and write a snapshot (blocking; run it in a worker thread)."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = self._path(data["id"]).with_suffix(".tmp")
+            tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            tmp.replace(self._path(data["id"]))
+        except OSError as e:
+            print(f"⚠️ Session checkpoint failed ({data['id']}): {e}")
+    
+    def delete(self, session_id: str):
+        try:
+            self._path(session_id).unlink(missing_ok=True)
+        except OSError as e:
+            print(f"⚠️ Session checkpoint removal failed ({session_id}): {e}")
+    
+    def prune(self):
+        """Delete checkpoints older than the TTL, e.g. left behind by a crash."""
+        cutoff = time.time() - self.ttl_seconds
+        try:
+            paths = list(self.directory.glob("*.json"))
+        except OSError:
+            return
+        for path in paths:
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink(missing_ok=True)
+            except OSError:
+                pass
+    
+    def load(self, session_id: str) -> Optional[IngestionSession]:
+        if not SESSION_ID_PATTERN.fullmatch(session_id):
+            return None
+        path = self._path(session_id)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        
+        if time.time() - data.get("saved_at", 0) > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            return None
+        
+        session = IngestionSession(
+            id=data["id"],
+            status=IngestionPhase(data["status"]),
+            progress=data["progress"],
+            message=data["message"],
+            error=data.get("error"),
+            content=data.get("content", ""),
+            events=data.get("events", [])
+        )
+        if session.status not in FINAL_PHASES:
+            session.status = IngestionPhase.ERROR
+            session.error = session.message = "서버 재시작으로 처리가 중단되었습니다. 문서를 다시 업로드해주세요."
+        return session
+
+
+class SessionRegistry:
+    """
+    Owns the active ingestion sessions and their precomputed /sessions rows.
+    
+    Endpoints go through these methods instead of mutating the maps directly.
+    None of them awaits, so each call runs to completion on the event loop
+    thread and the two maps are always updated together; no lock is needed.
+    Checkpoint file I/O runs in worker threads, chained per session so the
+    writes and the final delete land in order.
+    """
+    
+    def __init__(self, max_entries: int, ttl_seconds: float, store: Optional[SessionStore] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.store = store
+        self._sessions: OrderedDict[str, IngestionSession] = OrderedDict()
+        self._summaries: dict[str, dict[str, Any]] = {}
+        self._store_tasks: dict[str, asyncio.Task] = {}
+        if store is not None:
+            store.prune()
+    
+    def _is_expired(self, session: IngestionSession, now: float) -> bool:
+        """Idle sessions expire; sessions with a running workflow never do."""
+        return not session.is_workflow_running and now - session.last_active > self.ttl_seconds
+    
+    def _evict(self):
+        """Drop expired sessions, then the least recently used idle ones over the cap."""
+        now = time.monotonic()
+        for sid in [sid for sid, s in self._sessions.items() if self._is_expired(s, now)]:
+            self.remove(sid)
+        
+        overflow = len(self._sessions) - self.max_entries
+        if overflow > 0:
+            idle = [sid for sid, s in self._sessions.items() if not s.is_workflow_running]
+            for sid in idle[:overflow]:
+                self.remove(sid)
+    
+    def get(self, session_id: str) -> Optional[IngestionSession]:
+        session = self._sessions.get(session_id)
+        if session is None:
+            return self._restore(session_id)
+        
+        now = time.monotonic()
+        if self._is_expired(session, now):
+            self.remove(session_id)
+            return None
+        
+        session.last_active = now
+        self._sessions.move_to_end(session_id)
+        return session
+    
+    def _restore(self, session_id: str) -> Optional[IngestionSession]:
+        """Bring a checkpointed session back into memory (e.g. after a restart)."""
+        if self.store is None:
+            return None
+        session = self.store.load(session_id)
+        if session is None:
+            return None
+        self._evict()
+        self._sessions[session_id] = session
+        self.refresh(session)
+        return session
+    
+    def _run_store(self, session_id: str, func, *args):
+        """Run a blocking store call off the event loop, after earlier ones for the same session."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            func(*args)
+            return
+        
+        async def run(previous: Optional[asyncio.Task]):
+            if previous is not None:
+                await asyncio.wait([previous])
+            await asyncio.to_thread(func, *args)
+        
+        task = asyncio.create_task(run(self._store_tasks.get(session_id)))
+        self._store_tasks[session_id] = task
+        
+        def forget(done: asyncio.Task):
+            if self._store_tasks.get(session_id) is done:
+                del self._store_tasks[session_id]
+        
+        task.add_done_callback(forget)
+    
+    def checkpoint(self, session: IngestionSession):
+        if self.store is not None:
+            self._run_store(session.id, self.store.write, self.store.snapshot(session))
+    
+    def create(self) -> IngestionSession:
+        self._evict()
+        session = IngestionSession(id=str(uuid.uuid4())[:8])
+        self._sessions[session.id] = session
+        self.refresh(session)
+        return session
+    
+    def remove(self, session_id: str):
+        self._sessions.pop(session_id, None)
+        self._summaries.pop(session_id, None)
+        if self.store is not None:
+            self._run_store(session_id, self.store.delete, session_id)
+    
+    def refresh(self, session: IngestionSession):
+        """Recompute the /sessions row after status, progress or message changed."""
+        if session.id in self._sessions:
+            self._summaries[session.id] = {
+                "id": session.id,
+                "status": session.status.value,
+                "progress": session.progress,
+                "message": session.message
+            }
+    
+    def summaries(self) -> list[dict[str, Any]]:
+        return list(self._summaries.values())
 
 
-# Active sessions
-_sessions: dict[str, IngestionSession] = {}
+# Checkpoint sessions under .cache/sessions unless INGESTION_CHECKPOINTS=false
+_session_store = (
+    SessionStore(Path(__file__).parent.parent / ".cache" / "sessions", SESSION_TTL_SECONDS)
+    if os.getenv("INGESTION_CHECKPOINTS", "true").lower() != "false"
+    else None
+)
+_registry = SessionRegistry(SESSION_MAX_ENTRIES, SESSION_TTL_SECONDS, _session_store)
 
 
 def get_session(session_id: str) -> Optional[IngestionSession]:
-    return _sessions.get(session_id)
+    return _registry.get(session_id)
 
 
 def create_session() -> IngestionSession:
-    session_id = str(uuid.uuid4())[:8]
-    session = IngestionSession(id=session_id)
-    _sessions[session_id] = session
-    return session
+    return _registry.create()
 
 
 def add_event(session: IngestionSession, event: ProgressEvent):
-    """Add event to session, update status, and broadcast to subscribers."""
-    event_dict = event.model_dump()
-    session.events.append(event_dict)
+    """Add event to session, update status, and broadcast to subscribers.
+    
+    The event is serialized once here; every subscriber and later replays
+    reuse the same JSON payload.
+    """
+    payload = event.model_dump_json()
+    session.events.append(payload)
+    phase_changed = event.phase != session.status
     session.status = event.phase
     session.progress = event.progress
     session.message = event.message
+    session.last_active = time.monotonic()
+    _registry.refresh(session)
+    if phase_changed:
+        _registry.checkpoint(session)
     
     # Broadcast to all subscriber queues
     for queue in session.event_queues:
         try:
-            queue.put_nowait(event_dict)
+            queue.put_nowait((len(session.events) - 1, event.phase, payload))
         except Exception:
             pass  # Queue might be full or closed
 
@@ -177,9 +456,7 @@ async def wait_if_paused(session: IngestionSession) -> bool:
     if not session.is_paused:
         return False
     
-    while session.is_paused:
-        await asyncio.sleep(0.5)  # Check every 500ms
-    
+    await session.resumed.wait()
     return True
 
 
@@ -188,20 +465,26 @@ async def wait_if_paused(session: IngestionSession) -> bool:
 # =============================================================================
 
 
-def extract_text_from_pdf(file_content: bytes) -> str:
-    """Extract text from PDF file using PyMuPDF."""
+def _extract_pdf_text_sync(file_content: bytes) -> str:
+    """Extract text page by page into a single buffer, skipping empty pages."""
+    import fitz  # PyMuPDF
+    
+    buf = io.StringIO()
+    with fitz.open(stream=file_content, filetype="pdf") as doc:
+        for page in doc:
+            page_text = page.get_text(flags=fitz.TEXT_PRESERVE_WHITESPACE)
+            if not page_text.strip():
+                continue
+            if buf.tell():
+                buf.write("\n")
+            buf.write(page_text)
+    return buf.getvalue()
+
+
+async def extract_text_from_pdf(file_content: bytes) -> str:
+    """Extract text from PDF file using PyMuPDF (off the event loop)."""
     try:
-        import fitz  # PyMuPDF
-        
-        doc = fitz.open(stream=file_content, filetype="pdf")
-        text_parts = []
-        
-        for page_num in range(len(doc)):
-            page = doc.load_page(page_num)
-            text_parts.append(page.get_text())
-        
-        doc.close()
-        return "\n".join(text_parts)
+        return await asyncio.to_thread(_extract_pdf_text_sync, file_content)
     except ImportError:
         raise HTTPException(
             status_code=500,
@@ -211,15 +494,50 @@ def extract_text_from_pdf(file_content: bytes) -> str:
         raise HTTPException(status_code=400, detail=f"Failed to parse PDF: {str(e)}")
 
 
+UPLOAD_CHUNK_BYTES = 1 << 20
+
+
+async def _decode_text_upload(file: UploadFile, encoding: str) -> str:
+    """Decode an uploaded file chunk by chunk so the raw bytes are never held whole."""
+    await file.seek(0)
+    decoder = codecs.getincrementaldecoder(encoding)()
+    buf = io.StringIO()
+    while chunk := await file.read(UPLOAD_CHUNK_BYTES):
+        buf.write(decoder.decode(chunk))
+    buf.write(decoder.decode(b"", final=True))
+    return buf.getvalue()
+
+
+async def read_text_upload(file: UploadFile) -> str:
+    """Read a text upload as UTF-8, falling back to latin-1."""
+    try:
+        return await _decode_text_upload(file, "utf-8")
+    except UnicodeDecodeError:
+        return await _decode_text_upload(file, "latin-1")
+
+
 # =============================================================================
 # LLM Integration for User Story Extraction
 # =============================================================================
 
+# Cap on in-flight LLM requests when a phase fans out per BC / aggregate
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "10"))
+
+# Send all per-BC / per-aggregate tasks of a phase as one keyed request
+LLM_BATCH_EXTRACTION = os.getenv("LLM_BATCH_EXTRACTION", "false").lower() == "true"
+
+
+# Model for mechanical extractions (commands, events, summaries); defaults to LLM_MODEL
+LLM_FAST_MODEL = os.getenv("LLM_FAST_MODEL")
+
 
-def get_llm():
-    """Get configured LLM instance."""
+@lru_cache(maxsize=None)
+def get_llm(tier: Literal["fast", "smart"] = "smart"):
+    """Get configured LLM instance for a tier (built once per process)."""
     provider = os.getenv("LLM_PROVIDER", "openai")
     model = os.getenv("LLM_MODEL", "gpt-4o")
+    if tier == "fast" and LLM_FAST_MODEL:
+        model = LLM_FAST_MODEL
     
     if provider == "anthropic":
         from langchain_anthropic import ChatAnthropic
@@ -229,6 +547,12 @@ def get_llm():
         return ChatOpenAI(model=model, temperature=0)
 
 
+@lru_cache(maxsize=None)
+def get_structured_llm(schema: type[BaseModel], tier: Literal["fast", "smart"] = "smart"):
+    """LLM bound to a structured-output schema, built once per schema and tier."""
+    return get_llm(tier).with_structured_output(schema)
+
+
 EXTRACT_USER_STORIES_PROMPT = """분석할 요구사항 문서:
 
 {requirements}
@@ -257,6 +581,69 @@ User Story ID는 US-001, US-002 형식으로 순차적으로 부여하세요.
 """
 
 
+SUMMARIZE_REQUIREMENTS_PROMPT = """다음은 긴 요구사항 문서의 일부입니다:
+
+{chunk}
+
+---
+
+이 부분에 포함된 모든 기능 요구사항, 역할(사용자 유형), 비즈니스 규칙, UI 관련 설명을
+빠짐없이 간결한 목록으로 요약하세요. 요구사항을 새로 만들거나 생략하지 마세요.
+"""
+
+# Documents over this many tokens are summarized chunk-by-chunk before user story
+# extraction instead of being truncated
+USER_STORY_INPUT_TOKENS = 6000
+SUMMARY_CHUNK_TOKENS = 4000
+
+
+@lru_cache(maxsize=1)
+def _get_token_encoder():
+    """tiktoken encoder for the configured model, or None if tiktoken is unavailable."""
+    try:
+        import tiktoken
+        try:
+            return tiktoken.encoding_for_model(os.getenv("LLM_MODEL", "gpt-4o"))
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+def _chunks_if_over_budget(text: str, budget_tokens: int, chunk_tokens: int) -> Optional[list[str]]:
+    """
+    Return None if text fits budget_tokens, else text split into chunks of at
+    most chunk_tokens tokens. The text is tokenized once for both steps.
+    
+    Uses tiktoken when available; otherwise assumes ~2 characters per token,
+    which errs on the safe side for Korean text.
+    """
+    enc = _get_token_encoder()
+    if enc is None:
+        if len(text) <= budget_tokens * 2:
+            return None
+        size = chunk_tokens * 2
+        return [text[i:i + size] for i in range(0, len(text), size)]
+    
+    tokens = enc.encode(text)
+    if len(tokens) <= budget_tokens:
+        return None
+    return [enc.decode(tokens[i:i + chunk_tokens]) for i in range(0, len(tokens), chunk_tokens)]
+
+
+async def fit_requirements_to_budget(text: str) -> str:
+    """Return text unchanged if it fits the extraction budget, else a map-reduce summary."""
+    chunks = _chunks_if_over_budget(text, USER_STORY_INPUT_TOKENS, SUMMARY_CHUNK_TOKENS)
+    if chunks is None:
+        return text
+    
+    summaries = await get_llm("fast").abatch(
+        [[HumanMessage(content=SUMMARIZE_REQUIREMENTS_PROMPT.format(chunk=chunk))] for chunk in chunks],
+        config={"max_concurrency": LLM_MAX_CONCURRENCY}
+    )
+    return "\n\n".join(summary.content for summary in summaries)
+
+
 class GeneratedUserStory(BaseModel):
     """Generated User Story from requirements."""
     id: str
@@ -272,25 +659,39 @@ class UserStoryList(BaseModel):
     user_stories: list[GeneratedUserStory]
 
 
-def extract_user_stories_from_text(text: str) -> list[GeneratedUserStory]:
-    """Extract user stories from text using LLM."""
-    from langchain_core.messages import HumanMessage, SystemMessage
+async def stream_user_stories_from_text(text: str) -> AsyncGenerator[GeneratedUserStory, None]:
+    """
+    Extract user stories from text using LLM, yielding each one as soon as it is complete.
+    
+    Providers that stream tool-call arguments produce growing partial UserStoryList
+    objects; every item except the last is final, so those are yielded right away.
+    Providers that don't stream simply deliver the whole list in one chunk.
+    """
     
-    llm = get_llm()
-    structured_llm = llm.with_structured_output(UserStoryList)
+    structured_llm = get_structured_llm(UserStoryList)
     
     system_prompt = """당신은 도메인 주도 설계(DDD) 전문가입니다. 
 요구사항을 User Story로 변환하는 작업을 수행합니다.
 User Story는 명확하고 테스트 가능해야 합니다."""
     
-    prompt = EXTRACT_USER_STORIES_PROMPT.format(requirements=text[:8000])  # Limit context
+    requirements = await fit_requirements_to_budget(text)
+    prompt = EXTRACT_USER_STORIES_PROMPT.format(requirements=requirements)
     
-    response = structured_llm.invoke([
+    emitted = 0
+    latest: list[GeneratedUserStory] = []
+    async for partial in structured_llm.astream([
         SystemMessage(content=system_prompt),
         HumanMessage(content=prompt)
-    ])
+    ]):
+        if partial is None:
+            continue  # Partial JSON that does not validate yet
+        latest = partial.user_stories
+        while emitted < len(latest) - 1:
+            yield latest[emitted]
+            emitted += 1
     
-    return response.user_stories
+    for us in latest[emitted:]:
+        yield us
 
 
 # =============================================================================
@@ -298,6 +699,145 @@ User Story는 명확하고 테스트 가능해야 합니다."""
 # =============================================================================
 
 
+def _property_batch_event(
+    parent_id: str, parent_type: str, parent_name: str, properties: list, progress: int
+) -> ProgressEvent:
+    """One SSE frame carrying every Property generated for a single parent."""
+    return ProgressEvent(
+        phase=IngestionPhase.GENERATING_PROPERTIES,
+        message=f"Property 생성: {parent_name} ({len(properties)}개)",
+        progress=progress,
+        data={
+            "type": "PropertyBatch",
+            "parent_id": parent_id,
+            "parent_type": parent_type,
+            "objects": [
+                {
+                    "id": prop.id,
+                    "name": prop.name,
+                    "type": "Property",
+                    "dataType": prop.type,
+                    "parentId": parent_id,
+                    "parentType": parent_type
+                }
+                for prop in properties
+            ]
+        }
+    )
+
+
+def _settle_property_writes(
+    pending: list[tuple[asyncio.Task, ProgressEvent]], stored_counts: list[int]
+) -> list[ProgressEvent]:
+    """
+    Pop finished property batch writes (in submission order) and return their
+    SSE events: the PropertyBatch event on success, a PropertyBatchError event
+    on failure. Stored property counts are appended to `stored_counts`.
+    """
+    events = []
+    while pending and pending[0][0].done():
+        write, batch_event = pending.pop(0)
+        try:
+            stored_counts.append(write.result())
+            events.append(batch_event)
+        except Exception as e:
+            batch = batch_event.data
+            print(f"[Properties] Write failed for {batch['parent_type']} {batch['parent_id']}: {e}")
+            events.append(ProgressEvent(
+                phase=IngestionPhase.GENERATING_PROPERTIES,
+                message=f"⚠️ Property 저장 실패: {batch['parent_type']} {batch['parent_id']} - {e}",
+                progress=batch_event.progress,
+                data={
+                    "type": "PropertyBatchError",
+                    "parent_id": batch["parent_id"],
+                    "parent_type": batch["parent_type"],
+                    "error": str(e)
+                }
+            ))
+    return events
+
+
+# CRUD-style command verbs and the past-tense suffix of the event they emit
+CRUD_EVENT_SUFFIXES = {
+    "Create": "Created",
+    "Update": "Updated",
+    "Delete": "Deleted",
+    "Cancel": "Cancelled",
+    "Approve": "Approved",
+    "Reject": "Rejected",
+}
+CRUD_COMMAND_PATTERN = re.compile(r"^(Create|Update|Delete|Cancel|Approve|Reject)([A-Z]\w*)$")
+
+
+def _derive_crud_event(cmd, bc_short: str) -> Optional[EventCandidate]:
+    """
+    Derive the event of a CRUD-style command without the LLM
+    (CreateOrder -> OrderCreated). Returns None for any other command.
+    """
+    match = CRUD_COMMAND_PATTERN.match(cmd.name)
+    if not match:
+        return None
+    verb, subject = match.groups()
+    suffix = CRUD_EVENT_SUFFIXES[verb]
+    subject_id = re.sub(r"(?<!^)(?=[A-Z])", "-", subject).upper()
+    return EventCandidate(
+        id=f"EVT-{bc_short}-{subject_id}-{suffix.upper()}",
+        name=f"{subject}{suffix}",
+        description=f"{subject} {suffix.lower()} by {cmd.name}",
+        user_story_ids=list(cmd.user_story_ids),
+    )
+
+
+async def _extract_for_each(
+    list_schema,
+    batch_schema,
+    field_name: str,
+    keys: list[str],
+    prompts: list[str],
+    tolerate_errors: bool = False,
+    tier: Literal["fast", "smart"] = "smart"
+) -> list[list]:
+    """
+    Run one extraction task per key and return the candidate lists in key order.
+    
+    With LLM_BATCH_EXTRACTION every task goes out in a single keyed request;
+    otherwise each task is its own request, issued concurrently. With
+    tolerate_errors a failed request yields an empty list instead of raising.
+    tier selects the model (see get_llm).
+    """
+    
+    if not keys:
+        return []
+    
+    if LLM_BATCH_EXTRACTION and len(keys) > 1:
+        tasks = "\n".join(
+            BATCH_TASK_TEMPLATE.format(key=key, prompt=prompt)
+            for key, prompt in zip(keys, prompts)
+        )
+        prompt = BATCH_EXTRACTION_PROMPT.format(count=len(keys), tasks=tasks)
+        try:
+            response = await get_structured_llm(batch_schema, tier).ainvoke([
+                SYSTEM_MESSAGE,
+                HumanMessage(content=prompt)
+            ])
+        except Exception:
+            if not tolerate_errors:
+                raise
+            return [[] for _ in keys]
+        by_key = {item.key: getattr(item, field_name) for item in response.results}
+        return [by_key.get(key, []) for key in keys]
+    
+    responses = await get_structured_llm(list_schema, tier).abatch(
+        [[SYSTEM_MESSAGE, HumanMessage(content=prompt)] for prompt in prompts],
+        config={"max_concurrency": LLM_MAX_CONCURRENCY},
+        return_exceptions=tolerate_errors
+    )
+    return [
+        [] if isinstance(response, Exception) else getattr(response, field_name)
+        for response in responses
+    ]
+
+
 async def run_ingestion_workflow(
     session: IngestionSession,
     content: str
@@ -305,9 +845,10 @@ async def run_ingestion_workflow(
     """
     Run the full ingestion workflow with streaming progress updates.
     
-    Yields ProgressEvent objects at each significant step.
+    Yields ProgressEvent objects at each significant step. Emission loops only
+    yield to the event loop (sleep(0)) so SSE subscribers keep up; they do not
+    add artificial pacing delays.
     """
-    from agent.neo4j_client import get_neo4j_client
     
     client = get_neo4j_client()
     
@@ -318,7 +859,6 @@ async def run_ingestion_workflow(
             message="문서 파싱 중...",
             progress=5
         )
-        await asyncio.sleep(0.3)  # Small delay for UI feedback
         
         # Phase 2: Extract User Stories
         yield ProgressEvent(
@@ -327,44 +867,41 @@ async def run_ingestion_workflow(
             progress=10
         )
         
-        user_stories = extract_user_stories_from_text(content)
+        user_stories = []
+        us_rows = []  # Neo4j batch
+        us_items = []  # Summary event payload
         
-        # Save user stories to Neo4j and emit events for each
-        for i, us in enumerate(user_stories):
-            try:
-                client.create_user_story(
-                    id=us.id,
-                    role=us.role,
-                    action=us.action,
-                    benefit=us.benefit,
-                    priority=us.priority,
-                    status="draft",
-                    ui_description=us.ui_description if hasattr(us, 'ui_description') else None
-                )
-                
-                # Emit event for each User Story created
-                yield ProgressEvent(
-                    phase=IngestionPhase.EXTRACTING_USER_STORIES,
-                    message=f"User Story 생성: {us.id}",
-                    progress=10 + (10 * (i + 1) // len(user_stories)),
-                    data={
+        # Emit events as the LLM produces stories; persist them in one batch afterwards
+        async for us in stream_user_stories_from_text(content):
+            user_stories.append(us)
+            us_rows.append(us.model_dump())
+            us_items.append({"id": us.id, "role": us.role, "action": us.action[:50]})
+            
+            yield ProgressEvent(
+                phase=IngestionPhase.EXTRACTING_USER_STORIES,
+                message=f"User Story 생성: {us.id}",
+                progress=min(10 + len(user_stories) // 2, 19),
+                data={
+                    "type": "UserStory",
+                    "object": {
+                        "id": us.id,
+                        "name": f"{us.role}: {us.action[:30]}...",
                         "type": "UserStory",
-                        "object": {
-                            "id": us.id,
-                            "name": f"{us.role}: {us.action[:30]}...",
-                            "type": "UserStory",
-                            "role": us.role,
-                            "action": us.action,
-                            "benefit": us.benefit,
-                            "priority": us.priority,
-                            "uiDescription": us.ui_description if hasattr(us, 'ui_description') else ""
-                        }
+                        "role": us.role,
+                        "action": us.action,
+                        "benefit": us.benefit,
+                        "priority": us.priority,
+                        "uiDescription": us.ui_description
                     }
-                )
-                await asyncio.sleep(0.15)  # Small delay for visual effect
-                
-            except Exception:
-                pass  # Skip if already exists
+                }
+            )
+        
+        try:
+            created = client.create_user_stories_bulk(us_rows)
+            if created < len(us_rows):
+                print(f"[UserStory] Skipped {len(us_rows) - created} stories whose id already exists")
+        except Exception as e:
+            print(f"[UserStory] Bulk create failed: {e}")
         
         yield ProgressEvent(
             phase=IngestionPhase.EXTRACTING_USER_STORIES,
@@ -372,7 +909,7 @@ async def run_ingestion_workflow(
             progress=20,
             data={
                 "count": len(user_stories),
-                "items": [{"id": us.id, "role": us.role, "action": us.action[:50]} for us in user_stories]
+                "items": us_items
             }
         )
         
@@ -392,22 +929,16 @@ async def run_ingestion_workflow(
             progress=25
         )
         
-        from agent.nodes import BoundedContextList
-        from langchain_core.messages import HumanMessage, SystemMessage
-        from agent.prompts import IDENTIFY_BC_FROM_STORIES_PROMPT, SYSTEM_PROMPT
-        
-        llm = get_llm()
-        
         stories_text = "\n".join([
             f"[{us.id}] As a {us.role}, I want to {us.action}, so that {us.benefit}"
             for us in user_stories
         ])
         
-        structured_llm = llm.with_structured_output(BoundedContextList)
+        structured_llm = get_structured_llm(BoundedContextList)
         prompt = IDENTIFY_BC_FROM_STORIES_PROMPT.format(user_stories=stories_text)
         
-        bc_response = structured_llm.invoke([
-            SystemMessage(content=SYSTEM_PROMPT),
+        bc_response = await structured_llm.ainvoke([
+            SYSTEM_MESSAGE,
             HumanMessage(content=prompt)
         ])
         
@@ -437,31 +968,31 @@ async def run_ingestion_workflow(
                     }
                 }
             )
-            await asyncio.sleep(0.2)
+            await asyncio.sleep(0)
+            
+            # Link user stories to BC in one batch, then emit move events
+            try:
+                client.link_user_stories_to_bc(bc.user_story_ids, bc.id)
+            except Exception:
+                continue
             
-            # Link user stories to BC and emit move events
             for us_id in bc.user_story_ids:
-                try:
-                    client.link_user_story_to_bc(us_id, bc.id)
-                    
-                    # Emit event for User Story moving to BC
-                    yield ProgressEvent(
-                        phase=IngestionPhase.IDENTIFYING_BC,
-                        message=f"User Story {us_id} → {bc.name}",
-                        progress=30 + (10 * bc_idx // max(len(bc_candidates), 1)),
-                        data={
-                            "type": "UserStoryAssigned",
-                            "object": {
-                                "id": us_id,
-                                "type": "UserStory",
-                                "targetBcId": bc.id,
-                                "targetBcName": bc.name
-                            }
+                # Emit event for User Story moving to BC
+                yield ProgressEvent(
+                    phase=IngestionPhase.IDENTIFYING_BC,
+                    message=f"User Story {us_id} → {bc.name}",
+                    progress=30 + (10 * bc_idx // max(len(bc_candidates), 1)),
+                    data={
+                        "type": "UserStoryAssigned",
+                        "object": {
+                            "id": us_id,
+                            "type": "UserStory",
+                            "targetBcId": bc.id,
+                            "targetBcName": bc.name
                         }
-                    )
-                    await asyncio.sleep(0.1)
-                except Exception:
-                    pass
+                    }
+                )
+                await asyncio.sleep(0)
         
         # Check for pause after BC identification
         if session.is_paused:
@@ -479,14 +1010,20 @@ async def run_ingestion_workflow(
             progress=45
         )
         
-        from agent.nodes import AggregateList
-        from agent.prompts import EXTRACT_AGGREGATES_PROMPT
+        # Resolve each BC's user stories once for every later phase
+        stories_by_id = {us.id: us for us in user_stories}
+        stories_by_bc = {
+            bc.id: [stories_by_id[sid] for sid in bc.user_story_ids if sid in stories_by_id]
+            for bc in bc_candidates
+        }
         
         all_aggregates = {}
         progress_per_bc = 10 // max(len(bc_candidates), 1)
         
-        for bc_idx, bc in enumerate(bc_candidates):
-            bc_id_short = bc.id.replace("BC-", "")
+        # One task per BC
+        agg_prompts = []
+        for bc in bc_candidates:
+            bc_id_short = bc.short_id
             
             # Create dummy breakdowns context
             breakdowns_text = f"User Stories: {', '.join(bc.user_story_ids)}"
@@ -498,26 +1035,18 @@ async def run_ingestion_workflow(
                 bc_description=bc.description,
                 breakdowns=breakdowns_text
             )
-            
-            structured_llm = llm.with_structured_output(AggregateList)
-            
-            agg_response = structured_llm.invoke([
-                SystemMessage(content=SYSTEM_PROMPT),
-                HumanMessage(content=prompt)
-            ])
-            
-            aggregates = agg_response.aggregates
+            agg_prompts.append(prompt)
+        
+        agg_results = await _extract_for_each(
+            AggregateList, AggregateBatch, "aggregates",
+            [bc.id for bc in bc_candidates], agg_prompts
+        )
+        
+        for bc_idx, (bc, aggregates) in enumerate(zip(bc_candidates, agg_results)):
             all_aggregates[bc.id] = aggregates
+            client.create_aggregates_bulk(bc.id, [agg.model_dump() for agg in aggregates])
             
             for agg in aggregates:
-                client.create_aggregate(
-                    id=agg.id,
-                    name=agg.name,
-                    bc_id=bc.id,
-                    root_entity=agg.root_entity,
-                    invariants=agg.invariants
-                )
-                
                 yield ProgressEvent(
                     phase=IngestionPhase.EXTRACTING_AGGREGATES,
                     message=f"Aggregate 생성: {agg.name}",
@@ -532,7 +1061,7 @@ async def run_ingestion_workflow(
                         }
                     }
                 )
-                await asyncio.sleep(0.15)
+                await asyncio.sleep(0)
         
         # Check for pause after Aggregate extraction
         if session.is_paused:
@@ -550,19 +1079,19 @@ async def run_ingestion_workflow(
             progress=60
         )
         
-        from agent.nodes import CommandList
-        from agent.prompts import EXTRACT_COMMANDS_PROMPT
-        
         all_commands = {}
         
+        # One task per aggregate
+        cmd_targets = []
+        cmd_prompts = []
         for bc in bc_candidates:
-            bc_id_short = bc.id.replace("BC-", "")
+            bc_id_short = bc.short_id
             bc_aggregates = all_aggregates.get(bc.id, [])
             
             for agg in bc_aggregates:
                 stories_context = "\n".join([
                     f"[{us.id}] As a {us.role}, I want to {us.action}"
-                    for us in user_stories if us.id in bc.user_story_ids
+                    for us in stories_by_bc[bc.id]
                 ])
                 
                 prompt = EXTRACT_COMMANDS_PROMPT.format(
@@ -572,43 +1101,36 @@ async def run_ingestion_workflow(
                     bc_short=bc_id_short,
                     user_story_context=stories_context[:2000]
                 )
-                
-                structured_llm = llm.with_structured_output(CommandList)
-                
-                try:
-                    cmd_response = structured_llm.invoke([
-                        SystemMessage(content=SYSTEM_PROMPT),
-                        HumanMessage(content=prompt)
-                    ])
-                    commands = cmd_response.commands
-                except Exception:
-                    commands = []
-                
-                all_commands[agg.id] = commands
-                
-                for cmd in commands:
-                    client.create_command(
-                        id=cmd.id,
-                        name=cmd.name,
-                        aggregate_id=agg.id,
-                        actor=cmd.actor
-                    )
-                    
-                    yield ProgressEvent(
-                        phase=IngestionPhase.EXTRACTING_COMMANDS,
-                        message=f"Command 생성: {cmd.name}",
-                        progress=65,
-                        data={
+                cmd_targets.append(agg)
+                cmd_prompts.append(prompt)
+        
+        cmd_results = await _extract_for_each(
+            CommandList, CommandBatch, "commands",
+            [agg.id for agg in cmd_targets], cmd_prompts,
+            tolerate_errors=True,
+            tier="fast"
+        )
+        
+        for agg, commands in zip(cmd_targets, cmd_results):
+            all_commands[agg.id] = commands
+            client.create_commands_bulk(agg.id, [cmd.model_dump() for cmd in commands])
+            
+            for cmd in commands:
+                yield ProgressEvent(
+                    phase=IngestionPhase.EXTRACTING_COMMANDS,
+                    message=f"Command 생성: {cmd.name}",
+                    progress=65,
+                    data={
+                        "type": "Command",
+                        "object": {
+                            "id": cmd.id,
+                            "name": cmd.name,
                             "type": "Command",
-                            "object": {
-                                "id": cmd.id,
-                                "name": cmd.name,
-                                "type": "Command",
-                                "parentId": agg.id
-                            }
+                            "parentId": agg.id
                         }
-                    )
-                    await asyncio.sleep(0.1)
+                    }
+                )
+                await asyncio.sleep(0)
         
         # Check for pause after Command extraction
         if session.is_paused:
@@ -626,15 +1148,11 @@ async def run_ingestion_workflow(
             progress=67
         )
         
-        from agent.nodes import ReadModelList
-        from agent.prompts import EXTRACT_READMODELS_PROMPT
-        from agent.state import ReadModelCandidate
-        
         all_readmodels = {}
         all_events = {}  # Initialize for ReadModel extraction (will be populated in Event phase)
         
         for bc in bc_candidates:
-            bc_id_short = bc.id.replace("BC-", "")
+            bc_id_short = bc.short_id
             bc_aggregates = all_aggregates.get(bc.id, [])
             
             # Get commands for this BC
@@ -648,7 +1166,7 @@ async def run_ingestion_workflow(
             
             # Format commands for the prompt
             commands_text = "\n".join([
-                f"- {cmd.name}: {cmd.description if hasattr(cmd, 'description') else 'No description'}"
+                f"- {cmd.name}: {cmd.description}"
                 for cmd in bc_commands
             ])
             
@@ -666,7 +1184,7 @@ async def run_ingestion_workflow(
             other_bc_events_text = "\n".join(other_bc_events) if other_bc_events else "(No events from other BCs yet)"
             
             # Get user stories for this BC
-            bc_stories = [us for us in user_stories if us.id in bc.user_story_ids]
+            bc_stories = stories_by_bc[bc.id]
             stories_text = "\n".join([
                 f"- [{us.id}] {us.role}: {us.action}"
                 for us in bc_stories
@@ -682,9 +1200,9 @@ async def run_ingestion_workflow(
             )
             
             try:
-                structured_llm = llm.with_structured_output(ReadModelList)
-                rm_response = structured_llm.invoke([
-                    SystemMessage(content=SYSTEM_PROMPT),
+                structured_llm = get_structured_llm(ReadModelList)
+                rm_response = await structured_llm.ainvoke([
+                    SYSTEM_MESSAGE,
                     HumanMessage(content=prompt)
                 ])
                 readmodels = rm_response.readmodels
@@ -699,8 +1217,7 @@ async def run_ingestion_workflow(
                     # Convert CQRS config to JSON string if present
                     cqrs_config_str = None
                     if rm.cqrs_config:
-                        import json as json_lib
-                        cqrs_config_str = json_lib.dumps(rm.cqrs_config.model_dump())
+                        cqrs_config_str = json.dumps(rm.cqrs_config.model_dump())
                     
                     client.create_readmodel(
                         id=rm.id,
@@ -713,7 +1230,7 @@ async def run_ingestion_workflow(
                     
                     # Link ReadModel to User Stories via IMPLEMENTS relationship
                     # Use user_story_ids from ReadModel or fall back to BC's user stories
-                    rm_user_story_ids = rm.user_story_ids if hasattr(rm, 'user_story_ids') and rm.user_story_ids else bc.user_story_ids
+                    rm_user_story_ids = rm.user_story_ids or bc.user_story_ids
                     for us_id in rm_user_story_ids:
                         try:
                             client.link_user_story_to_readmodel(us_id, rm.id)
@@ -735,7 +1252,7 @@ async def run_ingestion_workflow(
                             }
                         }
                     )
-                    await asyncio.sleep(0.15)
+                    await asyncio.sleep(0)
         
         # Check for pause after ReadModel extraction
         if session.is_paused:
@@ -753,25 +1270,21 @@ async def run_ingestion_workflow(
             progress=73
         )
         
-        from agent.prompts import GENERATE_UI_PROMPT
-        from agent.state import UICandidate, format_user_story
-        
         all_uis = {}
         ui_keywords = ["화면", "UI", "페이지", "폼", "입력", "표시", "보여", "조회", "view", "screen", "form", "display"]
         
         for bc in bc_candidates:
             bc_id = bc.id
-            bc_id_short = bc.id.replace("BC-", "")
+            bc_id_short = bc.short_id
             bc_name = bc.name
             bc_uis = []
             
             # Get user stories for this BC that have UI descriptions
-            bc_story_ids = bc.user_story_ids if hasattr(bc, 'user_story_ids') and bc.user_story_ids else []
-            bc_stories = [us for us in user_stories if us.id in bc_story_ids]
+            bc_stories = stories_by_bc[bc.id]
             
             for us in bc_stories:
                 # Check if user story has UI requirements
-                ui_desc = us.ui_description if hasattr(us, 'ui_description') else ""
+                ui_desc = us.ui_description
                 story_text = f"{us.action} {us.benefit} {ui_desc}".lower()
                 has_ui = bool(ui_desc) or any(kw.lower() in story_text for kw in ui_keywords)
                 
@@ -783,7 +1296,7 @@ async def run_ingestion_workflow(
                 # Find Commands that implement this user story
                 for agg in all_aggregates.get(bc_id, []):
                     for cmd in all_commands.get(agg.id, []):
-                        cmd_story_ids = cmd.user_story_ids if hasattr(cmd, 'user_story_ids') and cmd.user_story_ids else []
+                        cmd_story_ids = cmd.user_story_ids
                         if us_id not in cmd_story_ids:
                             continue
                         
@@ -805,35 +1318,35 @@ async def run_ingestion_workflow(
                             target_name=cmd.name,
                             target_id=cmd.id,
                             bc_name=bc_name,
-                            description=cmd.description if hasattr(cmd, 'description') else "",
+                            description=cmd.description,
                             user_story=user_story_text,
                             properties="",
                             aggregate_info=f"{agg.name}"
                         )
                         
                         try:
-                            structured_llm = llm.with_structured_output(UICandidate)
-                            ui_response = structured_llm.invoke([
-                                SystemMessage(content=SYSTEM_PROMPT),
+                            structured_llm = get_structured_llm(UICandidate)
+                            ui_response = await structured_llm.ainvoke([
+                                SYSTEM_MESSAGE,
                                 HumanMessage(content=prompt)
                             ])
                             
                             # Create UI in Neo4j
                             client.create_ui(
                                 id=ui_id,
-                                name=ui_response.name if hasattr(ui_response, 'name') else f"{cmd.name} UI",
+                                name=ui_response.name,
                                 bc_id=bc_id,
                                 attached_to_id=cmd.id,
                                 attached_to_type="Command",
-                                template=ui_response.template if hasattr(ui_response, 'template') else ""
+                                template=ui_response.template
                             )
                             
                             ui_data = {
                                 "id": ui_id,
-                                "name": ui_response.name if hasattr(ui_response, 'name') else f"{cmd.name} UI",
+                                "name": ui_response.name,
                                 "attachedToId": cmd.id,
                                 "attachedToType": "Command",
-                                "template": ui_response.template if hasattr(ui_response, 'template') else ""
+                                "template": ui_response.template
                             }
                             bc_uis.append(ui_data)
                             
@@ -853,7 +1366,7 @@ async def run_ingestion_workflow(
                                     }
                                 }
                             )
-                            await asyncio.sleep(0.15)
+                            await asyncio.sleep(0)
                             
                         except Exception as e:
                             print(f"Failed to generate UI for {cmd.name}: {e}")
@@ -861,7 +1374,7 @@ async def run_ingestion_workflow(
                 
                 # Find ReadModels that implement this user story
                 for rm in all_readmodels.get(bc_id, []):
-                    rm_story_ids = rm.user_story_ids if hasattr(rm, 'user_story_ids') and rm.user_story_ids else []
+                    rm_story_ids = rm.user_story_ids
                     if us_id not in rm_story_ids:
                         continue
                     
@@ -883,35 +1396,35 @@ async def run_ingestion_workflow(
                         target_name=rm.name,
                         target_id=rm.id,
                         bc_name=bc_name,
-                        description=rm.description if hasattr(rm, 'description') else "",
+                        description=rm.description,
                         user_story=user_story_text,
                         properties="",
                         aggregate_info="N/A (ReadModel)"
                     )
                     
                     try:
-                        structured_llm = llm.with_structured_output(UICandidate)
-                        ui_response = structured_llm.invoke([
-                            SystemMessage(content=SYSTEM_PROMPT),
+                        structured_llm = get_structured_llm(UICandidate)
+                        ui_response = await structured_llm.ainvoke([
+                            SYSTEM_MESSAGE,
                             HumanMessage(content=prompt)
                         ])
                         
                         # Create UI in Neo4j
                         client.create_ui(
                             id=ui_id,
-                            name=ui_response.name if hasattr(ui_response, 'name') else f"{rm.name} UI",
+                            name=ui_response.name,
                             bc_id=bc_id,
                             attached_to_id=rm.id,
                             attached_to_type="ReadModel",
-                            template=ui_response.template if hasattr(ui_response, 'template') else ""
+                            template=ui_response.template
                         )
                         
                         ui_data = {
                             "id": ui_id,
-                            "name": ui_response.name if hasattr(ui_response, 'name') else f"{rm.name} UI",
+                            "name": ui_response.name,
                             "attachedToId": rm.id,
                             "attachedToType": "ReadModel",
-                            "template": ui_response.template if hasattr(ui_response, 'template') else ""
+                            "template": ui_response.template
                         }
                         bc_uis.append(ui_data)
                         
@@ -931,7 +1444,7 @@ async def run_ingestion_workflow(
                                 }
                             }
                         )
-                        await asyncio.sleep(0.15)
+                        await asyncio.sleep(0)
                         
                     except Exception as e:
                         print(f"Failed to generate UI for {rm.name}: {e}")
@@ -963,13 +1476,15 @@ async def run_ingestion_workflow(
             progress=75
         )
         
-        from agent.nodes import EventList
-        from agent.prompts import EXTRACT_EVENTS_PROMPT
-        
         all_events = {}
         
+        # CRUD commands get their event derived locally; only the rest go to the LLM
+        local_events = {}
+        evt_targets = []
+        evt_keys = []
+        evt_prompts = []
         for bc in bc_candidates:
-            bc_id_short = bc.id.replace("BC-", "")
+            bc_id_short = bc.short_id
             bc_aggregates = all_aggregates.get(bc.id, [])
             
             for agg in bc_aggregates:
@@ -977,9 +1492,20 @@ async def run_ingestion_workflow(
                 if not commands:
                     continue
                 
+                llm_commands = []
+                for cmd in commands:
+                    evt = _derive_crud_event(cmd, bc_id_short)
+                    if evt:
+                        local_events[cmd.id] = evt
+                    else:
+                        llm_commands.append(cmd)
+                evt_targets.append((agg, commands, llm_commands))
+                if not llm_commands:
+                    continue
+                
                 commands_text = "\n".join([
-                    f"- {cmd.name}: {cmd.description}" if hasattr(cmd, 'description') else f"- {cmd.name}"
-                    for cmd in commands
+                    f"- {cmd.name}: {cmd.description}"
+                    for cmd in llm_commands
                 ])
                 
                 prompt = EXTRACT_EVENTS_PROMPT.format(
@@ -988,45 +1514,55 @@ async def run_ingestion_workflow(
                     bc_short=bc_id_short,
                     commands=commands_text
                 )
-                
-                structured_llm = llm.with_structured_output(EventList)
-                
-                try:
-                    evt_response = structured_llm.invoke([
-                        SystemMessage(content=SYSTEM_PROMPT),
-                        HumanMessage(content=prompt)
-                    ])
-                    events = evt_response.events
-                except Exception:
-                    events = []
-                
-                all_events[agg.id] = events
-                
-                for i, evt in enumerate(events):
-                    cmd_id = commands[i].id if i < len(commands) else commands[0].id if commands else None
-                    
-                    if cmd_id:
-                        client.create_event(
-                            id=evt.id,
-                            name=evt.name,
-                            command_id=cmd_id
-                        )
-                        
-                        yield ProgressEvent(
-                            phase=IngestionPhase.EXTRACTING_EVENTS,
-                            message=f"Event 생성: {evt.name}",
-                            progress=80,
-                            data={
-                                "type": "Event",
-                                "object": {
-                                    "id": evt.id,
-                                    "name": evt.name,
-                                    "type": "Event",
-                                    "parentId": cmd_id
-                                }
-                            }
-                        )
-                        await asyncio.sleep(0.1)
+                evt_keys.append(agg.id)
+                evt_prompts.append(prompt)
+        
+        evt_results = await _extract_for_each(
+            EventList, EventBatch, "events",
+            evt_keys, evt_prompts,
+            tolerate_errors=True,
+            tier="fast"
+        )
+        llm_events_by_agg = dict(zip(evt_keys, evt_results))
+        
+        for agg, commands, llm_commands in evt_targets:
+            llm_events = llm_events_by_agg.get(agg.id, [])
+            
+            # Keep events in command order: derived events pair with their own
+            # command, the i-th LLM event with the i-th LLM-handled command
+            emitted_by = []
+            next_llm = 0
+            for cmd in commands:
+                if cmd.id in local_events:
+                    emitted_by.append((local_events[cmd.id], cmd.id))
+                elif next_llm < len(llm_events):
+                    emitted_by.append((llm_events[next_llm], cmd.id))
+                    next_llm += 1
+            # Extra LLM events go to the first LLM-handled command
+            emitted_by.extend((evt, llm_commands[0].id) for evt in llm_events[next_llm:])
+            all_events[agg.id] = [evt for evt, _ in emitted_by]
+            
+            client.create_events_bulk([
+                {"id": evt.id, "name": evt.name, "command_id": cmd_id}
+                for evt, cmd_id in emitted_by
+            ])
+            
+            for evt, cmd_id in emitted_by:
+                yield ProgressEvent(
+                    phase=IngestionPhase.EXTRACTING_EVENTS,
+                    message=f"Event 생성: {evt.name}",
+                    progress=80,
+                    data={
+                        "type": "Event",
+                        "object": {
+                            "id": evt.id,
+                            "name": evt.name,
+                            "type": "Event",
+                            "parentId": cmd_id
+                        }
+                    }
+                )
+                await asyncio.sleep(0)
         
         # Check for pause after Event extraction
         if session.is_paused:
@@ -1044,29 +1580,24 @@ async def run_ingestion_workflow(
             progress=90
         )
         
-        from agent.nodes import PolicyList
-        from agent.prompts import IDENTIFY_POLICIES_PROMPT
-        
         # Collect all events for policy identification
-        all_events_list = []
-        for agg_id, events in all_events.items():
-            for evt in events:
-                all_events_list.append(f"- {evt.name}")
-        
-        events_text = "\n".join(all_events_list)
+        events_text = "\n".join(
+            f"- {evt.name}" for events in all_events.values() for evt in events
+        )
         
         # Collect commands by BC
-        commands_by_bc = {}
-        for bc in bc_candidates:
-            bc_cmds = []
-            for agg in all_aggregates.get(bc.id, []):
-                for cmd in all_commands.get(agg.id, []):
-                    bc_cmds.append(f"- {cmd.name}")
-            commands_by_bc[bc.name] = "\n".join(bc_cmds) if bc_cmds else "No commands"
+        commands_by_bc = {
+            bc.name: "\n".join(
+                f"- {cmd.name}"
+                for agg in all_aggregates.get(bc.id, [])
+                for cmd in all_commands.get(agg.id, [])
+            ) or "No commands"
+            for bc in bc_candidates
+        }
         
-        commands_text = "\n".join([
+        commands_text = "\n".join(
             f"{bc_name}:\n{cmds}" for bc_name, cmds in commands_by_bc.items()
-        ])
+        )
         
         bc_text = "\n".join([
             f"- {bc.name}: {bc.description}" for bc in bc_candidates
@@ -1078,65 +1609,84 @@ async def run_ingestion_workflow(
             bounded_contexts=bc_text
         )
         
-        structured_llm = llm.with_structured_output(PolicyList)
+        structured_llm = get_structured_llm(PolicyList)
         
         try:
-            pol_response = structured_llm.invoke([
-                SystemMessage(content=SYSTEM_PROMPT),
+            pol_response = await structured_llm.ainvoke([
+                SYSTEM_MESSAGE,
                 HumanMessage(content=prompt)
             ])
             policies = pol_response.policies
         except Exception:
             policies = []
         
+        # Index events, BCs and commands once instead of scanning them per policy
+        event_id_by_name = {
+            evt.name: evt.id for events in all_events.values() for evt in events
+        }
+        bc_id_by_ref = {bc.name: bc.id for bc in bc_candidates}
+        bc_id_by_ref.update({bc.id: bc.id for bc in bc_candidates})
+        command_id_by_bc_and_name = {
+            (bc.id, cmd.name): cmd.id
+            for bc in bc_candidates
+            for agg in all_aggregates.get(bc.id, [])
+            for cmd in all_commands.get(agg.id, [])
+        }
+        
+        policy_rows = []
         for pol in policies:
             # Find trigger event and invoke command IDs
-            trigger_event_id = None
-            invoke_command_id = None
-            target_bc_id = None
-            
-            for agg_id, events in all_events.items():
-                for evt in events:
-                    if evt.name == pol.trigger_event:
-                        trigger_event_id = evt.id
-                        break
-            
-            for bc in bc_candidates:
-                if bc.name == pol.target_bc or bc.id == pol.target_bc:
-                    target_bc_id = bc.id
-                    for agg in all_aggregates.get(bc.id, []):
-                        for cmd in all_commands.get(agg.id, []):
-                            if cmd.name == pol.invoke_command:
-                                invoke_command_id = cmd.id
-                                break
+            trigger_event_id = event_id_by_name.get(pol.trigger_event)
+            target_bc_id = bc_id_by_ref.get(pol.target_bc)
+            invoke_command_id = command_id_by_bc_and_name.get((target_bc_id, pol.invoke_command))
             
             if trigger_event_id and invoke_command_id and target_bc_id:
-                try:
-                    client.create_policy(
-                        id=pol.id,
-                        name=pol.name,
-                        bc_id=target_bc_id,
-                        trigger_event_id=trigger_event_id,
-                        invoke_command_id=invoke_command_id,
-                        description=pol.description
-                    )
-                    
-                    yield ProgressEvent(
-                        phase=IngestionPhase.IDENTIFYING_POLICIES,
-                        message=f"Policy 생성: {pol.name}",
-                        progress=90,
-                        data={
-                            "type": "Policy",
-                            "object": {
-                                "id": pol.id,
-                                "name": pol.name,
-                                "type": "Policy",
-                                "parentId": target_bc_id
-                            }
-                        }
-                    )
-                except Exception:
-                    pass
+                policy_rows.append({
+                    "id": pol.id,
+                    "name": pol.name,
+                    "bc_id": target_bc_id,
+                    "trigger_event_id": trigger_event_id,
+                    "invoke_command_id": invoke_command_id,
+                    "description": pol.description
+                })
+        
+        try:
+            created_ids = set(client.create_policies_bulk(policy_rows))
+        except Exception as e:
+            print(f"[Policy] Bulk create failed for {len(policy_rows)} policies: {e}")
+            created_ids = set()
+        
+        failed_rows = [row for row in policy_rows if row["id"] not in created_ids]
+        if failed_rows:
+            failed_names = ", ".join(row["name"] for row in failed_rows)
+            print(f"[Policy] Not saved: {failed_names}")
+            yield ProgressEvent(
+                phase=IngestionPhase.IDENTIFYING_POLICIES,
+                message=f"⚠️ Policy 저장 실패 ({len(failed_rows)}개): {failed_names}",
+                progress=90,
+                data={
+                    "type": "PolicyBatchError",
+                    "ids": [row["id"] for row in failed_rows]
+                }
+            )
+        
+        for row in policy_rows:
+            if row["id"] not in created_ids:
+                continue
+            yield ProgressEvent(
+                phase=IngestionPhase.IDENTIFYING_POLICIES,
+                message=f"Policy 생성: {row['name']}",
+                progress=90,
+                data={
+                    "type": "Policy",
+                    "object": {
+                        "id": row["id"],
+                        "name": row["name"],
+                        "type": "Policy",
+                        "parentId": row["bc_id"]
+                    }
+                }
+            )
         
         # Check for pause after Policy identification
         if session.is_paused:
@@ -1154,21 +1704,17 @@ async def run_ingestion_workflow(
             progress=91
         )
         
-        from agent.nodes import PropertyList
-        from agent.prompts import (
-            EXTRACT_AGGREGATE_PROPERTIES_PROMPT,
-            EXTRACT_COMMAND_PROPERTIES_PROMPT,
-            EXTRACT_EVENT_PROPERTIES_PROMPT,
-        )
-        from agent.state import PropertyCandidate
-        
         all_properties = {}
-        property_count = 0
+        # Property writes (one batch per entity) run in the background so they
+        # overlap with the next entity's LLM call. Each batch's event is sent only
+        # once its write has committed; the rest are awaited at the end of the phase.
+        property_writes: list[tuple[asyncio.Task, ProgressEvent]] = []
+        stored_counts: list[int] = []
         
         # 8.1: Generate properties for each Aggregate (Aggregate Root member fields)
         for bc in bc_candidates:
             bc_aggregates = all_aggregates.get(bc.id, [])
-            bc_stories = [us for us in user_stories if us.id in bc.user_story_ids]
+            bc_stories = stories_by_bc[bc.id]
             stories_text = "\n".join([
                 f"- [{us.id}] {us.role}: {us.action}"
                 for us in bc_stories
@@ -1186,16 +1732,16 @@ async def run_ingestion_workflow(
                     aggregate_id=agg.id,
                     bc_name=bc.name,
                     root_entity=agg.root_entity,
-                    description=agg.description if hasattr(agg, 'description') else "",
+                    description=agg.description,
                     invariants=", ".join(agg.invariants) if agg.invariants else "None",
                     user_stories=stories_text
                 )
                 
-                structured_llm = llm.with_structured_output(PropertyList)
+                structured_llm = get_structured_llm(PropertyList)
                 
                 try:
-                    prop_response = structured_llm.invoke([
-                        SystemMessage(content=SYSTEM_PROMPT),
+                    prop_response = await structured_llm.ainvoke([
+                        SYSTEM_MESSAGE,
                         HumanMessage(content=prompt)
                     ])
                     agg_properties = prop_response.properties
@@ -1204,43 +1750,25 @@ async def run_ingestion_workflow(
                 
                 all_properties[agg.id] = agg_properties
                 
-                for prop in agg_properties:
-                    try:
-                        client.create_property(
-                            id=prop.id,
-                            name=prop.name,
-                            parent_id=agg.id,
-                            parent_type="Aggregate",
-                            data_type=prop.type,
-                            description=prop.description if hasattr(prop, 'description') else "",
-                            is_required=prop.is_required if hasattr(prop, 'is_required') else True
-                        )
-                        property_count += 1
-                        
-                        yield ProgressEvent(
-                            phase=IngestionPhase.GENERATING_PROPERTIES,
-                            message=f"Property 생성: {agg.name}.{prop.name}",
-                            progress=93,
-                            data={
-                                "type": "Property",
-                                "object": {
-                                    "id": prop.id,
-                                    "name": prop.name,
-                                    "type": "Property",
-                                    "dataType": prop.type,
-                                    "parentId": agg.id,
-                                    "parentType": "Aggregate"
-                                }
-                            }
-                        )
-                        await asyncio.sleep(0.05)
-                    except Exception:
-                        pass
+                if agg_properties:
+                    write = asyncio.create_task(asyncio.to_thread(
+                        client.create_properties_bulk,
+                        parent_id=agg.id,
+                        parent_type="Aggregate",
+                        properties=[prop.model_dump() for prop in agg_properties]
+                    ))
+                    property_writes.append(
+                        (write, _property_batch_event(agg.id, "Aggregate", agg.name, agg_properties, 93))
+                    )
+                
+                # Announce batches whose writes have already committed
+                for event in _settle_property_writes(property_writes, stored_counts):
+                    yield event
         
         # 8.2: Generate properties for each Command (request body)
         for bc in bc_candidates:
             bc_aggregates = all_aggregates.get(bc.id, [])
-            bc_stories = [us for us in user_stories if us.id in bc.user_story_ids]
+            bc_stories = stories_by_bc[bc.id]
             stories_text = "\n".join([
                 f"- [{us.id}] {us.role}: {us.action}"
                 for us in bc_stories
@@ -1261,16 +1789,16 @@ async def run_ingestion_workflow(
                         command_id=cmd.id,
                         aggregate_name=agg.name,
                         bc_name=bc.name,
-                        actor=cmd.actor if hasattr(cmd, 'actor') else "user",
-                        description=cmd.description if hasattr(cmd, 'description') else "",
+                        actor=cmd.actor,
+                        description=cmd.description,
                         user_stories=stories_text
                     )
                     
-                    structured_llm = llm.with_structured_output(PropertyList)
+                    structured_llm = get_structured_llm(PropertyList)
                     
                     try:
-                        prop_response = structured_llm.invoke([
-                            SystemMessage(content=SYSTEM_PROMPT),
+                        prop_response = await structured_llm.ainvoke([
+                            SYSTEM_MESSAGE,
                             HumanMessage(content=prompt)
                         ])
                         cmd_properties = prop_response.properties
@@ -1279,38 +1807,20 @@ async def run_ingestion_workflow(
                     
                     all_properties[cmd.id] = cmd_properties
                     
-                    for prop in cmd_properties:
-                        try:
-                            client.create_property(
-                                id=prop.id,
-                                name=prop.name,
-                                parent_id=cmd.id,
-                                parent_type="Command",
-                                data_type=prop.type,
-                                description=prop.description if hasattr(prop, 'description') else "",
-                                is_required=prop.is_required if hasattr(prop, 'is_required') else True
-                            )
-                            property_count += 1
-                            
-                            yield ProgressEvent(
-                                phase=IngestionPhase.GENERATING_PROPERTIES,
-                                message=f"Property 생성: {cmd.name}.{prop.name}",
-                                progress=96,
-                                data={
-                                    "type": "Property",
-                                    "object": {
-                                        "id": prop.id,
-                                        "name": prop.name,
-                                        "type": "Property",
-                                        "dataType": prop.type,
-                                        "parentId": cmd.id,
-                                        "parentType": "Command"
-                                    }
-                                }
-                            )
-                            await asyncio.sleep(0.03)
-                        except Exception:
-                            pass
+                    if cmd_properties:
+                        write = asyncio.create_task(asyncio.to_thread(
+                            client.create_properties_bulk,
+                            parent_id=cmd.id,
+                            parent_type="Command",
+                            properties=[prop.model_dump() for prop in cmd_properties]
+                        ))
+                        property_writes.append(
+                            (write, _property_batch_event(cmd.id, "Command", cmd.name, cmd_properties, 96))
+                        )
+                    
+                    # Announce batches whose writes have already committed
+                    for event in _settle_property_writes(property_writes, stored_counts):
+                        yield event
         
         # 8.3: Generate properties for each Event (event payload)
         for bc in bc_candidates:
@@ -1338,7 +1848,7 @@ async def run_ingestion_workflow(
                         progress=98
                     )
                     
-                    prompt = EXTRACT_EVENT_PROPERTIES_PROMPT.format(
+                    prompt = build_event_properties_prompt(
                         event_name=evt.name,
                         event_id=evt.id,
                         aggregate_name=agg.name,
@@ -1348,11 +1858,11 @@ async def run_ingestion_workflow(
                         aggregate_properties=agg_props_text
                     )
                     
-                    structured_llm = llm.with_structured_output(PropertyList)
+                    structured_llm = get_structured_llm(PropertyList)
                     
                     try:
-                        prop_response = structured_llm.invoke([
-                            SystemMessage(content=SYSTEM_PROMPT),
+                        prop_response = await structured_llm.ainvoke([
+                            SYSTEM_MESSAGE,
                             HumanMessage(content=prompt)
                         ])
                         evt_properties = prop_response.properties
@@ -1361,45 +1871,26 @@ async def run_ingestion_workflow(
                     
                     all_properties[evt.id] = evt_properties
                     
-                    for prop in evt_properties:
-                        try:
-                            client.create_property(
-                                id=prop.id,
-                                name=prop.name,
-                                parent_id=evt.id,
-                                parent_type="Event",
-                                data_type=prop.type,
-                                description=prop.description if hasattr(prop, 'description') else "",
-                                is_required=prop.is_required if hasattr(prop, 'is_required') else True
-                            )
-                            property_count += 1
-                            
-                            yield ProgressEvent(
-                                phase=IngestionPhase.GENERATING_PROPERTIES,
-                                message=f"Property 생성: {evt.name}.{prop.name}",
-                                progress=97,
-                                data={
-                                    "type": "Property",
-                                    "object": {
-                                        "id": prop.id,
-                                        "name": prop.name,
-                                        "type": "Property",
-                                        "dataType": prop.type,
-                                        "parentId": evt.id,
-                                        "parentType": "Event"
-                                    }
-                                }
-                            )
-                            await asyncio.sleep(0.03)
-                        except Exception:
-                            pass
+                    if evt_properties:
+                        write = asyncio.create_task(asyncio.to_thread(
+                            client.create_properties_bulk,
+                            parent_id=evt.id,
+                            parent_type="Event",
+                            properties=[prop.model_dump() for prop in evt_properties]
+                        ))
+                        property_writes.append(
+                            (write, _property_batch_event(evt.id, "Event", evt.name, evt_properties, 97))
+                        )
+                    
+                    # Announce batches whose writes have already committed
+                    for event in _settle_property_writes(property_writes, stored_counts):
+                        yield event
         
         # 8.4: Generate properties for each ReadModel (after Event properties for CQRS context)
-        from agent.prompts import EXTRACT_READMODEL_PROPERTIES_PROMPT
         
         for bc in bc_candidates:
             bc_readmodels = all_readmodels.get(bc.id, [])
-            bc_stories = [us for us in user_stories if us.id in bc.user_story_ids]
+            bc_stories = stories_by_bc[bc.id]
             stories_text = "\n".join([
                 f"- [{us.id}] {us.role}: {us.action}"
                 for us in bc_stories
@@ -1414,7 +1905,7 @@ async def run_ingestion_workflow(
                 
                 # Get source events info for CQRS context
                 source_events_text = "(No source events specified)"
-                if hasattr(rm, 'source_event_ids') and rm.source_event_ids:
+                if rm.source_event_ids:
                     source_event_names = []
                     for evt_id in rm.source_event_ids:
                         for agg_id, events in all_events.items():
@@ -1428,7 +1919,7 @@ async def run_ingestion_workflow(
                 
                 # Get supported commands info
                 supported_commands_text = "(No supported commands)"
-                if hasattr(rm, 'supports_command_ids') and rm.supports_command_ids:
+                if rm.supports_command_ids:
                     cmd_names = []
                     for cmd_id in rm.supports_command_ids:
                         for agg_id, commands in all_commands.items():
@@ -1438,22 +1929,22 @@ async def run_ingestion_workflow(
                                     break
                     supported_commands_text = "\n".join(cmd_names) if cmd_names else "(No commands found)"
                 
-                prompt = EXTRACT_READMODEL_PROPERTIES_PROMPT.format(
+                prompt = build_readmodel_properties_prompt(
                     readmodel_name=rm.name,
                     readmodel_id=rm.id,
                     bc_name=bc.name,
-                    description=rm.description if hasattr(rm, 'description') else "",
-                    provisioning_type=rm.provisioning_type if hasattr(rm, 'provisioning_type') else "CQRS",
+                    description=rm.description,
+                    provisioning_type=rm.provisioning_type,
                     source_events=source_events_text,
                     supported_commands=supported_commands_text,
                     user_stories=stories_text
                 )
                 
-                structured_llm = llm.with_structured_output(PropertyList)
+                structured_llm = get_structured_llm(PropertyList)
                 
                 try:
-                    prop_response = structured_llm.invoke([
-                        SystemMessage(content=SYSTEM_PROMPT),
+                    prop_response = await structured_llm.ainvoke([
+                        SYSTEM_MESSAGE,
                         HumanMessage(content=prompt)
                     ])
                     rm_properties = prop_response.properties
@@ -1463,38 +1954,26 @@ async def run_ingestion_workflow(
                 
                 all_properties[rm.id] = rm_properties
                 
-                for prop in rm_properties:
-                    try:
-                        client.create_property(
-                            id=prop.id,
-                            name=prop.name,
-                            parent_id=rm.id,
-                            parent_type="ReadModel",
-                            data_type=prop.type,
-                            description=prop.description if hasattr(prop, 'description') else "",
-                            is_required=prop.is_required if hasattr(prop, 'is_required') else True
-                        )
-                        property_count += 1
-                        
-                        yield ProgressEvent(
-                            phase=IngestionPhase.GENERATING_PROPERTIES,
-                            message=f"Property 생성: {rm.name}.{prop.name}",
-                            progress=99,
-                            data={
-                                "type": "Property",
-                                "object": {
-                                    "id": prop.id,
-                                    "name": prop.name,
-                                    "type": "Property",
-                                    "dataType": prop.type,
-                                    "parentId": rm.id,
-                                    "parentType": "ReadModel"
-                                }
-                            }
-                        )
-                        await asyncio.sleep(0.03)
-                    except Exception:
-                        pass
+                if rm_properties:
+                    write = asyncio.create_task(asyncio.to_thread(
+                        client.create_properties_bulk,
+                        parent_id=rm.id,
+                        parent_type="ReadModel",
+                        properties=[prop.model_dump() for prop in rm_properties]
+                    ))
+                    property_writes.append(
+                        (write, _property_batch_event(rm.id, "ReadModel", rm.name, rm_properties, 99))
+                    )
+                
+                # Announce batches whose writes have already committed
+                for event in _settle_property_writes(property_writes, stored_counts):
+                    yield event
+        
+        if property_writes:
+            await asyncio.wait([write for write, _ in property_writes])
+        for event in _settle_property_writes(property_writes, stored_counts):
+            yield event
+        property_count = sum(stored_counts)
         
         # Phase 9: Create CQRS Operations for ReadModels
         yield ProgressEvent(
@@ -1551,7 +2030,7 @@ async def run_ingestion_workflow(
                                         }
                                     }
                                 )
-                                await asyncio.sleep(0.05)
+                                await asyncio.sleep(0)
                         except Exception as e:
                             print(f"[CQRS] Error creating operation for {rm.id}: {e}")
                             
@@ -1606,17 +2085,13 @@ async def upload_document(
     content = ""
     
     if file:
-        file_content = await file.read()
         filename = file.filename or ""
         
         if filename.lower().endswith('.pdf'):
-            content = extract_text_from_pdf(file_content)
+            content = await extract_text_from_pdf(await file.read())
         else:
             # Assume text file
-            try:
-                content = file_content.decode('utf-8')
-            except UnicodeDecodeError:
-                content = file_content.decode('latin-1')
+            content = await read_text_upload(file)
     elif text:
         content = text
     else:
@@ -1625,7 +2100,7 @@ async def upload_document(
             detail="Either 'file' or 'text' must be provided"
         )
     
-    if not content.strip():
+    if not content or content.isspace():
         raise HTTPException(
             status_code=400,
             detail="Document content is empty"
@@ -1670,24 +2145,26 @@ async def get_session_status(session_id: str) -> dict[str, Any]:
         }
     
     # Session is still active
-    last_event = session.events[-1] if session.events else None
+    has_events = bool(session.events)
     
     return {
         "active": True,
         "phase": session.status.value if session.status else "processing",
-        "message": last_event.get("message", "Processing...") if last_event else "Processing...",
-        "progress": last_event.get("progress", 0) if last_event else 0,
+        "message": session.message if has_events else "Processing...",
+        "progress": session.progress if has_events else 0,
         "isPaused": session.is_paused
     }
 
 
 @router.get("/stream/{session_id}")
-async def stream_progress(session_id: str, reconnect: bool = False):
+async def stream_progress(request: Request, session_id: str, reconnect: bool = False):
     """
     SSE endpoint for streaming ingestion progress.
     
     Client should connect after receiving session_id from /upload.
-    If reconnect=true, will first replay all stored events before continuing.
+    Every event carries its index in the session log as the SSE id. A
+    browser reconnecting with Last-Event-ID gets only the events after
+    that id replayed; reconnect=true replays all stored events.
     Supports multiple clients connecting to the same session.
     """
     session = get_session(session_id)
@@ -1695,19 +2172,34 @@ async def stream_progress(session_id: str, reconnect: bool = False):
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
+    # Index of the first stored event this client still needs
+    last_event_id = request.headers.get("last-event-id", "")
+    if last_event_id.isdigit():
+        replay_from = int(last_event_id) + 1
+    elif reconnect:
+        replay_from = 0
+    else:
+        replay_from = None
+    
     # Create a queue for this subscriber
     subscriber_queue = asyncio.Queue()
     session.event_queues.append(subscriber_queue)
     
     async def event_generator():
         try:
-            # If reconnecting, first replay all stored events
-            if reconnect and session.events:
-                for stored_event in session.events:
+            # Events below next_id were already sent (queued copies are skipped)
+            next_id = 0
+            
+            # If resuming, first replay the stored events the client missed
+            if replay_from is not None:
+                next_id = replay_from
+                while next_id < len(session.events):
                     yield {
                         "event": "progress",
-                        "data": json.dumps(stored_event)
+                        "id": str(next_id),
+                        "data": session.events[next_id]
                     }
+                    next_id += 1
                     await asyncio.sleep(0.01)  # Small delay to not overwhelm client
                 
                 # If session is already complete or errored, don't continue
@@ -1717,21 +2209,27 @@ async def stream_progress(session_id: str, reconnect: bool = False):
             # Start workflow if not already running (first client)
             if not session.is_workflow_running and session.status not in (IngestionPhase.COMPLETE, IngestionPhase.ERROR):
                 session.is_workflow_running = True
-                # Run workflow in background task
-                asyncio.create_task(run_workflow_background(session))
+                # Run workflow in background task (keep a reference until it finishes)
+                task = asyncio.create_task(run_workflow_background(session))
+                _workflow_tasks.add(task)
+                task.add_done_callback(_workflow_tasks.discard)
             
             # Listen for events from the queue
             while True:
                 try:
                     # Wait for event with timeout
-                    event_dict = await asyncio.wait_for(subscriber_queue.get(), timeout=30.0)
+                    event_id, phase, payload = await asyncio.wait_for(subscriber_queue.get(), timeout=30.0)
+                    if event_id < next_id:
+                        continue
+                    next_id = event_id + 1
                     yield {
                         "event": "progress",
-                        "data": json.dumps(event_dict)
+                        "id": str(event_id),
+                        "data": payload
                     }
                     
                     # Check if workflow is complete
-                    if event_dict.get("phase") in ("complete", "error"):
+                    if phase in (IngestionPhase.COMPLETE, IngestionPhase.ERROR):
                         break
                         
                 except asyncio.TimeoutError:
@@ -1748,14 +2246,24 @@ async def stream_progress(session_id: str, reconnect: bool = False):
             # Remove subscriber queue when client disconnects
             if subscriber_queue in session.event_queues:
                 session.event_queues.remove(subscriber_queue)
+            
+            # Release finished sessions once the last subscriber is gone
+            if not session.event_queues and session.status in (IngestionPhase.COMPLETE, IngestionPhase.ERROR):
+                _registry.remove(session_id)
     
     return EventSourceResponse(event_generator())
 
 
+# Strong references to running workflow tasks; the event loop only keeps weak ones
+_workflow_tasks: set[asyncio.Task] = set()
+
+
 async def run_workflow_background(session: IngestionSession):
     """Run the ingestion workflow in the background and broadcast events."""
     try:
         async for event in run_ingestion_workflow(session, session.content):
+            # Each event follows a batch of graph writes
+            invalidate_event_triggers_cache()
             add_event(session, event)
     except Exception as e:
         # Handle errors by sending error event
@@ -1767,6 +2275,7 @@ async def run_workflow_background(session: IngestionSession):
         add_event(session, error_event)
     finally:
         session.is_workflow_running = False
+        invalidate_event_triggers_cache()
 
 
 @router.post("/{session_id}/pause")
@@ -1787,6 +2296,7 @@ async def pause_ingestion(session_id: str) -> dict[str, Any]:
         raise HTTPException(status_code=400, detail="Ingestion has error")
     
     session.is_paused = True
+    session.resumed.clear()
     
     return {
         "status": "paused",
@@ -1810,6 +2320,7 @@ async def resume_ingestion(session_id: str) -> dict[str, Any]:
         raise HTTPException(status_code=400, detail="Ingestion is not paused")
     
     session.is_paused = False
+    session.resumed.set()
     
     return {
         "status": "resumed",
@@ -1840,15 +2351,7 @@ async def get_ingestion_status(session_id: str) -> dict[str, Any]:
 @router.get("/sessions")
 async def list_sessions() -> list[dict[str, Any]]:
     """List all active ingestion sessions."""
-    return [
-        {
-            "id": s.id,
-            "status": s.status.value,
-            "progress": s.progress,
-            "message": s.message
-        }
-        for s in _sessions.values()
-    ]
+    return _registry.summaries()
 
 
 @router.delete("/clear-all")
@@ -1864,7 +2367,6 @@ async def clear_all_data() -> dict[str, Any]:
     보존 대상 (robo-analyzer 생성):
     - Table, Column, PROCEDURE, FUNCTION, TRIGGER, Variable, Parameter
     """
-    from agent.neo4j_client import get_neo4j_client
     
     client = get_neo4j_client()
     
@@ -1885,34 +2387,18 @@ async def clear_all_data() -> dict[str, Any]:
     ]
     
     try:
-        with client.session() as session:
-            # Get counts before deletion (only architect nodes)
-            count_query = """
-            MATCH (n)
-            WHERE labels(n)[0] IN $node_types
-            WITH labels(n)[0] as label, count(n) as count
-            RETURN collect({label: label, count: count}) as counts
-            """
-            result = session.run(count_query, node_types=ARCHITECT_NODE_TYPES)
-            record = result.single()
-            before_counts = {item["label"]: item["count"] for item in record["counts"]} if record else {}
-            
-            # Delete only robo-architect created nodes
-            delete_query = """
-            MATCH (n)
-            WHERE labels(n)[0] IN $node_types
-            DETACH DELETE n
-            """
-            session.run(delete_query, node_types=ARCHITECT_NODE_TYPES)
-            
-            total_deleted = sum(before_counts.values())
-            
-            return {
-                "success": True,
-                "message": f"Event Storming 요소 {total_deleted}개가 삭제되었습니다 (레거시 데이터는 보존됨)",
-                "deleted": before_counts,
-                "preserved_types": ["Table", "Column", "PROCEDURE", "FUNCTION", "TRIGGER", "Variable"]
-            }
+        # Delete only robo-architect created nodes; counts come from the deletes
+        deleted_counts = client.delete_nodes_by_label(ARCHITECT_NODE_TYPES)
+        invalidate_event_triggers_cache()
+        
+        total_deleted = sum(deleted_counts.values())
+        
+        return {
+            "success": True,
+            "message": f"Event Storming 요소 {total_deleted}개가 삭제되었습니다 (레거시 데이터는 보존됨)",
+            "deleted": deleted_counts,
+            "preserved_types": ["Table", "Column", "PROCEDURE", "FUNCTION", "TRIGGER", "Variable"]
+        }
     except Exception as e:
         return {
             "success": False,
@@ -1925,29 +2411,22 @@ async def clear_all_data() -> dict[str, Any]:
 async def get_data_stats() -> dict[str, Any]:
     """
     Get current data statistics from Neo4j.
+    
+    `counts` is per label (a node with several labels appears under each);
+    `total` counts every node exactly once.
     """
-    from agent.neo4j_client import get_neo4j_client
     
     client = get_neo4j_client()
     
     try:
-        with client.session() as session:
-            query = """
-            MATCH (n)
-            WITH labels(n)[0] as label, count(n) as count
-            RETURN collect({label: label, count: count}) as counts
-            """
-            result = session.run(query)
-            record = result.single()
-            counts = {item["label"]: item["count"] for item in record["counts"]} if record else {}
-            
-            total = sum(counts.values())
-            
-            return {
-                "total": total,
-                "counts": counts,
-                "hasData": total > 0
-            }
+        counts = client.get_label_counts()
+        total = client.get_node_count()
+        
+        return {
+            "total": total,
+            "counts": counts,
+            "hasData": total > 0
+        }
     except Exception as e:
         return {
             "total": 0,
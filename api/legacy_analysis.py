@@ -21,18 +21,28 @@ robo-analyzer에서 생성한 노드 타입:
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import heapq
+import io
 import json
 import os
+import re
+import time
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, AsyncGenerator, Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, AsyncGenerator, Iterable, Iterator, Optional
 
 from fastapi import APIRouter, HTTPException, Query
+from langchain_core.messages import HumanMessage, SystemMessage
 from pydantic import BaseModel
 from sse_starlette.sse import EventSourceResponse
 
 from agent.neo4j_client import get_neo4j_client
+from api.graph_cache import invalidate_event_triggers_cache
 
 router = APIRouter(prefix="/api/legacy", tags=["legacy-analysis"])
 
@@ -87,12 +97,33 @@ class ProcedureInfo(BaseModel):
 # =============================================================================
 
 
-def get_legacy_tables(client, user_id: str = None, project_name: str = None) -> list[dict]:
+_SCOPE_PLACEHOLDER_RE = re.compile(r"\{scope_(\w+)\}")
+
+
+def _scoped(query: str, user_id: Optional[str], project_name: Optional[str]) -> str:
+    """
+    {scope_<var>} 자리에 사용자/프로젝트 필터를 채워 넣음.
+
+    주어진 값에 대해서만 조건을 만들어 `$x IS NULL OR ...` 분기 없이
+    (user_id, project_name) 인덱스를 사용할 수 있게 합니다.
+    """
+    def predicate(match: re.Match) -> str:
+        var = match.group(1)
+        conditions = []
+        if user_id is not None:
+            conditions.append(f"{var}.user_id = $user_id")
+        if project_name is not None:
+            conditions.append(f"{var}.project_name = $project_name")
+        return " AND ".join(conditions) or "true"
+    
+    return _SCOPE_PLACEHOLDER_RE.sub(predicate, query)
+
+
+def get_legacy_tables(client, user_id: str = None, project_name: str = None) -> Iterator[dict]:
     """Neo4j에서 테이블 정보 조회"""
-    query = """
+    query = _scoped("""
     MATCH (t:Table)
-    WHERE ($user_id IS NULL OR t.user_id = $user_id)
-      AND ($project_name IS NULL OR t.project_name = $project_name)
+    WHERE {scope_t}
     OPTIONAL MATCH (t)-[:HAS_COLUMN]->(c:Column)
     WITH t, collect(c {.name, .dtype, .description, .nullable}) as columns
     RETURN {
@@ -104,19 +135,18 @@ def get_legacy_tables(client, user_id: str = None, project_name: str = None) ->
         columns: columns
     } as table_info
     ORDER BY t.schema, t.name
-    """
+    """, user_id, project_name)
     with client.session() as session:
-        result = session.run(query, user_id=user_id, project_name=project_name)
-        return [dict(record["table_info"]) for record in result]
+        for record in session.run(query, user_id=user_id, project_name=project_name):
+            yield record["table_info"]
 
 
-def get_legacy_procedures(client, user_id: str = None, project_name: str = None) -> list[dict]:
+def get_legacy_procedures(client, user_id: str = None, project_name: str = None) -> Iterator[dict]:
     """Neo4j에서 프로시저/함수 정보 조회"""
-    query = """
+    query = _scoped("""
     MATCH (p)
     WHERE (p:PROCEDURE OR p:FUNCTION OR p:TRIGGER)
-      AND ($user_id IS NULL OR p.user_id = $user_id)
-      AND ($project_name IS NULL OR p.project_name = $project_name)
+      AND {scope_p}
     OPTIONAL MATCH (p)-[:FROM]->(rt:Table)
     OPTIONAL MATCH (p)-[:WRITES]->(wt:Table)
     WITH p, 
@@ -132,18 +162,17 @@ def get_legacy_procedures(client, user_id: str = None, project_name: str = None)
         writes_tables: writes_tables
     } as proc_info
     ORDER BY proc_info.name
-    """
+    """, user_id, project_name)
     with client.session() as session:
-        result = session.run(query, user_id=user_id, project_name=project_name)
-        return [dict(record["proc_info"]) for record in result]
+        for record in session.run(query, user_id=user_id, project_name=project_name):
+            yield record["proc_info"]
 
 
-def get_table_relationships(client, user_id: str = None, project_name: str = None) -> list[dict]:
+def get_table_relationships(client, user_id: str = None, project_name: str = None) -> Iterator[dict]:
     """테이블 간 FK 관계 조회"""
-    query = """
+    query = _scoped("""
     MATCH (t1:Table)-[r:FK_TO_TABLE]->(t2:Table)
-    WHERE ($user_id IS NULL OR t1.user_id = $user_id)
-      AND ($project_name IS NULL OR t1.project_name = $project_name)
+    WHERE {scope_t1}
     RETURN {
         from_table: t1.name,
         from_schema: t1.schema,
@@ -151,50 +180,167 @@ def get_table_relationships(client, user_id: str = None, project_name: str = Non
         to_schema: t2.schema,
         fk_column: r.column_name
     } as relationship
-    """
+    """, user_id, project_name)
     with client.session() as session:
-        result = session.run(query, user_id=user_id, project_name=project_name)
-        return [dict(record["relationship"]) for record in result]
+        for record in session.run(query, user_id=user_id, project_name=project_name):
+            yield record["relationship"]
 
 
-def get_procedure_calls(client, user_id: str = None, project_name: str = None) -> list[dict]:
+def get_procedure_calls(client, user_id: str = None, project_name: str = None) -> Iterator[dict]:
     """프로시저 간 호출 관계(CALL) 조회"""
-    query = """
+    query = _scoped("""
     MATCH (p1)-[r:CALL]->(p2)
     WHERE (p1:PROCEDURE OR p1:FUNCTION OR p1:TRIGGER)
       AND (p2:PROCEDURE OR p2:FUNCTION)
-      AND ($user_id IS NULL OR p1.user_id = $user_id)
-      AND ($project_name IS NULL OR p1.project_name = $project_name)
+      AND {scope_p1}
     RETURN {
         caller: COALESCE(p1.procedure_name, p1.function_name, p1.trigger_name, p1.name),
         caller_type: labels(p1)[0],
         callee: COALESCE(p2.procedure_name, p2.function_name, p2.name),
         callee_type: labels(p2)[0]
     } as call_info
-    """
+    """, user_id, project_name)
     with client.session() as session:
-        result = session.run(query, user_id=user_id, project_name=project_name)
-        return [dict(record["call_info"]) for record in result]
+        for record in session.run(query, user_id=user_id, project_name=project_name):
+            yield record["call_info"]
 
 
-def get_procedure_table_access(client, user_id: str = None, project_name: str = None) -> list[dict]:
+def get_procedure_table_access(client, user_id: str = None, project_name: str = None) -> Iterator[dict]:
     """프로시저의 테이블 읽기/쓰기 관계 조회"""
-    query = """
+    query = _scoped("""
     MATCH (p)-[r]->(t:Table)
     WHERE (p:PROCEDURE OR p:FUNCTION OR p:TRIGGER)
       AND type(r) IN ['FROM', 'WRITES']
-      AND ($user_id IS NULL OR p.user_id = $user_id)
-      AND ($project_name IS NULL OR p.project_name = $project_name)
+      AND {scope_p}
     RETURN {
         procedure: COALESCE(p.procedure_name, p.function_name, p.trigger_name, p.name),
         procedure_type: labels(p)[0],
         table_name: t.name,
         access_type: type(r)
     } as access_info
+    """, user_id, project_name)
+    with client.session() as session:
+        for record in session.run(query, user_id=user_id, project_name=project_name):
+            yield record["access_info"]
+
+
+def get_legacy_counts(client, user_id: str = None, project_name: str = None) -> dict:
+    """테이블/프로시저 타입별 개수와 FK 관계 수를 Neo4j에서 집계하여 조회"""
+    query = _scoped("""
+    CALL {
+        MATCH (t:Table)
+        WHERE {scope_t}
+        WITH COALESCE(t.table_type, 'UNKNOWN') as k, count(*) as v
+        RETURN collect([k, v]) as table_types
+    }
+    CALL {
+        MATCH (p)
+        WHERE (p:PROCEDURE OR p:FUNCTION OR p:TRIGGER)
+          AND {scope_p}
+        WITH labels(p)[0] as k, count(*) as v
+        RETURN collect([k, v]) as proc_types
+    }
+    CALL {
+        MATCH (t1:Table)-[:FK_TO_TABLE]->(:Table)
+        WHERE {scope_t1}
+        RETURN count(*) as relationships
+    }
+    RETURN table_types, proc_types, relationships
+    """, user_id, project_name)
+    with client.session() as session:
+        record = session.run(query, user_id=user_id, project_name=project_name).single()
+        return {
+            "table_types": dict(record["table_types"]),
+            "proc_types": dict(record["proc_types"]),
+            "relationships": record["relationships"]
+        }
+
+
+def load_legacy_graph(client, user_id: str = None, project_name: str = None) -> dict[str, list[dict]]:
     """
+    테이블/프로시저/FK 관계/호출 관계/테이블 접근 정보를 한 번의 쿼리로 조회
+
+    개별 get_* 함수와 같은 결과를 tables, procedures, relationships,
+    procedure_calls, table_access 키로 반환합니다. 단, 테이블은 전체 컬럼 대신
+    프롬프트에 쓰이는 앞 10개 컬럼 이름만 column_names로 가져옵니다.
+    """
+    query = _scoped("""
+    CALL {
+        MATCH (t:Table)
+        WHERE {scope_t}
+        OPTIONAL MATCH (t)-[:HAS_COLUMN]->(c:Column)
+        WITH t, collect(c.name)[..10] as column_names
+        ORDER BY t.schema, t.name
+        RETURN collect({
+            id: elementId(t),
+            name: t.name,
+            schema: t.schema,
+            description: t.description,
+            table_type: t.table_type,
+            column_names: column_names
+        }) as tables
+    }
+    CALL {
+        MATCH (p)
+        WHERE (p:PROCEDURE OR p:FUNCTION OR p:TRIGGER)
+          AND {scope_p}
+        OPTIONAL MATCH (p)-[:FROM]->(rt:Table)
+        OPTIONAL MATCH (p)-[:WRITES]->(wt:Table)
+        WITH p,
+             collect(DISTINCT rt.name) as reads_tables,
+             collect(DISTINCT wt.name) as writes_tables
+        WITH {
+            id: elementId(p),
+            name: COALESCE(p.procedure_name, p.function_name, p.trigger_name, p.name),
+            type: labels(p)[0],
+            summary: p.summary,
+            file_name: p.file_name,
+            reads_tables: reads_tables,
+            writes_tables: writes_tables
+        } as proc_info
+        ORDER BY proc_info.name
+        RETURN collect(proc_info) as procedures
+    }
+    CALL {
+        MATCH (t1:Table)-[r:FK_TO_TABLE]->(t2:Table)
+        WHERE {scope_t1}
+        RETURN collect({
+            from_table: t1.name,
+            from_schema: t1.schema,
+            to_table: t2.name,
+            to_schema: t2.schema,
+            fk_column: r.column_name
+        }) as relationships
+    }
+    CALL {
+        MATCH (p1)-[r:CALL]->(p2)
+        WHERE (p1:PROCEDURE OR p1:FUNCTION OR p1:TRIGGER)
+          AND (p2:PROCEDURE OR p2:FUNCTION)
+          AND {scope_p1}
+        RETURN collect({
+            caller: COALESCE(p1.procedure_name, p1.function_name, p1.trigger_name, p1.name),
+            caller_type: labels(p1)[0],
+            callee: COALESCE(p2.procedure_name, p2.function_name, p2.name),
+            callee_type: labels(p2)[0]
+        }) as procedure_calls
+    }
+    CALL {
+        MATCH (p)-[r]->(t:Table)
+        WHERE (p:PROCEDURE OR p:FUNCTION OR p:TRIGGER)
+          AND type(r) IN ['FROM', 'WRITES']
+          AND {scope_p}
+        RETURN collect({
+            procedure: COALESCE(p.procedure_name, p.function_name, p.trigger_name, p.name),
+            procedure_type: labels(p)[0],
+            table_name: t.name,
+            access_type: type(r)
+        }) as table_access
+    }
+    RETURN tables, procedures, relationships, procedure_calls, table_access
+    """, user_id, project_name)
     with client.session() as session:
-        result = session.run(query, user_id=user_id, project_name=project_name)
-        return [dict(record["access_info"]) for record in result]
+        record = session.run(query, user_id=user_id, project_name=project_name).single()
+        return record.data()
 
 
 # =============================================================================
@@ -202,8 +348,13 @@ def get_procedure_table_access(client, user_id: str = None, project_name: str =
 # =============================================================================
 
 
+# 동시에 진행할 프로시저 분석 LLM 요청 수 상한
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "10"))
+
+
+@lru_cache(maxsize=1)
 def get_llm():
-    """Get configured LLM instance."""
+    """Get configured LLM instance (built once per process)."""
     provider = os.getenv("LLM_PROVIDER", "openai")
     model = os.getenv("LLM_MODEL", "gpt-4o")
     
@@ -215,6 +366,12 @@ def get_llm():
         return ChatOpenAI(model=model, temperature=0)
 
 
+@lru_cache(maxsize=None)
+def get_structured_llm(schema: type[BaseModel]):
+    """LLM bound to a structured-output schema, built once per schema."""
+    return get_llm().with_structured_output(schema)
+
+
 # Prompt Templates
 ANALYZE_LEGACY_SYSTEM_PROMPT = """당신은 레거시 시스템을 분석하여 Event Storming 모델을 도출하는 DDD(Domain-Driven Design) 전문가입니다.
 
@@ -284,6 +441,11 @@ class PolicyCandidate(BaseModel):
     bc_id: str
 
 
+class BCList(BaseModel):
+    """BC 식별 결과 - LLM이 반환"""
+    bounded_contexts: list[BoundedContextCandidate]
+
+
 class LegacyAnalysisResult(BaseModel):
     """레거시 분석 결과"""
     bounded_contexts: list[BoundedContextCandidate] = []
@@ -293,72 +455,80 @@ class LegacyAnalysisResult(BaseModel):
     policies: list[PolicyCandidate] = []
 
 
+# build_system_info 결과 길이 상한 (128k 토큰 모델의 컨텍스트 초과 방지)
+MAX_SYSTEM_INFO_CHARS = 80_000
+
+
 def build_system_info(
-    tables: list[dict], 
-    procedures: list[dict], 
-    relationships: list[dict],
-    procedure_calls: list[dict] = None,
-    table_access: list[dict] = None
+    tables: Iterable[dict], 
+    procedures: Iterable[dict], 
+    relationships: Iterable[dict],
+    procedure_calls: Iterable[dict] = None,
+    table_access: Iterable[dict] = None
 ) -> str:
-    """시스템 정보를 텍스트로 구성 (프로시저 summary 전체 포함)"""
-    lines = []
+    """시스템 정보를 텍스트로 구성 (프로시저 summary 전체 포함, 각 목록은 한 번만 순회)"""
+    out = io.StringIO()
     
     # 테이블 정보
-    lines.append("## 테이블 목록")
+    out.write("## 테이블 목록\n")
     for t in tables:
         schema = t.get("schema", "")
         name = t.get("name", "")
         desc = t.get("description", "")
         full_name = f"{schema}.{name}" if schema else name
-        lines.append(f"- {full_name}: {desc}")
+        out.write(f"- {full_name}: {desc}\n")
         
-        columns = t.get("columns", [])
-        if columns:
-            col_names = [c.get("name", "") for c in columns[:10]]  # 최대 10개
-            lines.append(f"  컬럼: {', '.join(col_names)}")
+        col_names = t.get("column_names")  # 최대 10개 (load_legacy_graph에서 잘라서 조회)
+        if col_names:
+            out.write(f"  컬럼: {', '.join(col_names)}\n")
     
-    lines.append("")
+    out.write("\n")
     
     # 테이블 관계
-    lines.append("## 테이블 관계 (FK)")
+    out.write("## 테이블 관계 (FK)\n")
     for r in relationships:
         from_t = r.get("from_table", "")
         to_t = r.get("to_table", "")
         fk_col = r.get("fk_column", "")
-        lines.append(f"- {from_t} → {to_t} ({fk_col})")
+        out.write(f"- {from_t} → {to_t} ({fk_col})\n")
     
-    lines.append("")
+    out.write("\n")
     
     # 프로시저 호출 관계 (시나리오 흐름 파악용)
     if procedure_calls:
-        lines.append("## 프로시저 호출 관계 (시나리오 흐름)")
+        out.write("## 프로시저 호출 관계 (시나리오 흐름)\n")
         for call in procedure_calls:
             caller = call.get("caller", "")
             callee = call.get("callee", "")
             caller_type = call.get("caller_type", "")
-            lines.append(f"- [{caller_type}] {caller} → {callee}")
-        lines.append("")
+            out.write(f"- [{caller_type}] {caller} → {callee}\n")
+        out.write("\n")
     
-    # 프로시저 정보 (summary 전체 포함)
-    lines.append("## 프로시저/함수 상세 정보")
+    # 프로시저 정보 (summary 전체 포함, 전체 길이가 예산을 넘으면 나머지는 생략)
+    out.write("## 프로시저/함수 상세 정보")
+    procedures = iter(procedures)
     for p in procedures:
+        if out.tell() >= MAX_SYSTEM_INFO_CHARS:
+            omitted = 1 + sum(1 for _ in procedures)
+            out.write(f"\n\n... (프로시저 {omitted}개 생략)")
+            break
+        
         name = p.get("name", "")
         ptype = p.get("type", "PROCEDURE")
         summary = p.get("summary", "") or ""
         reads = p.get("reads_tables", [])
         writes = p.get("writes_tables", [])
         
-        lines.append(f"\n### [{ptype}] {name}")
+        out.write(f"\n\n### [{ptype}] {name}")
         if summary:
             # summary 전체를 포함 (최대 2000자까지)
-            summary_text = summary[:2000] if len(summary) > 2000 else summary
-            lines.append(f"**설명**: {summary_text}")
+            out.write(f"\n**설명**: {summary[:2000]}")
         if reads:
-            lines.append(f"**읽기 테이블**: {', '.join(reads)}")
+            out.write(f"\n**읽기 테이블**: {', '.join(reads)}")
         if writes:
-            lines.append(f"**쓰기 테이블**: {', '.join(writes)}")
+            out.write(f"\n**쓰기 테이블**: {', '.join(writes)}")
     
-    return "\n".join(lines)
+    return out.getvalue()
 
 
 def build_procedure_detail_for_llm(procedure: dict) -> str:
@@ -392,10 +562,13 @@ class ProcedureAnalysisResult(BaseModel):
     business_rules: list[str] = []  # 비즈니스 규칙 목록
 
 
-async def analyze_procedure_with_llm(procedure: dict, llm, aggregates: list[AggregateCandidate]) -> ProcedureAnalysisResult:
+# 동일한 분석 프롬프트의 결과 재사용 (프롬프트 해시 → 결과, LRU)
+PROCEDURE_ANALYSIS_CACHE_SIZE = 4096
+_procedure_analysis_cache: OrderedDict[str, ProcedureAnalysisResult] = OrderedDict()
+
+
+async def analyze_procedure_with_llm(procedure: dict, aggregates: list[AggregateCandidate]) -> ProcedureAnalysisResult:
     """개별 프로시저를 LLM으로 분석하여 Command, Event, Policy 추출"""
-    from langchain_core.messages import HumanMessage, SystemMessage
-    
     summary = procedure.get("summary", "")
     if not summary:
         return ProcedureAnalysisResult()
@@ -440,12 +613,20 @@ async def analyze_procedure_with_llm(procedure: dict, llm, aggregates: list[Aggr
 Korean description은 그대로 유지하세요.
 """
 
-    structured_llm = llm.with_structured_output(ProcedureAnalysisResult)
     try:
-        result = structured_llm.invoke([
+        cache_key = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+        cached = _procedure_analysis_cache.get(cache_key)
+        if cached is not None:
+            _procedure_analysis_cache.move_to_end(cache_key)
+            return cached.model_copy(deep=True)
+        
+        result = await get_structured_llm(ProcedureAnalysisResult).ainvoke([
             SystemMessage(content="당신은 레거시 시스템의 스토어드 프로시저를 분석하여 DDD/Event Storming 요소를 도출하는 전문가입니다. 프로시저의 비즈니스 로직을 정확히 분석하여 의미있는 도메인 모델 요소를 추출합니다."),
             HumanMessage(content=prompt)
         ])
+        _procedure_analysis_cache[cache_key] = result
+        if len(_procedure_analysis_cache) > PROCEDURE_ANALYSIS_CACHE_SIZE:
+            _procedure_analysis_cache.popitem(last=False)
         return result
     except Exception as e:
         print(f"프로시저 분석 오류 ({proc_name}): {e}")
@@ -460,10 +641,6 @@ async def extract_event_storming_from_legacy(
     progress_callback = None,
 ) -> LegacyAnalysisResult:
     """레거시 시스템 정보에서 Event Storming 요소 추출 (개선된 버전)"""
-    from langchain_core.messages import HumanMessage, SystemMessage
-    
-    llm = get_llm()
-    
     system_info = build_system_info(tables, procedures, relationships, procedure_calls)
     
     # Step 1: BC 식별
@@ -480,11 +657,7 @@ async def extract_event_storming_from_legacy(
 JSON 형식으로 응답:
 """
 
-    class BCList(BaseModel):
-        bounded_contexts: list[BoundedContextCandidate]
-
-    structured_llm = llm.with_structured_output(BCList)
-    bc_response = structured_llm.invoke([
+    bc_response = await get_structured_llm(BCList).ainvoke([
         SystemMessage(content="당신은 DDD 전문가입니다. 레거시 시스템을 분석하여 Bounded Context를 식별합니다."),
         HumanMessage(content=bc_prompt)
     ])
@@ -492,15 +665,19 @@ JSON 형식으로 응답:
     bounded_contexts = bc_response.bounded_contexts
     
     # Step 2: Aggregate 도출 (테이블 기반)
+    tables_by_name = {}
+    for t in tables:
+        tables_by_name.setdefault(t.get("name"), t)
+    
     aggregates = []
     for bc in bounded_contexts:
         for table_name in bc.table_names:
             # 테이블 이름을 Aggregate 이름으로 변환
-            agg_name = "".join(word.capitalize() for word in table_name.replace("_", " ").split())
+            agg_name = _to_pascal_case(table_name)
             agg_id = f"AGG-{bc.id.replace('BC-', '')}-{agg_name.upper()}"
             
             # 테이블 설명 찾기
-            table_info = next((t for t in tables if t.get("name") == table_name), None)
+            table_info = tables_by_name.get(table_name)
             table_desc = table_info.get("description", "") if table_info else ""
             
             aggregates.append(AggregateCandidate(
@@ -513,6 +690,16 @@ JSON 형식으로 응답:
             ))
     
     # Step 3: 프로시저별 상세 분석으로 Command/Event/Policy 도출
+    # 조회용 인덱스 (중복 시 먼저 나온 항목 우선, 기존 next() 탐색과 동일)
+    agg_by_table = {}
+    for a in aggregates:
+        agg_by_table.setdefault(a.source_table, a)
+    bc_by_proc = {}
+    for bc in bounded_contexts:
+        for name in bc.procedure_names:
+            bc_by_proc.setdefault(name, bc)
+    cmd_by_lower_name = {}
+    
     commands = []
     events = []
     policies = []
@@ -520,55 +707,54 @@ JSON 형식으로 응답:
     # summary가 있는 프로시저만 분석
     procs_with_summary = [p for p in procedures if p.get("summary")]
     
-    for i, proc in enumerate(procs_with_summary):
-        proc_name = proc.get("name", "")
-        
+    # LLM 상세 분석은 동시에 실행 (세마포어로 동시 요청 수 제한)
+    semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+    done = 0
+    
+    async def analyze(proc: dict) -> ProcedureAnalysisResult:
+        nonlocal done
+        async with semaphore:
+            analysis = await analyze_procedure_with_llm(proc, aggregates)
+        done += 1
         if progress_callback:
-            await progress_callback(f"프로시저 분석 중: {proc_name} ({i+1}/{len(procs_with_summary)})")
-        
-        # LLM으로 상세 분석
-        analysis = await analyze_procedure_with_llm(proc, llm, aggregates)
+            await progress_callback(f"프로시저 분석 완료: {proc.get('name', '')} ({done}/{len(procs_with_summary)})")
+        return analysis
+    
+    analyses = await asyncio.gather(*(analyze(proc) for proc in procs_with_summary))
+    
+    # 결과는 프로시저 순서대로 반영 (Event의 Command 매칭이 순서에 의존)
+    for proc, analysis in zip(procs_with_summary, analyses):
+        proc_name = proc.get("name", "")
         
         # 프로시저가 속한 BC 찾기
-        proc_bc = None
-        for bc in bounded_contexts:
-            if proc_name in bc.procedure_names:
-                proc_bc = bc
-                break
+        proc_bc = bc_by_proc.get(proc_name)
         
         if not proc_bc and bounded_contexts:
             proc_bc = bounded_contexts[0]  # 기본 BC
         
         bc_prefix = proc_bc.id.replace("BC-", "") if proc_bc else "DEFAULT"
         
+        # 쓰기 테이블에서 Aggregate 찾기 (프로시저의 모든 Command가 공유)
+        agg_id = next(
+            (agg_by_table[table].id for table in proc.get("writes_tables", []) if table in agg_by_table),
+            aggregates[0].id if aggregates else ""
+        )
+        
         # 분석된 Command 추가
         for cmd_data in analysis.commands:
             cmd_name = cmd_data.get("name", _derive_command_name(proc_name))
             cmd_id = f"CMD-{bc_prefix}-{cmd_name.upper().replace(' ', '')}"
             
-            # 쓰기 테이블에서 Aggregate 찾기
-            writes = proc.get("writes_tables", [])
-            agg_id = ""
-            for table in writes:
-                matching_agg = next(
-                    (a for a in aggregates if a.source_table == table),
-                    None
-                )
-                if matching_agg:
-                    agg_id = matching_agg.id
-                    break
-            
-            if not agg_id and aggregates:
-                agg_id = aggregates[0].id
-            
-            commands.append(CommandCandidate(
+            cmd = CommandCandidate(
                 id=cmd_id,
                 name=cmd_name,
                 actor=cmd_data.get("actor", "system"),
                 description=cmd_data.get("description", f"프로시저 {proc_name}에서 도출"),
                 aggregate_id=agg_id,
                 source_procedure=proc_name
-            ))
+            )
+            commands.append(cmd)
+            cmd_by_lower_name.setdefault(cmd_name.lower(), cmd)
         
         # 분석된 Event 추가
         for evt_data in analysis.events:
@@ -577,12 +763,14 @@ JSON 형식으로 응답:
                 continue
             evt_id = f"EVT-{bc_prefix}-{evt_name.upper().replace(' ', '')}"
             
-            # 관련 Command 찾기
-            trigger_cmd = evt_data.get("trigger_command", "")
-            related_cmd = next(
-                (c for c in commands if trigger_cmd and trigger_cmd.lower() in c.name.lower()),
-                commands[-1] if commands else None
-            )
+            # 관련 Command 찾기 (이름 일치 → 부분 일치 → 마지막 Command)
+            trigger_cmd = evt_data.get("trigger_command", "").lower()
+            related_cmd = cmd_by_lower_name.get(trigger_cmd) if trigger_cmd else None
+            if related_cmd is None:
+                related_cmd = next(
+                    (c for c in commands if trigger_cmd and trigger_cmd in c.name.lower()),
+                    commands[-1] if commands else None
+                )
             cmd_id = related_cmd.id if related_cmd else ""
             
             events.append(EventCandidate(
@@ -607,9 +795,6 @@ JSON 형식으로 응답:
                 invoke_command=pol_data.get("then", ""),
                 bc_id=proc_bc.id if proc_bc else ""
             ))
-        
-        # 짧은 대기 (API 속도 제한 대응)
-        await asyncio.sleep(0.5)
     
     # Step 4: 프로시저 호출 관계에서 추가 Policy 도출
     if procedure_calls:
@@ -641,18 +826,17 @@ JSON 형식으로 응답:
     )
 
 
+_PROC_PREFIX_RE = re.compile(r"^(?:SP|PROC|PKG|P)_", re.IGNORECASE)
+
+
+def _to_pascal_case(name: str) -> str:
+    """ORDER_ITEMS → OrderItems"""
+    return "".join(map(str.capitalize, name.replace("_", " ").split()))
+
+
 def _derive_command_name(proc_name: str) -> str:
-    """프로시저 이름에서 Command 이름 도출"""
-    # 일반적인 접두사 제거
-    name = proc_name.upper()
-    for prefix in ["SP_", "PROC_", "PKG_", "P_"]:
-        if name.startswith(prefix):
-            name = name[len(prefix):]
-            break
-    
-    # 단어 분리 및 PascalCase 변환
-    words = name.replace("_", " ").split()
-    return "".join(word.capitalize() for word in words)
+    """프로시저 이름에서 Command 이름 도출 (일반적인 접두사 제거 후 PascalCase)"""
+    return _to_pascal_case(_PROC_PREFIX_RE.sub("", proc_name, count=1))
 
 
 def _derive_event_name(cmd_name: str) -> str:
@@ -679,12 +863,162 @@ class LegacyAnalysisSession:
     project_name: Optional[str] = None
     status: LegacyAnalysisPhase = LegacyAnalysisPhase.LOADING
     progress: int = 0
-    events: list[dict] = field(default_factory=list)
+    events: list[str] = field(default_factory=list)  # Serialized ProgressEvent payloads
     result: Optional[LegacyAnalysisResult] = None
     error: Optional[str] = None
+    is_workflow_running: bool = False
+    last_active: float = field(default_factory=time.monotonic)
+
+
+# 세션 보존 시간 (초) 및 워커당 메모리에 유지하는 세션 수 상한
+LEGACY_SESSION_TTL_SECONDS = 3600
+LEGACY_SESSION_MAX_ENTRIES = 256
+LEGACY_SESSION_ID_PATTERN = re.compile(r"[0-9a-f]{8}")
+LEGACY_FINAL_PHASES = (LegacyAnalysisPhase.COMPLETE, LegacyAnalysisPhase.ERROR)
 
 
-_sessions: dict[str, LegacyAnalysisSession] = {}
+class LegacySessionStore:
+    """
+    레거시 분석 세션을 세션별 JSON 파일로 공유하는 저장소.
+    
+    uvicorn --workers N 처럼 여러 워커가 뜬 경우에도 /analyze 를 받은 워커와
+    /stream, /session/{id}/result 를 받은 워커가 같은 세션을 볼 수 있습니다.
+    """
+    
+    def __init__(self, directory: Path, ttl_seconds: float):
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+    
+    def _path(self, session_id: str) -> Path:
+        return self.directory / f"{session_id}.json"
+    
+    def save(self, session: LegacyAnalysisSession):
+        data = {
+            "id": session.id,
+            "user_id": session.user_id,
+            "project_name": session.project_name,
+            "status": session.status.value,
+            "progress": session.progress,
+            "events": session.events,
+            "result": session.result.model_dump() if session.result else None,
+            "error": session.error,
+            "saved_at": time.time()
+        }
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = self._path(session.id).with_suffix(".tmp")
+            tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            tmp.replace(self._path(session.id))
+        except OSError as e:
+            print(f"⚠️ Legacy session save failed ({session.id}): {e}")
+    
+    def load(self, session_id: str) -> Optional[LegacyAnalysisSession]:
+        if not LEGACY_SESSION_ID_PATTERN.fullmatch(session_id):
+            return None
+        path = self._path(session_id)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        
+        if time.time() - data.get("saved_at", 0) > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            return None
+        
+        return LegacyAnalysisSession(
+            id=data["id"],
+            user_id=data.get("user_id"),
+            project_name=data.get("project_name"),
+            status=LegacyAnalysisPhase(data["status"]),
+            progress=data["progress"],
+            events=data.get("events", []),
+            result=LegacyAnalysisResult(**data["result"]) if data.get("result") else None,
+            error=data.get("error")
+        )
+    
+    def remove(self, session_id: str):
+        if LEGACY_SESSION_ID_PATTERN.fullmatch(session_id):
+            self._path(session_id).unlink(missing_ok=True)
+
+
+class LegacySessionRegistry:
+    """
+    워커 메모리의 레거시 분석 세션 (공유 저장소 앞단의 캐시).
+    
+    유휴 세션은 TTL이 지나면, 상한을 넘으면 오래 사용하지 않은 순서로
+    메모리에서 제거됩니다. 실행 중인 세션은 제거하지 않습니다.
+    다른 워커에서 진행 중일 수 있는 세션(이 워커가 실행 중이지 않고 아직 끝나지 않은 세션)은
+    조회할 때마다 공유 저장소에서 다시 읽습니다.
+    모든 메서드가 await 없이 이벤트 루프 스레드에서 끝나므로 lock이 필요 없습니다.
+    """
+    
+    def __init__(self, max_entries: int, ttl_seconds: float, store: LegacySessionStore):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.store = store
+        self._sessions: OrderedDict[str, LegacyAnalysisSession] = OrderedDict()
+    
+    def _is_expired(self, session: LegacyAnalysisSession, now: float) -> bool:
+        return not session.is_workflow_running and now - session.last_active > self.ttl_seconds
+    
+    def _evict(self):
+        now = time.monotonic()
+        for sid in [sid for sid, s in self._sessions.items() if self._is_expired(s, now)]:
+            self._sessions.pop(sid, None)
+        
+        overflow = len(self._sessions) - self.max_entries
+        if overflow > 0:
+            idle = [sid for sid, s in self._sessions.items() if not s.is_workflow_running]
+            for sid in idle[:overflow]:
+                self._sessions.pop(sid, None)
+    
+    def get(self, session_id: str) -> Optional[LegacyAnalysisSession]:
+        """세션 조회 (이 워커에 없으면 공유 저장소에서 로드)"""
+        session = self._sessions.get(session_id)
+        now = time.monotonic()
+        if session is not None and self._is_expired(session, now):
+            self._sessions.pop(session_id, None)
+            session = None
+        
+        if session is not None and not session.is_workflow_running and session.status not in LEGACY_FINAL_PHASES:
+            # 다른 워커가 진행 중인 세션일 수 있으므로 메모리 사본 대신 저장소 기준으로 갱신
+            session = self.store.load(session_id)
+            if session is None:
+                self._sessions.pop(session_id, None)
+                return None
+            self._sessions[session_id] = session
+        
+        if session is None:
+            session = self.store.load(session_id)
+            if session is None:
+                return None
+            self._evict()
+            self._sessions[session_id] = session
+        
+        session.last_active = now
+        self._sessions.move_to_end(session_id)
+        return session
+    
+    def create(self, user_id: Optional[str], project_name: Optional[str]) -> LegacyAnalysisSession:
+        self._evict()
+        session = LegacyAnalysisSession(
+            id=str(uuid.uuid4())[:8],
+            user_id=user_id,
+            project_name=project_name
+        )
+        self._sessions[session.id] = session
+        self.store.save(session)
+        return session
+    
+    def remove(self, session_id: str):
+        self._sessions.pop(session_id, None)
+        self.store.remove(session_id)
+
+
+_session_store = LegacySessionStore(
+    Path(__file__).parent.parent / ".cache" / "legacy_sessions", LEGACY_SESSION_TTL_SECONDS
+)
+_registry = LegacySessionRegistry(LEGACY_SESSION_MAX_ENTRIES, LEGACY_SESSION_TTL_SECONDS, _session_store)
 
 
 async def run_legacy_analysis_workflow(
@@ -707,7 +1041,8 @@ async def run_legacy_analysis_workflow(
             progress=5
         )
         
-        tables = get_legacy_tables(client, session.user_id, session.project_name)
+        legacy = await asyncio.to_thread(load_legacy_graph, client, session.user_id, session.project_name)
+        tables = legacy["tables"]
         
         yield ProgressEvent(
             phase=LegacyAnalysisPhase.ANALYZING_TABLES,
@@ -715,7 +1050,6 @@ async def run_legacy_analysis_workflow(
             progress=10,
             data={"table_count": len(tables)}
         )
-        await asyncio.sleep(0.2)
         
         # Phase 2: 프로시저 정보 로드
         yield ProgressEvent(
@@ -724,13 +1058,11 @@ async def run_legacy_analysis_workflow(
             progress=15
         )
         
-        procedures = get_legacy_procedures(client, session.user_id, session.project_name)
-        relationships = get_table_relationships(client, session.user_id, session.project_name)
+        procedures = legacy["procedures"]
+        relationships = legacy["relationships"]
+        procedure_calls = legacy["procedure_calls"]
         
-        # 프로시저 호출 관계 조회
-        procedure_calls = get_procedure_calls(client, session.user_id, session.project_name)
-        
-        procs_with_summary = len([p for p in procedures if p.get("summary")])
+        procs_with_summary = sum(1 for p in procedures if p.get("summary"))
         
         yield ProgressEvent(
             phase=LegacyAnalysisPhase.ANALYZING_PROCEDURES,
@@ -743,7 +1075,6 @@ async def run_legacy_analysis_workflow(
                 "call_count": len(procedure_calls)
             }
         )
-        await asyncio.sleep(0.2)
         
         # 데이터가 없으면 에러
         if not tables and not procedures:
@@ -779,9 +1110,8 @@ async def run_legacy_analysis_workflow(
                 phase=LegacyAnalysisPhase.IDENTIFYING_BC,
                 message=f"BC 식별: {bc.name}",
                 progress=45,
-                data={"type": "BoundedContext", "object": bc.model_dump()}
+                data={"type": "BoundedContext", "object": bc}
             )
-            await asyncio.sleep(0.15)
         
         # Aggregate 생성
         yield ProgressEvent(
@@ -795,9 +1125,8 @@ async def run_legacy_analysis_workflow(
                 phase=LegacyAnalysisPhase.EXTRACTING_AGGREGATES,
                 message=f"Aggregate: {agg.name}",
                 progress=55,
-                data={"type": "Aggregate", "object": agg.model_dump()}
+                data={"type": "Aggregate", "object": agg}
             )
-            await asyncio.sleep(0.1)
         
         # Command 생성
         yield ProgressEvent(
@@ -811,9 +1140,8 @@ async def run_legacy_analysis_workflow(
                 phase=LegacyAnalysisPhase.EXTRACTING_COMMANDS,
                 message=f"Command: {cmd.name}",
                 progress=70,
-                data={"type": "Command", "object": cmd.model_dump()}
+                data={"type": "Command", "object": cmd}
             )
-            await asyncio.sleep(0.1)
         
         # Event 생성
         yield ProgressEvent(
@@ -827,9 +1155,8 @@ async def run_legacy_analysis_workflow(
                 phase=LegacyAnalysisPhase.EXTRACTING_EVENTS,
                 message=f"Event: {evt.name}",
                 progress=85,
-                data={"type": "Event", "object": evt.model_dump()}
+                data={"type": "Event", "object": evt}
             )
-            await asyncio.sleep(0.1)
         
         # Phase 4: Neo4j에 저장
         yield ProgressEvent(
@@ -865,42 +1192,49 @@ async def run_legacy_analysis_workflow(
         )
 
 
+# Event Storming 저장 시 동시에 실행하는 Neo4j 쓰기 트랜잭션 수 상한
+NEO4J_WRITE_CONCURRENCY = 8
+
+
 async def save_event_storming_to_neo4j(client, result: LegacyAnalysisResult):
-    """추출된 Event Storming 모델을 Neo4j에 저장"""
-    
-    # BC 저장
-    for bc in result.bounded_contexts:
-        client.create_bounded_context(
-            id=bc.id,
-            name=bc.name,
-            description=bc.description
-        )
+    """
+    추출된 Event Storming 모델을 Neo4j에 저장 (유형별 UNWIND 일괄 저장)
+
+    BC → Aggregate → Command → Event 순서는 지키되, 같은 단계의 BC/Aggregate별
+    묶음은 스레드에서 동시에 실행하여 이벤트 루프를 막지 않습니다.
+    """
+    semaphore = asyncio.Semaphore(NEO4J_WRITE_CONCURRENCY)
     
-    # Aggregate 저장
-    for agg in result.aggregates:
-        client.create_aggregate(
-            id=agg.id,
-            name=agg.name,
-            bc_id=agg.bc_id,
-            root_entity=agg.root_entity
-        )
+    async def run(fn, *args):
+        async with semaphore:
+            return await asyncio.to_thread(fn, *args)
     
-    # Command 저장
-    for cmd in result.commands:
-        client.create_command(
-            id=cmd.id,
-            name=cmd.name,
-            aggregate_id=cmd.aggregate_id,
-            actor=cmd.actor
-        )
-    
-    # Event 저장
-    for evt in result.events:
-        client.create_event(
-            id=evt.id,
-            name=evt.name,
-            command_id=evt.command_id
-        )
+    try:
+        # BC 저장
+        await run(client.create_bounded_contexts_bulk, [bc.model_dump() for bc in result.bounded_contexts])
+        
+        # Aggregate 저장 (BC 단위: 다른 BC 소속 여부 검사 포함)
+        aggregates_by_bc: dict[str, list[dict]] = {}
+        for agg in result.aggregates:
+            aggregates_by_bc.setdefault(agg.bc_id, []).append(agg.model_dump())
+        await asyncio.gather(*(
+            run(client.create_aggregates_bulk, bc_id, aggregates)
+            for bc_id, aggregates in aggregates_by_bc.items()
+        ))
+        
+        # Command 저장 (Aggregate 단위)
+        commands_by_agg: dict[str, list[dict]] = {}
+        for cmd in result.commands:
+            commands_by_agg.setdefault(cmd.aggregate_id, []).append(cmd.model_dump())
+        await asyncio.gather(*(
+            run(client.create_commands_bulk, aggregate_id, commands)
+            for aggregate_id, commands in commands_by_agg.items()
+        ))
+        
+        # Event 저장
+        await run(client.create_events_bulk, [evt.model_dump() for evt in result.events])
+    finally:
+        invalidate_event_triggers_cache()
 
 
 # =============================================================================
@@ -908,63 +1242,64 @@ async def save_event_storming_to_neo4j(client, result: LegacyAnalysisResult):
 # =============================================================================
 
 
-async def generate_prd_from_legacy(
+# PRD 프롬프트에 포함하는 테이블/프로시저 수
+PRD_MAX_TABLES = 30
+PRD_MAX_PROCEDURES = 15
+
+# 프롬프트 해시 → 생성된 PRD (같은 프로젝트로 반복 요청 시 LLM 재호출 생략)
+PRD_CACHE_SIZE = 64
+_prd_cache: OrderedDict[str, str] = OrderedDict()
+
+
+def _build_prd_messages(
     tables: list[dict],
     procedures: list[dict],
-    relationships: list[dict],
     procedure_calls: list[dict] = None,
-) -> str:
-    """레거시 시스템 정보에서 PRD(요구사항 문서) 생성"""
-    from langchain_core.messages import HumanMessage, SystemMessage
-    
-    llm = get_llm()
-    
-    # 프로시저 상세 정보 구성 (summary 전체 포함)
+) -> list:
+    """PRD 생성용 LLM 메시지 구성"""
+    # 프로시저 상세 정보 구성 (summary가 있는 프로시저 중 읽기/쓰기 테이블이 많은 15개만 포맷)
+    procs_with_summary = [p for p in procedures if p.get("summary")]
+    top_procs = heapq.nlargest(
+        PRD_MAX_PROCEDURES,
+        procs_with_summary,
+        key=lambda p: len(p["reads_tables"]) + len(p["writes_tables"])
+    )
     proc_details = []
-    for p in procedures:
-        name = p.get("name", "")
-        ptype = p.get("type", "PROCEDURE")
-        summary = p.get("summary", "") or ""
-        reads = p.get("reads_tables", [])
-        writes = p.get("writes_tables", [])
-        
-        if summary:  # summary가 있는 프로시저만 상세 분석
-            proc_details.append(f"""
-### [{ptype}] {name}
-**기능 설명**: {summary[:3000]}
+    # load_legacy_graph가 돌려주는 레코드는 키가 항상 채워져 있으므로 .get() 없이 바로 꺼냄
+    for p in top_procs:
+        reads = p["reads_tables"]
+        writes = p["writes_tables"]
+        proc_details.append(f"""
+### [{p["type"]}] {p["name"]}
+**기능 설명**: {p["summary"][:3000]}
 **읽기 테이블**: {', '.join(reads) if reads else '없음'}
 **쓰기 테이블**: {', '.join(writes) if writes else '없음'}
 """)
     
-    # 테이블 정보 구성
+    # 테이블 정보 구성 (프롬프트에 들어가는 30개만 포맷)
     table_info = []
-    for t in tables:
-        name = t.get("name", "")
-        desc = t.get("description", "")
-        cols = t.get("columns", [])
-        col_names = [c.get("name", "") for c in cols[:10]]
-        table_info.append(f"- {name}: {desc} (컬럼: {', '.join(col_names)})")
+    for t in tables[:PRD_MAX_TABLES]:
+        table_info.append(f"- {t['name']}: {t['description']} (컬럼: {', '.join(t['column_names'])})")
     
     # 호출 관계 구성
-    call_info = []
-    if procedure_calls:
-        for call in procedure_calls:
-            caller = call.get("caller", "")
-            callee = call.get("callee", "")
-            call_info.append(f"- {caller} → {callee}")
+    call_info = [f"- {call['caller']} → {call['callee']}" for call in procedure_calls or ()]
+    
+    tables_block = "\n".join(table_info)
+    calls_block = "\n".join(call_info) if call_info else "(호출 관계 없음)"
+    procs_block = "\n".join(proc_details)
     
     prompt = f"""당신은 레거시 시스템을 분석하여 현대적인 요구사항 문서(PRD)를 작성하는 전문가입니다.
 
 ## 레거시 시스템 정보
 
 ### 테이블 목록 ({len(tables)}개)
-{chr(10).join(table_info[:30])}
+{tables_block}
 
 ### 프로시저 호출 관계
-{chr(10).join(call_info) if call_info else '(호출 관계 없음)'}
+{calls_block}
 
-### 프로시저/함수 상세 정보 ({len(proc_details)}개)
-{chr(10).join(proc_details[:15])}
+### 프로시저/함수 상세 정보 ({len(procs_with_summary)}개)
+{procs_block}
 
 ---
 
@@ -1013,12 +1348,52 @@ async def generate_prd_from_legacy(
 요구사항 문서를 작성하세요:
 """
 
-    response = llm.invoke([
+    return [
         SystemMessage(content="당신은 레거시 시스템 분석 및 현대화 전문가입니다. 레거시 시스템의 프로시저와 테이블 구조를 분석하여 비즈니스 관점의 요구사항 문서를 작성합니다."),
         HumanMessage(content=prompt)
-    ])
+    ]
+
+
+async def stream_prd_from_legacy(
+    tables: list[dict],
+    procedures: list[dict],
+    relationships: list[dict],
+    procedure_calls: list[dict] = None,
+) -> AsyncGenerator[str, None]:
+    """레거시 시스템 정보에서 PRD(요구사항 문서)를 토큰 단위로 스트리밍 생성"""
+    messages = _build_prd_messages(tables, procedures, procedure_calls)
+    cache_key = hashlib.blake2b(messages[-1].content.encode(), digest_size=16).hexdigest()
+    cached = _prd_cache.get(cache_key)
+    if cached is not None:
+        _prd_cache.move_to_end(cache_key)
+        yield cached
+        return
     
-    return response.content
+    parts = []
+    async for chunk in get_llm().astream(messages):
+        if chunk.content:
+            parts.append(chunk.content)
+            yield chunk.content
+    
+    # 스트림을 끝까지 받은 경우에만 캐시
+    _prd_cache[cache_key] = "".join(parts)
+    if len(_prd_cache) > PRD_CACHE_SIZE:
+        _prd_cache.popitem(last=False)
+
+
+async def generate_prd_from_legacy(
+    tables: list[dict],
+    procedures: list[dict],
+    relationships: list[dict],
+    procedure_calls: list[dict] = None,
+) -> str:
+    """레거시 시스템 정보에서 PRD(요구사항 문서) 생성"""
+    parts = [
+        token async for token in stream_prd_from_legacy(
+            tables, procedures, relationships, procedure_calls
+        )
+    ]
+    return "".join(parts)
 
 
 class PRDGenerationRequest(BaseModel):
@@ -1060,10 +1435,11 @@ async def generate_prd(
     
     try:
         # 레거시 데이터 조회
-        tables = get_legacy_tables(client, user_id, project_name)
-        procedures = get_legacy_procedures(client, user_id, project_name)
-        relationships = get_table_relationships(client, user_id, project_name)
-        procedure_calls = get_procedure_calls(client, user_id, project_name)
+        legacy = await asyncio.to_thread(load_legacy_graph, client, user_id, project_name)
+        tables = legacy["tables"]
+        procedures = legacy["procedures"]
+        relationships = legacy["relationships"]
+        procedure_calls = legacy["procedure_calls"]
         
         if not tables and not procedures:
             return PRDGenerationResponse(
@@ -1078,7 +1454,7 @@ async def generate_prd(
                 message="분석할 레거시 시스템 데이터가 없습니다. 먼저 robo-analyzer로 분석을 실행하세요."
             )
         
-        procs_with_summary = len([p for p in procedures if p.get("summary")])
+        procs_with_summary = sum(1 for p in procedures if p.get("summary"))
         
         # PRD 생성
         prd_content = await generate_prd_from_legacy(
@@ -1107,6 +1483,62 @@ async def generate_prd(
         )
 
 
+@router.post("/generate-prd/stream")
+async def generate_prd_stream(
+    user_id: Optional[str] = Query(None, description="사용자 ID"),
+    project_name: Optional[str] = Query(None, description="프로젝트 이름")
+):
+    """
+    PRD 문서를 SSE로 스트리밍 생성합니다.
+    
+    **이벤트:**
+    - `summary`: 분석 대상 레거시 데이터 요약 (source_summary)
+    - `token`: 생성 중인 PRD 텍스트 조각
+    - `done`: 생성 완료 메시지
+    - `error`: 오류 메시지
+    """
+    client = get_neo4j_client()
+
+    async def event_generator():
+        try:
+            legacy = await asyncio.to_thread(load_legacy_graph, client, user_id, project_name)
+            tables = legacy["tables"]
+            procedures = legacy["procedures"]
+            relationships = legacy["relationships"]
+            procedure_calls = legacy["procedure_calls"]
+
+            if not tables and not procedures:
+                yield {
+                    "event": "error",
+                    "data": "분석할 레거시 시스템 데이터가 없습니다. 먼저 robo-analyzer로 분석을 실행하세요."
+                }
+                return
+
+            procs_with_summary = sum(1 for p in procedures if p.get("summary"))
+            source_summary = {
+                "tables": len(tables),
+                "procedures": len(procedures),
+                "procedures_with_summary": procs_with_summary,
+                "relationships": len(relationships),
+                "procedure_calls": len(procedure_calls) if procedure_calls else 0
+            }
+            yield {"event": "summary", "data": json.dumps(source_summary)}
+
+            async for token in stream_prd_from_legacy(
+                tables, procedures, relationships, procedure_calls
+            ):
+                yield {"event": "token", "data": token}
+
+            yield {
+                "event": "done",
+                "data": f"PRD 문서가 생성되었습니다. ({len(tables)}개 테이블, {procs_with_summary}개 프로시저 summary 분석)"
+            }
+        except Exception as e:
+            yield {"event": "error", "data": f"PRD 생성 오류: {str(e)}"}
+
+    return EventSourceResponse(event_generator())
+
+
 @router.get("/tables")
 async def get_tables(
     user_id: Optional[str] = Query(None, description="사용자 ID"),
@@ -1117,7 +1549,7 @@ async def get_tables(
     robo-analyzer에서 분석한 테이블 목록을 반환합니다.
     """
     client = get_neo4j_client()
-    return get_legacy_tables(client, user_id, project_name)
+    return await asyncio.to_thread(list, get_legacy_tables(client, user_id, project_name))
 
 
 @router.get("/procedures")
@@ -1130,7 +1562,7 @@ async def get_procedures(
     robo-analyzer에서 분석한 스토어드 프로시저 목록을 반환합니다.
     """
     client = get_neo4j_client()
-    return get_legacy_procedures(client, user_id, project_name)
+    return await asyncio.to_thread(list, get_legacy_procedures(client, user_id, project_name))
 
 
 @router.get("/relationships")
@@ -1142,7 +1574,7 @@ async def get_relationships(
     Neo4j에서 테이블 관계(FK) 조회
     """
     client = get_neo4j_client()
-    return get_table_relationships(client, user_id, project_name)
+    return await asyncio.to_thread(list, get_table_relationships(client, user_id, project_name))
 
 
 @router.get("/summary")
@@ -1156,33 +1588,23 @@ async def get_legacy_summary(
     """
     client = get_neo4j_client()
     
-    tables = get_legacy_tables(client, user_id, project_name)
-    procedures = get_legacy_procedures(client, user_id, project_name)
-    relationships = get_table_relationships(client, user_id, project_name)
-    
-    # 테이블 타입별 분류
-    table_types = {}
-    for t in tables:
-        ttype = t.get("table_type", "UNKNOWN")
-        table_types[ttype] = table_types.get(ttype, 0) + 1
-    
-    # 프로시저 타입별 분류
-    proc_types = {}
-    for p in procedures:
-        ptype = p.get("type", "UNKNOWN")
-        proc_types[ptype] = proc_types.get(ptype, 0) + 1
+    counts = await asyncio.to_thread(get_legacy_counts, client, user_id, project_name)
+    table_types = counts["table_types"]
+    proc_types = counts["proc_types"]
+    table_total = sum(table_types.values())
+    proc_total = sum(proc_types.values())
     
     return {
-        "hasLegacyData": len(tables) > 0 or len(procedures) > 0,
+        "hasLegacyData": table_total > 0 or proc_total > 0,
         "tables": {
-            "total": len(tables),
+            "total": table_total,
             "byType": table_types
         },
         "procedures": {
-            "total": len(procedures),
+            "total": proc_total,
             "byType": proc_types
         },
-        "relationships": len(relationships)
+        "relationships": counts["relationships"]
     }
 
 
@@ -1197,13 +1619,8 @@ async def start_legacy_analysis(
     
     반환된 session_id로 /stream/{session_id}에 연결하여 진행상황을 스트리밍 받습니다.
     """
-    session_id = str(uuid.uuid4())[:8]
-    session = LegacyAnalysisSession(
-        id=session_id,
-        user_id=user_id,
-        project_name=project_name
-    )
-    _sessions[session_id] = session
+    session = _registry.create(user_id, project_name)
+    session_id = session.id
     
     return {
         "session_id": session_id,
@@ -1217,18 +1634,42 @@ async def stream_analysis(session_id: str):
     """
     SSE 스트림으로 분석 진행상황 수신
     """
-    session = _sessions.get(session_id)
+    session = _registry.get(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
     async def event_generator():
-        async for event in run_legacy_analysis_workflow(session):
-            event_dict = event.model_dump()
-            session.events.append(event_dict)
-            yield {
-                "event": "progress",
-                "data": json.dumps(event_dict)
-            }
+        # 이미 시작된 세션(다른 워커에서 실행 중이거나 완료됨)은 저장된 이벤트만 재전송
+        if session.events:
+            for payload in list(session.events):
+                yield {"event": "progress", "data": payload}
+            return
+        
+        session.is_workflow_running = True
+        try:
+            async for event in run_legacy_analysis_workflow(session):
+                phase_changed = event.phase != session.status or not session.events
+                session.status = event.phase
+                session.progress = event.progress
+                if event.phase == LegacyAnalysisPhase.ERROR:
+                    session.error = event.message
+                payload = event.model_dump_json()
+                session.events.append(payload)
+                if phase_changed:
+                    await asyncio.to_thread(_session_store.save, session)
+                yield {
+                    "event": "progress",
+                    "data": payload
+                }
+        finally:
+            session.is_workflow_running = False
+            session.last_active = time.monotonic()
+            # 클라이언트가 중간에 끊으면 워크플로우도 중단되므로 세션을 정리
+            if session.status not in LEGACY_FINAL_PHASES:
+                _registry.remove(session_id)
+            else:
+                # 연결이 끊겨 취소되더라도 마지막 저장은 끝까지 수행
+                await asyncio.shield(asyncio.to_thread(_session_store.save, session))
     
     return EventSourceResponse(event_generator())
 
@@ -1238,7 +1679,7 @@ async def get_session_result(session_id: str) -> dict:
     """
     분석 세션 결과 조회
     """
-    session = _sessions.get(session_id)
+    session = _registry.get(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
@@ -12,15 +12,16 @@ from __future__ import annotations
 import os
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from neo4j import GraphDatabase
+from neo4j import READ_ACCESS, GraphDatabase, Session
 from pydantic import BaseModel
 
 from agent.neo4j_client import get_neo4j_client
+from api.graph_cache import cache_event_triggers, get_cached_event_triggers, invalidate_event_triggers_cache
 
 # Load .env from project root
 env_path = Path(__file__).parent.parent / ".env"
@@ -30,6 +31,8 @@ load_dotenv(env_path)
 NEO4J_URI = os.getenv("NEO4J_URI", "bolt://localhost:7687")
 NEO4J_USER = os.getenv("NEO4J_USER", "neo4j")
 NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "12345analyzer")
+# Endpoints run in FastAPI's threadpool, so size the pool to match it
+NEO4J_MAX_POOL_SIZE = int(os.getenv("NEO4J_MAX_POOL_SIZE", "50"))
 
 driver = None
 
@@ -38,7 +41,16 @@ driver = None
 async def lifespan(app: FastAPI):
     """Manage Neo4j connection lifecycle."""
     global driver
-    driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD))
+    driver = GraphDatabase.driver(
+        NEO4J_URI,
+        auth=(NEO4J_USER, NEO4J_PASSWORD),
+        max_connection_pool_size=NEO4J_MAX_POOL_SIZE,
+        connection_acquisition_timeout=30,
+    )
+    try:
+        get_neo4j_client().ensure_id_constraints()
+    except Exception as e:
+        print(f"⚠️ Could not ensure Neo4j id constraints: {e}")
     yield
     if driver:
         driver.close()
@@ -86,13 +98,46 @@ def get_session():
     return driver.session()
 
 
+def read_session() -> Iterator[Session]:
+    """Request-scoped read session shared by all queries of one request."""
+    with driver.session(default_access_mode=READ_ACCESS) as session:
+        yield session
+
+
+def add_node(nodes_by_id: dict[str, dict], node: Optional[dict], node_type: str, **fields) -> bool:
+    """
+    Add a projected node once by id, tagged with its type and any extra fields
+    (e.g. bcId). Returns False for a missing node or one that is already present.
+    """
+    if not node or node["id"] in nodes_by_id:
+        return False
+    node["type"] = node_type
+    node.update(fields)
+    nodes_by_id[node["id"]] = node
+    return True
+
+
+def add_relationship(relationships: set[tuple[str, str, str]], source: str, target: str, rel_type: str):
+    """Add a relationship once per (source, target, type), skipping dangling ends."""
+    if source and target:
+        relationships.add((source, target, rel_type))
+
+
+def relationship_dicts(relationships: set[tuple[str, str, str]]) -> list[dict]:
+    """Materialize (source, target, type) keys into the API's relationship dicts."""
+    return [
+        {"source": source, "target": target, "type": rel_type}
+        for source, target, rel_type in relationships
+    ]
+
+
 # =============================================================================
 # API Endpoints
 # =============================================================================
 
 
 @app.get("/api/health")
-async def health_check():
+def health_check():
     """Health check endpoint."""
     try:
         with get_session() as session:
@@ -120,7 +165,7 @@ ARCHITECT_NODE_TYPES = [
 
 
 @app.delete("/api/graph/clear")
-async def clear_architect_nodes():
+def clear_architect_nodes():
     """
     DELETE /graph/clear - Event Storming 요소만 삭제 (robo-architect 생성 노드)
     
@@ -152,6 +197,7 @@ async def clear_architect_nodes():
         # Delete only architect nodes
         delete_result = session.run(delete_query, node_types=ARCHITECT_NODE_TYPES)
         summary = delete_result.consume()
+        invalidate_event_triggers_cache()
         
         return {
             "success": True,
@@ -165,7 +211,7 @@ async def clear_architect_nodes():
 
 
 @app.get("/api/graph/stats")
-async def get_graph_stats():
+def get_graph_stats():
     """
     GET /graph/stats - 그래프 통계 조회
     Returns count of each node type.
@@ -192,7 +238,7 @@ async def get_graph_stats():
 
 
 @app.get("/api/user-stories")
-async def get_all_user_stories() -> list[dict[str, Any]]:
+def get_all_user_stories() -> list[dict[str, Any]]:
     """
     GET /user-stories - User Story 목록 조회
     Returns all User Stories with their BC assignments.
@@ -218,7 +264,7 @@ async def get_all_user_stories() -> list[dict[str, Any]]:
 
 
 @app.get("/api/user-stories/unassigned")
-async def get_unassigned_user_stories() -> list[dict[str, Any]]:
+def get_unassigned_user_stories() -> list[dict[str, Any]]:
     """
     GET /user-stories/unassigned - BC에 할당되지 않은 User Story 조회
     """
@@ -241,7 +287,7 @@ async def get_unassigned_user_stories() -> list[dict[str, Any]]:
 
 
 @app.get("/api/contexts")
-async def get_all_contexts() -> list[dict[str, Any]]:
+def get_all_contexts() -> list[dict[str, Any]]:
     """
     GET /contexts - BC 목록 조회
     Returns all Bounded Contexts with basic info.
@@ -267,7 +313,7 @@ async def get_all_contexts() -> list[dict[str, Any]]:
 
 
 @app.get("/api/contexts/{context_id}/tree")
-async def get_context_tree(context_id: str) -> dict[str, Any]:
+def get_context_tree(context_id: str) -> dict[str, Any]:
     """
     GET /contexts/{id}/tree - BC 하위 트리
     Returns the full tree structure under a Bounded Context.
@@ -332,7 +378,7 @@ async def get_context_tree(context_id: str) -> dict[str, Any]:
 
 
 @app.get("/api/contexts/{context_id}/full-tree")
-async def get_context_full_tree(context_id: str) -> dict[str, Any]:
+def get_context_full_tree(context_id: str) -> dict[str, Any]:
     """
     GET /contexts/{id}/full-tree - BC 하위 전체 트리 (정규화된 구조)
     """
@@ -547,7 +593,7 @@ async def get_context_full_tree(context_id: str) -> dict[str, Any]:
 
 
 @app.get("/api/graph/subgraph")
-async def get_subgraph(
+def get_subgraph(
     node_ids: list[str] = Query(..., description="List of node IDs to include"),
 ) -> dict[str, Any]:
     """
@@ -606,7 +652,7 @@ async def get_subgraph(
 
 
 @app.get("/api/graph/expand/{node_id}")
-async def expand_node(node_id: str) -> dict[str, Any]:
+def expand_node(node_id: str, session: Session = Depends(read_session)) -> dict[str, Any]:
     """
     Expand a node to get its connected nodes based on type.
     - BoundedContext → All Aggregates + Policies
@@ -616,215 +662,103 @@ async def expand_node(node_id: str) -> dict[str, Any]:
     - Policy → Commands it invokes
     """
     
-    # First, determine the node type
-    type_query = """
+    # Resolve the node type and collect every expansion row in one round trip.
+    # Each UNION branch only matches for its own label, so a node of another
+    # type simply contributes no rows from it.
+    expand_query = """
     MATCH (n {id: $node_id})
-    RETURN labels(n)[0] as nodeType, n as node
+    CALL {
+        WITH n
+        CALL {
+            WITH n
+            MATCH (n:BoundedContext)-[:HAS_AGGREGATE]->(agg:Aggregate)
+            RETURN agg {.*} as child, 'Aggregate' as childType,
+                   {source: n.id, target: agg.id, type: 'HAS_AGGREGATE'} as rel
+            UNION ALL
+            WITH n
+            MATCH (n:BoundedContext)-[:HAS_AGGREGATE]->(agg:Aggregate)-[:HAS_COMMAND]->(cmd:Command)
+            RETURN cmd {.*} as child, 'Command' as childType,
+                   {source: agg.id, target: cmd.id, type: 'HAS_COMMAND'} as rel
+            UNION ALL
+            WITH n
+            MATCH (n:BoundedContext)-[:HAS_AGGREGATE]->(:Aggregate)-[:HAS_COMMAND]->(cmd:Command)-[:EMITS]->(evt:Event)
+            RETURN evt {.*} as child, 'Event' as childType,
+                   {source: cmd.id, target: evt.id, type: 'EMITS'} as rel
+            UNION ALL
+            WITH n
+            MATCH (n:BoundedContext)-[:HAS_POLICY]->(pol:Policy)
+            RETURN pol {.*} as child, 'Policy' as childType, null as rel
+            UNION ALL
+            WITH n
+            MATCH (n:BoundedContext)-[:HAS_POLICY]->(pol:Policy)<-[:TRIGGERS]-(evt:Event)
+            RETURN null as child, null as childType,
+                   {source: evt.id, target: pol.id, type: 'TRIGGERS'} as rel
+            UNION ALL
+            WITH n
+            MATCH (n:BoundedContext)-[:HAS_POLICY]->(pol:Policy)-[:INVOKES]->(cmd:Command)
+            RETURN null as child, null as childType,
+                   {source: pol.id, target: cmd.id, type: 'INVOKES'} as rel
+            UNION ALL
+            WITH n
+            MATCH (n:Aggregate)-[:HAS_COMMAND]->(cmd:Command)
+            RETURN cmd {.*} as child, 'Command' as childType,
+                   {source: n.id, target: cmd.id, type: 'HAS_COMMAND'} as rel
+            UNION ALL
+            WITH n
+            MATCH (n:Aggregate)-[:HAS_COMMAND]->(cmd:Command)-[:EMITS]->(evt:Event)
+            RETURN evt {.*} as child, 'Event' as childType,
+                   {source: cmd.id, target: evt.id, type: 'EMITS'} as rel
+            UNION ALL
+            WITH n
+            MATCH (n:Command)-[:EMITS]->(evt:Event)
+            RETURN evt {.*} as child, 'Event' as childType,
+                   {source: n.id, target: evt.id, type: 'EMITS'} as rel
+            UNION ALL
+            WITH n
+            MATCH (n:Event)-[:TRIGGERS]->(pol:Policy)
+            RETURN pol {.*} as child, 'Policy' as childType,
+                   {source: n.id, target: pol.id, type: 'TRIGGERS'} as rel
+            UNION ALL
+            WITH n
+            MATCH (n:Event)-[:TRIGGERS]->(pol:Policy)-[:INVOKES]->(cmd:Command)
+            RETURN cmd {.*} as child, 'Command' as childType,
+                   {source: pol.id, target: cmd.id, type: 'INVOKES'} as rel
+            UNION ALL
+            WITH n
+            MATCH (n:Policy)-[:INVOKES]->(cmd:Command)
+            RETURN cmd {.*} as child, 'Command' as childType,
+                   {source: n.id, target: cmd.id, type: 'INVOKES'} as rel
+        }
+        RETURN collect({node: child, nodeType: childType, rel: rel}) as rows
+    }
+    RETURN labels(n)[0] as nodeType, n {.*} as node, rows
     """
     
-    with get_session() as session:
-        type_result = session.run(type_query, node_id=node_id)
-        type_record = type_result.single()
-        
-        if not type_record:
-            raise HTTPException(status_code=404, detail=f"Node {node_id} not found")
-        
-        node_type = type_record["nodeType"]
-        main_node = dict(type_record["node"])
-        main_node["type"] = node_type
-        
-        nodes = [main_node]
-        relationships = []
-        
-        if node_type == "BoundedContext":
-            # Get Aggregates
-            agg_query = """
-            MATCH (bc:BoundedContext {id: $node_id})-[r:HAS_AGGREGATE]->(agg:Aggregate)
-            OPTIONAL MATCH (agg)-[r2:HAS_COMMAND]->(cmd:Command)
-            OPTIONAL MATCH (cmd)-[r3:EMITS]->(evt:Event)
-            RETURN agg, cmd, evt,
-                   {source: bc.id, target: agg.id, type: 'HAS_AGGREGATE'} as rel1,
-                   {source: agg.id, target: cmd.id, type: 'HAS_COMMAND'} as rel2,
-                   {source: cmd.id, target: evt.id, type: 'EMITS'} as rel3
-            """
-            agg_result = session.run(agg_query, node_id=node_id)
-            seen_ids = {node_id}
-            
-            for record in agg_result:
-                if record["agg"] and record["agg"]["id"] not in seen_ids:
-                    agg = dict(record["agg"])
-                    agg["type"] = "Aggregate"
-                    nodes.append(agg)
-                    seen_ids.add(agg["id"])
-                    if record["rel1"]["target"]:
-                        relationships.append(dict(record["rel1"]))
-                
-                if record["cmd"] and record["cmd"]["id"] not in seen_ids:
-                    cmd = dict(record["cmd"])
-                    cmd["type"] = "Command"
-                    nodes.append(cmd)
-                    seen_ids.add(cmd["id"])
-                    if record["rel2"]["target"]:
-                        relationships.append(dict(record["rel2"]))
-                
-                if record["evt"] and record["evt"]["id"] not in seen_ids:
-                    evt = dict(record["evt"])
-                    evt["type"] = "Event"
-                    nodes.append(evt)
-                    seen_ids.add(evt["id"])
-                    if record["rel3"]["target"]:
-                        relationships.append(dict(record["rel3"]))
-            
-            # Get Policies
-            pol_query = """
-            MATCH (bc:BoundedContext {id: $node_id})-[:HAS_POLICY]->(pol:Policy)
-            OPTIONAL MATCH (evt:Event)-[r:TRIGGERS]->(pol)
-            OPTIONAL MATCH (pol)-[r2:INVOKES]->(cmd:Command)
-            RETURN pol, evt.id as triggerEventId, cmd.id as invokeCommandId
-            """
-            pol_result = session.run(pol_query, node_id=node_id)
-            for record in pol_result:
-                if record["pol"] and record["pol"]["id"] not in seen_ids:
-                    pol = dict(record["pol"])
-                    pol["type"] = "Policy"
-                    nodes.append(pol)
-                    seen_ids.add(pol["id"])
-                    
-                    if record["triggerEventId"]:
-                        relationships.append({
-                            "source": record["triggerEventId"],
-                            "target": pol["id"],
-                            "type": "TRIGGERS"
-                        })
-                    if record["invokeCommandId"]:
-                        relationships.append({
-                            "source": pol["id"],
-                            "target": record["invokeCommandId"],
-                            "type": "INVOKES"
-                        })
-        
-        elif node_type == "Aggregate":
-            # Get Commands and Events
-            expand_query = """
-            MATCH (agg:Aggregate {id: $node_id})-[:HAS_COMMAND]->(cmd:Command)
-            OPTIONAL MATCH (cmd)-[:EMITS]->(evt:Event)
-            RETURN cmd, evt
-            """
-            expand_result = session.run(expand_query, node_id=node_id)
-            seen_ids = {node_id}
-            
-            for record in expand_result:
-                if record["cmd"] and record["cmd"]["id"] not in seen_ids:
-                    cmd = dict(record["cmd"])
-                    cmd["type"] = "Command"
-                    nodes.append(cmd)
-                    seen_ids.add(cmd["id"])
-                    relationships.append({
-                        "source": node_id,
-                        "target": cmd["id"],
-                        "type": "HAS_COMMAND"
-                    })
-                
-                if record["evt"] and record["evt"]["id"] not in seen_ids:
-                    evt = dict(record["evt"])
-                    evt["type"] = "Event"
-                    nodes.append(evt)
-                    seen_ids.add(evt["id"])
-                    relationships.append({
-                        "source": record["cmd"]["id"],
-                        "target": evt["id"],
-                        "type": "EMITS"
-                    })
-        
-        elif node_type == "Command":
-            # Get Events
-            expand_query = """
-            MATCH (cmd:Command {id: $node_id})-[:EMITS]->(evt:Event)
-            RETURN evt
-            """
-            expand_result = session.run(expand_query, node_id=node_id)
-            
-            for record in expand_result:
-                if record["evt"]:
-                    evt = dict(record["evt"])
-                    evt["type"] = "Event"
-                    nodes.append(evt)
-                    relationships.append({
-                        "source": node_id,
-                        "target": evt["id"],
-                        "type": "EMITS"
-                    })
-        
-        elif node_type == "Event":
-            # Get Policies
-            expand_query = """
-            MATCH (evt:Event {id: $node_id})-[:TRIGGERS]->(pol:Policy)
-            OPTIONAL MATCH (pol)-[:INVOKES]->(cmd:Command)
-            RETURN pol, cmd
-            """
-            expand_result = session.run(expand_query, node_id=node_id)
-            seen_ids = {node_id}
-            
-            for record in expand_result:
-                if record["pol"] and record["pol"]["id"] not in seen_ids:
-                    pol = dict(record["pol"])
-                    pol["type"] = "Policy"
-                    nodes.append(pol)
-                    seen_ids.add(pol["id"])
-                    relationships.append({
-                        "source": node_id,
-                        "target": pol["id"],
-                        "type": "TRIGGERS"
-                    })
-                
-                if record["cmd"] and record["cmd"]["id"] not in seen_ids:
-                    cmd = dict(record["cmd"])
-                    cmd["type"] = "Command"
-                    nodes.append(cmd)
-                    seen_ids.add(cmd["id"])
-                    relationships.append({
-                        "source": record["pol"]["id"],
-                        "target": cmd["id"],
-                        "type": "INVOKES"
-                    })
-        
-        elif node_type == "Policy":
-            # Get Commands it invokes
-            expand_query = """
-            MATCH (pol:Policy {id: $node_id})-[:INVOKES]->(cmd:Command)
-            RETURN cmd
-            """
-            expand_result = session.run(expand_query, node_id=node_id)
-            
-            for record in expand_result:
-                if record["cmd"]:
-                    cmd = dict(record["cmd"])
-                    cmd["type"] = "Command"
-                    nodes.append(cmd)
-                    relationships.append({
-                        "source": node_id,
-                        "target": cmd["id"],
-                        "type": "INVOKES"
-                    })
-        
-        # Deduplicate relationships
-        unique_rels = []
-        seen_rels = set()
-        for rel in relationships:
-            if rel.get("source") and rel.get("target"):
-                key = (rel["source"], rel["target"], rel["type"])
-                if key not in seen_rels:
-                    seen_rels.add(key)
-                    unique_rels.append(rel)
-        
-        return {
-            "nodes": nodes,
-            "relationships": unique_rels
-        }
+    record = session.run(expand_query, node_id=node_id).single()
+    
+    if not record:
+        raise HTTPException(status_code=404, detail=f"Node {node_id} not found")
+    
+    node_type = record["nodeType"]
+    main_node = record["node"]
+    main_node["type"] = node_type
+    
+    nodes_by_id: dict[str, dict] = {node_id: main_node}
+    relationships: set[tuple[str, str, str]] = set()
+    
+    for row in record["rows"]:
+        add_node(nodes_by_id, row["node"], row["nodeType"])
+        if rel := row["rel"]:
+            add_relationship(relationships, rel["source"], rel["target"], rel["type"])
+    
+    return {
+        "nodes": list(nodes_by_id.values()),
+        "relationships": relationship_dicts(relationships)
+    }
 
 
 @app.get("/api/graph/find-relations")
-async def find_relations(
+def find_relations(
     node_ids: list[str] = Query(..., description="List of node IDs on canvas"),
 ) -> list[dict[str, Any]]:
     """
@@ -896,7 +830,7 @@ async def find_relations(
 
 
 @app.get("/api/graph/find-cross-bc-relations")
-async def find_cross_bc_relations(
+def find_cross_bc_relations(
     new_node_ids: list[str] = Query(..., description="Newly added node IDs"),
     existing_node_ids: list[str] = Query(..., description="Existing node IDs on canvas"),
 ) -> list[dict[str, Any]]:
@@ -960,7 +894,7 @@ async def find_cross_bc_relations(
 
 
 @app.get("/api/graph/node-context/{node_id}")
-async def get_node_context(node_id: str) -> dict[str, Any]:
+def get_node_context(node_id: str) -> dict[str, Any]:
     """
     Get the BoundedContext that contains a given node.
     Returns BC info so nodes can be properly grouped.
@@ -990,8 +924,215 @@ async def get_node_context(node_id: str) -> dict[str, Any]:
         return dict(record["result"])
 
 
+def _expand_bc_children(
+    session: Session,
+    node_id: str,
+    bc_id: Optional[str],
+    nodes_by_id: dict[str, dict],
+    relationships: set[tuple[str, str, str]],
+):
+    """Aggregates (with Commands/Events), Policies, UIs and ReadModels of a BC."""
+    # Get all aggregates, commands, events under this BC.
+    # Nest events under commands and commands under aggregates so each
+    # node crosses the wire once instead of once per descendant row.
+    expand_query = """
+    MATCH (bc:BoundedContext {id: $node_id})-[:HAS_AGGREGATE]->(agg:Aggregate)
+    OPTIONAL MATCH (agg)-[:HAS_COMMAND]->(cmd:Command)
+    OPTIONAL MATCH (cmd)-[:EMITS]->(evt:Event)
+    WITH agg, cmd, collect(evt {.*}) as evts
+    RETURN agg {.*} as agg, collect({cmd: cmd {.*}, evts: evts}) as cmds
+    """
+    expand_result = session.run(expand_query, node_id=node_id)
+
+    for record in expand_result:
+        agg_id = record["agg"]["id"]
+        if add_node(nodes_by_id, record["agg"], "Aggregate", bcId=bc_id):
+            add_relationship(relationships, node_id, agg_id, "HAS_AGGREGATE")
+
+        for item in record["cmds"]:
+            if not item["cmd"]:
+                continue
+            cmd_id = item["cmd"]["id"]
+            if add_node(nodes_by_id, item["cmd"], "Command", bcId=bc_id):
+                add_relationship(relationships, agg_id, cmd_id, "HAS_COMMAND")
+
+            for evt in item["evts"]:
+                if add_node(nodes_by_id, evt, "Event", bcId=bc_id):
+                    add_relationship(relationships, cmd_id, evt["id"], "EMITS")
+
+    # Get policies
+    pol_query = """
+    MATCH (bc:BoundedContext {id: $node_id})-[:HAS_POLICY]->(pol:Policy)
+    OPTIONAL MATCH (evt:Event)-[:TRIGGERS]->(pol)
+    OPTIONAL MATCH (pol)-[:INVOKES]->(cmd:Command)
+    RETURN pol {.*} as pol, evt.id as triggerEventId, cmd.id as invokeCommandId
+    """
+    pol_result = session.run(pol_query, node_id=node_id)
+
+    for record in pol_result:
+        pol = record["pol"]
+        if add_node(nodes_by_id, pol, "Policy", bcId=bc_id):
+            add_relationship(relationships, record["triggerEventId"], pol["id"], "TRIGGERS")
+            add_relationship(relationships, pol["id"], record["invokeCommandId"], "INVOKES")
+
+    # Get UI wireframes
+    ui_query = """
+    MATCH (bc:BoundedContext {id: $node_id})-[:HAS_UI]->(ui:UI)
+    RETURN ui {.*} as ui
+    """
+    ui_result = session.run(ui_query, node_id=node_id)
+
+    for record in ui_result:
+        ui = record["ui"]
+        if add_node(nodes_by_id, ui, "UI", bcId=bc_id):
+            # Add ATTACHED_TO relationship if attachedToId exists
+            add_relationship(relationships, ui["id"], ui.get("attachedToId"), "ATTACHED_TO")
+
+    # Get ReadModels
+    rm_query = """
+    MATCH (bc:BoundedContext {id: $node_id})-[:HAS_READMODEL]->(rm:ReadModel)
+    RETURN rm {.*} as rm
+    """
+    rm_result = session.run(rm_query, node_id=node_id)
+
+    for record in rm_result:
+        rm = record["rm"]
+        if add_node(nodes_by_id, rm, "ReadModel", bcId=bc_id):
+            add_relationship(relationships, node_id, rm["id"], "HAS_READMODEL")
+
+
+def _expand_aggregate_children(
+    session: Session,
+    node_id: str,
+    bc_id: Optional[str],
+    nodes_by_id: dict[str, dict],
+    relationships: set[tuple[str, str, str]],
+):
+    """Commands/Events of an Aggregate plus the Policies of its BC."""
+    # Get Commands and Events
+    expand_query = """
+    MATCH (agg:Aggregate {id: $node_id})-[:HAS_COMMAND]->(cmd:Command)
+    OPTIONAL MATCH (cmd)-[:EMITS]->(evt:Event)
+    RETURN cmd {.*} as cmd, collect(evt {.*}) as evts
+    """
+    expand_result = session.run(expand_query, node_id=node_id)
+
+    for record in expand_result:
+        cmd_id = record["cmd"]["id"]
+        if add_node(nodes_by_id, record["cmd"], "Command", bcId=bc_id):
+            add_relationship(relationships, node_id, cmd_id, "HAS_COMMAND")
+
+        for evt in record["evts"]:
+            if add_node(nodes_by_id, evt, "Event", bcId=bc_id):
+                add_relationship(relationships, cmd_id, evt["id"], "EMITS")
+
+    # Also get Policies from the same BC that are triggered by events in this aggregate
+    if bc_id:
+        pol_query = """
+        MATCH (bc:BoundedContext {id: $bc_id})-[:HAS_POLICY]->(pol:Policy)
+        OPTIONAL MATCH (evt:Event)-[:TRIGGERS]->(pol)
+        OPTIONAL MATCH (pol)-[:INVOKES]->(cmd:Command)
+        RETURN pol {.*} as pol, evt.id as triggerEventId, cmd.id as invokeCommandId
+        """
+        pol_result = session.run(pol_query, bc_id=bc_id)
+
+        for record in pol_result:
+            pol = record["pol"]
+            if add_node(
+                nodes_by_id, pol, "Policy",
+                bcId=bc_id,
+                triggerEventId=record["triggerEventId"],
+                invokeCommandId=record["invokeCommandId"],
+            ):
+                # Only link ends that are part of this expansion
+                if record["triggerEventId"] in nodes_by_id:
+                    add_relationship(relationships, record["triggerEventId"], pol["id"], "TRIGGERS")
+                if record["invokeCommandId"] in nodes_by_id:
+                    add_relationship(relationships, pol["id"], record["invokeCommandId"], "INVOKES")
+
+
+def _expand_command_children(
+    session: Session,
+    node_id: str,
+    bc_id: Optional[str],
+    nodes_by_id: dict[str, dict],
+    relationships: set[tuple[str, str, str]],
+):
+    """Events emitted by a Command."""
+    # Get Events
+    expand_query = """
+    MATCH (cmd:Command {id: $node_id})-[:EMITS]->(evt:Event)
+    RETURN evt {.*} as evt
+    """
+    expand_result = session.run(expand_query, node_id=node_id)
+
+    for record in expand_result:
+        evt = record["evt"]
+        if add_node(nodes_by_id, evt, "Event", bcId=bc_id):
+            add_relationship(relationships, node_id, evt["id"], "EMITS")
+
+
+def _expand_event_children(
+    session: Session,
+    node_id: str,
+    bc_id: Optional[str],
+    nodes_by_id: dict[str, dict],
+    relationships: set[tuple[str, str, str]],
+):
+    """Policies triggered by an Event and the Commands they invoke."""
+    # Get Policies triggered by this event
+    expand_query = """
+    MATCH (evt:Event {id: $node_id})-[:TRIGGERS]->(pol:Policy)
+    OPTIONAL MATCH (pol)-[:INVOKES]->(cmd:Command)
+    OPTIONAL MATCH (polBc:BoundedContext)-[:HAS_POLICY]->(pol)
+    RETURN pol {.*} as pol, cmd {.*} as cmd, polBc {.id} as polBc
+    """
+    expand_result = session.run(expand_query, node_id=node_id)
+
+    for record in expand_result:
+        pol_bc_id = record["polBc"]["id"] if record["polBc"] else bc_id
+
+        pol, cmd = record["pol"], record["cmd"]
+        if add_node(nodes_by_id, pol, "Policy", bcId=pol_bc_id):
+            add_relationship(relationships, node_id, pol["id"], "TRIGGERS")
+
+        if add_node(nodes_by_id, cmd, "Command", bcId=pol_bc_id):
+            add_relationship(relationships, pol["id"], cmd["id"], "INVOKES")
+
+
+def _expand_policy_children(
+    session: Session,
+    node_id: str,
+    bc_id: Optional[str],
+    nodes_by_id: dict[str, dict],
+    relationships: set[tuple[str, str, str]],
+):
+    """Commands invoked by a Policy."""
+    # Get Commands invoked by this policy
+    expand_query = """
+    MATCH (pol:Policy {id: $node_id})-[:INVOKES]->(cmd:Command)
+    RETURN cmd {.*} as cmd
+    """
+    expand_result = session.run(expand_query, node_id=node_id)
+
+    for record in expand_result:
+        cmd = record["cmd"]
+        if add_node(nodes_by_id, cmd, "Command", bcId=bc_id):
+            add_relationship(relationships, node_id, cmd["id"], "INVOKES")
+
+
+# expand-with-bc handlers by node type; each adds children to nodes_by_id/relationships
+EXPAND_WITH_BC_HANDLERS = {
+    "BoundedContext": _expand_bc_children,
+    "Aggregate": _expand_aggregate_children,
+    "Command": _expand_command_children,
+    "Event": _expand_event_children,
+    "Policy": _expand_policy_children,
+}
+
+
 @app.get("/api/graph/expand-with-bc/{node_id}")
-async def expand_node_with_bc(node_id: str) -> dict[str, Any]:
+def expand_node_with_bc(node_id: str, session: Session = Depends(read_session)) -> dict[str, Any]:
     """
     Expand a node and include its parent BoundedContext.
     This ensures nodes are always displayed within their BC container.
@@ -1011,445 +1152,107 @@ async def expand_node_with_bc(node_id: str) -> dict[str, Any]:
     OPTIONAL MATCH (bc7:BoundedContext)-[:HAS_READMODEL]->(n)
     
     WITH n, nodeType, coalesce(bc1, bc2, bc3, bc4, bc5, bc6, bc7) as bc
-    RETURN n, nodeType, bc
+    RETURN n {.*} as n, nodeType, bc {.*} as bc, bc.id as bcId
     """
     
-    with get_session() as session:
-        ctx_result = session.run(context_query, node_id=node_id)
-        ctx_record = ctx_result.single()
-        
-        if not ctx_record:
-            raise HTTPException(status_code=404, detail=f"Node {node_id} not found")
-        
-        node_type = ctx_record["nodeType"]
-        bc = ctx_record["bc"]
-        main_node = dict(ctx_record["n"])
-        main_node["type"] = node_type
-        
-        nodes = []
-        relationships = []
-        seen_ids = set()
-        
-        # Always include BC if found
-        if bc:
-            bc_node = dict(bc)
-            bc_node["type"] = "BoundedContext"
-            nodes.append(bc_node)
-            seen_ids.add(bc["id"])
-            
-            # Mark all child nodes with their BC
-            main_node["bcId"] = bc["id"]
-        
-        nodes.append(main_node)
-        seen_ids.add(node_id)
-        
-        # Now expand based on node type
-        if node_type == "BoundedContext":
-            # Get all aggregates, commands, events under this BC
-            expand_query = """
-            MATCH (bc:BoundedContext {id: $node_id})-[:HAS_AGGREGATE]->(agg:Aggregate)
-            OPTIONAL MATCH (agg)-[:HAS_COMMAND]->(cmd:Command)
-            OPTIONAL MATCH (cmd)-[:EMITS]->(evt:Event)
-            RETURN agg, cmd, evt
-            """
-            expand_result = session.run(expand_query, node_id=node_id)
-            
-            for record in expand_result:
-                if record["agg"] and record["agg"]["id"] not in seen_ids:
-                    agg = dict(record["agg"])
-                    agg["type"] = "Aggregate"
-                    agg["bcId"] = node_id
-                    nodes.append(agg)
-                    seen_ids.add(agg["id"])
-                    relationships.append({
-                        "source": node_id,
-                        "target": agg["id"],
-                        "type": "HAS_AGGREGATE"
-                    })
-                
-                if record["cmd"] and record["cmd"]["id"] not in seen_ids:
-                    cmd = dict(record["cmd"])
-                    cmd["type"] = "Command"
-                    cmd["bcId"] = node_id
-                    nodes.append(cmd)
-                    seen_ids.add(cmd["id"])
-                    if record["agg"]:
-                        relationships.append({
-                            "source": record["agg"]["id"],
-                            "target": cmd["id"],
-                            "type": "HAS_COMMAND"
-                        })
-                
-                if record["evt"] and record["evt"]["id"] not in seen_ids:
-                    evt = dict(record["evt"])
-                    evt["type"] = "Event"
-                    evt["bcId"] = node_id
-                    nodes.append(evt)
-                    seen_ids.add(evt["id"])
-                    if record["cmd"]:
-                        relationships.append({
-                            "source": record["cmd"]["id"],
-                            "target": evt["id"],
-                            "type": "EMITS"
-                        })
-            
-            # Get policies
-            pol_query = """
-            MATCH (bc:BoundedContext {id: $node_id})-[:HAS_POLICY]->(pol:Policy)
-            OPTIONAL MATCH (evt:Event)-[:TRIGGERS]->(pol)
-            OPTIONAL MATCH (pol)-[:INVOKES]->(cmd:Command)
-            RETURN pol, evt.id as triggerEventId, cmd.id as invokeCommandId
-            """
-            pol_result = session.run(pol_query, node_id=node_id)
-            
-            for record in pol_result:
-                if record["pol"] and record["pol"]["id"] not in seen_ids:
-                    pol = dict(record["pol"])
-                    pol["type"] = "Policy"
-                    pol["bcId"] = node_id
-                    nodes.append(pol)
-                    seen_ids.add(pol["id"])
-                    
-                    if record["triggerEventId"]:
-                        relationships.append({
-                            "source": record["triggerEventId"],
-                            "target": pol["id"],
-                            "type": "TRIGGERS"
-                        })
-                    if record["invokeCommandId"]:
-                        relationships.append({
-                            "source": pol["id"],
-                            "target": record["invokeCommandId"],
-                            "type": "INVOKES"
-                        })
-            
-            # Get UI wireframes
-            ui_query = """
-            MATCH (bc:BoundedContext {id: $node_id})-[:HAS_UI]->(ui:UI)
-            RETURN ui
-            """
-            ui_result = session.run(ui_query, node_id=node_id)
-            
-            for record in ui_result:
-                if record["ui"] and record["ui"]["id"] not in seen_ids:
-                    ui = dict(record["ui"])
-                    ui["type"] = "UI"
-                    ui["bcId"] = node_id
-                    nodes.append(ui)
-                    seen_ids.add(ui["id"])
-                    
-                    # Add ATTACHED_TO relationship if attachedToId exists
-                    if ui.get("attachedToId"):
-                        relationships.append({
-                            "source": ui["id"],
-                            "target": ui["attachedToId"],
-                            "type": "ATTACHED_TO"
-                        })
-            
-            # Get ReadModels
-            rm_query = """
-            MATCH (bc:BoundedContext {id: $node_id})-[:HAS_READMODEL]->(rm:ReadModel)
-            RETURN rm
-            """
-            rm_result = session.run(rm_query, node_id=node_id)
-            
-            for record in rm_result:
-                if record["rm"] and record["rm"]["id"] not in seen_ids:
-                    rm = dict(record["rm"])
-                    rm["type"] = "ReadModel"
-                    rm["bcId"] = node_id
-                    nodes.append(rm)
-                    seen_ids.add(rm["id"])
-                    relationships.append({
-                        "source": node_id,
-                        "target": rm["id"],
-                        "type": "HAS_READMODEL"
-                    })
-        
-        elif node_type == "Aggregate":
-            bc_id = bc["id"] if bc else None
-            
-            # Get Commands and Events
-            expand_query = """
-            MATCH (agg:Aggregate {id: $node_id})-[:HAS_COMMAND]->(cmd:Command)
-            OPTIONAL MATCH (cmd)-[:EMITS]->(evt:Event)
-            RETURN cmd, evt
-            """
-            expand_result = session.run(expand_query, node_id=node_id)
-            
-            for record in expand_result:
-                if record["cmd"] and record["cmd"]["id"] not in seen_ids:
-                    cmd = dict(record["cmd"])
-                    cmd["type"] = "Command"
-                    cmd["bcId"] = bc_id
-                    nodes.append(cmd)
-                    seen_ids.add(cmd["id"])
-                    relationships.append({
-                        "source": node_id,
-                        "target": cmd["id"],
-                        "type": "HAS_COMMAND"
-                    })
-                
-                if record["evt"] and record["evt"]["id"] not in seen_ids:
-                    evt = dict(record["evt"])
-                    evt["type"] = "Event"
-                    evt["bcId"] = bc_id
-                    nodes.append(evt)
-                    seen_ids.add(evt["id"])
-                    relationships.append({
-                        "source": record["cmd"]["id"],
-                        "target": evt["id"],
-                        "type": "EMITS"
-                    })
-            
-            # Also get Policies from the same BC that are triggered by events in this aggregate
-            if bc_id:
-                pol_query = """
-                MATCH (bc:BoundedContext {id: $bc_id})-[:HAS_POLICY]->(pol:Policy)
-                OPTIONAL MATCH (evt:Event)-[:TRIGGERS]->(pol)
-                OPTIONAL MATCH (pol)-[:INVOKES]->(cmd:Command)
-                RETURN pol, evt.id as triggerEventId, cmd.id as invokeCommandId
-                """
-                pol_result = session.run(pol_query, bc_id=bc_id)
-                
-                for record in pol_result:
-                    if record["pol"] and record["pol"]["id"] not in seen_ids:
-                        pol = dict(record["pol"])
-                        pol["type"] = "Policy"
-                        pol["bcId"] = bc_id
-                        pol["triggerEventId"] = record["triggerEventId"]
-                        pol["invokeCommandId"] = record["invokeCommandId"]
-                        nodes.append(pol)
-                        seen_ids.add(pol["id"])
-                        
-                        # Add TRIGGERS relationship if the trigger event is on canvas
-                        if record["triggerEventId"]:
-                            relationships.append({
-                                "source": record["triggerEventId"],
-                                "target": pol["id"],
-                                "type": "TRIGGERS"
-                            })
-                        # Add INVOKES relationship if the command is on canvas
-                        if record["invokeCommandId"]:
-                            relationships.append({
-                                "source": pol["id"],
-                                "target": record["invokeCommandId"],
-                                "type": "INVOKES"
-                            })
-        
-        elif node_type == "Command":
-            bc_id = bc["id"] if bc else None
-            
-            # Get Events
-            expand_query = """
-            MATCH (cmd:Command {id: $node_id})-[:EMITS]->(evt:Event)
-            RETURN evt
-            """
-            expand_result = session.run(expand_query, node_id=node_id)
-            
-            for record in expand_result:
-                if record["evt"]:
-                    evt = dict(record["evt"])
-                    evt["type"] = "Event"
-                    evt["bcId"] = bc_id
-                    nodes.append(evt)
-                    relationships.append({
-                        "source": node_id,
-                        "target": evt["id"],
-                        "type": "EMITS"
-                    })
-        
-        elif node_type == "Event":
-            bc_id = bc["id"] if bc else None
-            
-            # Get Policies triggered by this event
-            expand_query = """
-            MATCH (evt:Event {id: $node_id})-[:TRIGGERS]->(pol:Policy)
-            OPTIONAL MATCH (pol)-[:INVOKES]->(cmd:Command)
-            OPTIONAL MATCH (polBc:BoundedContext)-[:HAS_POLICY]->(pol)
-            RETURN pol, cmd, polBc
-            """
-            expand_result = session.run(expand_query, node_id=node_id)
-            
-            for record in expand_result:
-                pol_bc_id = record["polBc"]["id"] if record["polBc"] else bc_id
-                
-                if record["pol"] and record["pol"]["id"] not in seen_ids:
-                    pol = dict(record["pol"])
-                    pol["type"] = "Policy"
-                    pol["bcId"] = pol_bc_id
-                    nodes.append(pol)
-                    seen_ids.add(pol["id"])
-                    relationships.append({
-                        "source": node_id,
-                        "target": pol["id"],
-                        "type": "TRIGGERS"
-                    })
-                
-                if record["cmd"] and record["cmd"]["id"] not in seen_ids:
-                    cmd = dict(record["cmd"])
-                    cmd["type"] = "Command"
-                    cmd["bcId"] = pol_bc_id
-                    nodes.append(cmd)
-                    seen_ids.add(cmd["id"])
-                    relationships.append({
-                        "source": record["pol"]["id"],
-                        "target": cmd["id"],
-                        "type": "INVOKES"
-                    })
-        
-        elif node_type == "Policy":
-            bc_id = bc["id"] if bc else None
-            
-            # Get Commands invoked by this policy
-            expand_query = """
-            MATCH (pol:Policy {id: $node_id})-[:INVOKES]->(cmd:Command)
-            RETURN cmd
-            """
-            expand_result = session.run(expand_query, node_id=node_id)
-            
-            for record in expand_result:
-                if record["cmd"]:
-                    cmd = dict(record["cmd"])
-                    cmd["type"] = "Command"
-                    cmd["bcId"] = bc_id
-                    nodes.append(cmd)
-                    relationships.append({
-                        "source": node_id,
-                        "target": cmd["id"],
-                        "type": "INVOKES"
-                    })
-        
-        # Deduplicate relationships
-        unique_rels = []
-        seen_rels = set()
-        for rel in relationships:
-            if rel.get("source") and rel.get("target"):
-                key = (rel["source"], rel["target"], rel["type"])
-                if key not in seen_rels:
-                    seen_rels.add(key)
-                    unique_rels.append(rel)
-        
-        return {
-            "nodes": nodes,
-            "relationships": unique_rels,
-            "bcContext": {
-                "id": bc["id"],
-                "name": bc["name"],
-                "description": bc.get("description")
-            } if bc else None
-        }
+    ctx_result = session.run(context_query, node_id=node_id)
+    ctx_record = ctx_result.single()
+    
+    if not ctx_record:
+        raise HTTPException(status_code=404, detail=f"Node {node_id} not found")
+    
+    node_type = ctx_record["nodeType"]
+    bc = ctx_record["bc"]
+    bc_id = ctx_record["bcId"]
+    main_node = ctx_record["n"]
+    main_node["type"] = node_type
+    
+    nodes_by_id: dict[str, dict] = {}
+    relationships: set[tuple[str, str, str]] = set()
+    
+    # Always include BC if found
+    if add_node(nodes_by_id, bc, "BoundedContext"):
+        # Mark all child nodes with their BC
+        main_node["bcId"] = bc_id
+    
+    nodes_by_id.setdefault(node_id, main_node)
+    
+    # Now expand based on node type (a BC resolves to itself as bc1 above)
+    expand_children = EXPAND_WITH_BC_HANDLERS.get(node_type)
+    if expand_children:
+        expand_children(session, node_id, bc_id, nodes_by_id, relationships)
+    
+    return {
+        "nodes": list(nodes_by_id.values()),
+        "relationships": relationship_dicts(relationships),
+        "bcContext": {
+            "id": bc["id"],
+            "name": bc["name"],
+            "description": bc.get("description")
+        } if bc else None
+    }
 
 
 @app.get("/api/graph/event-triggers/{event_id}")
-async def get_event_triggers(event_id: str) -> dict[str, Any]:
+def get_event_triggers(event_id: str, session: Session = Depends(read_session)) -> dict[str, Any]:
     """
     Get all Policies triggered by an Event, along with their parent BCs and related nodes.
     Used when double-clicking an Event on canvas to expand triggered policies.
     """
+    cached, generation = get_cached_event_triggers(event_id)
+    if cached is not None:
+        return cached
+    
+    # One row per BC: policies, the commands they invoke and the events those
+    # commands emit are collected server-side instead of as a DISTINCT cross product.
     query = """
     MATCH (evt:Event {id: $event_id})-[:TRIGGERS]->(pol:Policy)<-[:HAS_POLICY]-(bc:BoundedContext)
     OPTIONAL MATCH (pol)-[:INVOKES]->(cmd:Command)<-[:HAS_COMMAND]-(agg:Aggregate)<-[:HAS_AGGREGATE]-(bc)
     OPTIONAL MATCH (cmd)-[:EMITS]->(resultEvt:Event)
-    RETURN DISTINCT bc, pol, cmd, agg, resultEvt
+    WITH bc, pol, cmd, agg, collect(DISTINCT resultEvt {.*}) as resultEvts
+    WITH bc, pol, collect(
+        CASE WHEN cmd IS NULL THEN null
+             ELSE {cmd: cmd {.*}, agg: agg {.*}, resultEvts: resultEvts} END
+    ) as invokes
+    RETURN bc {.*} as bc, collect({pol: pol {.*}, invokes: invokes}) as policies
     """
     
-    with get_session() as session:
-        result = session.run(query, event_id=event_id)
-        
-        nodes = []
-        relationships = []
-        seen_ids = set()
-        bc_nodes = {}  # Track BC nodes to group children
+    result = session.run(query, event_id=event_id)
+    
+    nodes_by_id: dict[str, dict] = {}
+    relationships: set[tuple[str, str, str]] = set()
+    
+    for record in result:
+        bc = record["bc"]
+        bc_id = bc["id"]
+        add_node(nodes_by_id, bc, "BoundedContext")
         
-        for record in result:
-            # Add BC
-            if record["bc"] and record["bc"]["id"] not in seen_ids:
-                bc = dict(record["bc"])
-                bc["type"] = "BoundedContext"
-                nodes.append(bc)
-                seen_ids.add(bc["id"])
-                bc_nodes[bc["id"]] = bc
+        for item in record["policies"]:
+            pol = item["pol"]
+            add_node(nodes_by_id, pol, "Policy", bcId=bc_id)
+            # Event → TRIGGERS → Policy
+            add_relationship(relationships, event_id, pol["id"], "TRIGGERS")
             
-            bc_id = record["bc"]["id"] if record["bc"] else None
-            
-            # Add Aggregate
-            if record["agg"] and record["agg"]["id"] not in seen_ids:
-                agg = dict(record["agg"])
-                agg["type"] = "Aggregate"
-                agg["bcId"] = bc_id
-                nodes.append(agg)
-                seen_ids.add(agg["id"])
-            
-            # Add Policy
-            if record["pol"] and record["pol"]["id"] not in seen_ids:
-                pol = dict(record["pol"])
-                pol["type"] = "Policy"
-                pol["bcId"] = bc_id
-                nodes.append(pol)
-                seen_ids.add(pol["id"])
-                
-                # Event → TRIGGERS → Policy
-                relationships.append({
-                    "source": event_id,
-                    "target": pol["id"],
-                    "type": "TRIGGERS"
-                })
-            
-            # Add Command
-            if record["cmd"] and record["cmd"]["id"] not in seen_ids:
-                cmd = dict(record["cmd"])
-                cmd["type"] = "Command"
-                cmd["bcId"] = bc_id
-                nodes.append(cmd)
-                seen_ids.add(cmd["id"])
-                
-                # Policy → INVOKES → Command
-                if record["pol"]:
-                    relationships.append({
-                        "source": record["pol"]["id"],
-                        "target": cmd["id"],
-                        "type": "INVOKES"
-                    })
-                
-                # Aggregate → HAS_COMMAND → Command
-                if record["agg"]:
-                    relationships.append({
-                        "source": record["agg"]["id"],
-                        "target": cmd["id"],
-                        "type": "HAS_COMMAND"
-                    })
-            
-            # Add Result Event
-            if record["resultEvt"] and record["resultEvt"]["id"] not in seen_ids:
-                evt = dict(record["resultEvt"])
-                evt["type"] = "Event"
-                evt["bcId"] = bc_id
-                nodes.append(evt)
-                seen_ids.add(evt["id"])
+            for invoke in item["invokes"]:
+                cmd, agg = invoke["cmd"], invoke["agg"]
+                add_node(nodes_by_id, agg, "Aggregate", bcId=bc_id)
+                add_node(nodes_by_id, cmd, "Command", bcId=bc_id)
+                # Policy → INVOKES → Command, Aggregate → HAS_COMMAND → Command
+                add_relationship(relationships, pol["id"], cmd["id"], "INVOKES")
+                add_relationship(relationships, agg["id"], cmd["id"], "HAS_COMMAND")
                 
                 # Command → EMITS → Event
-                if record["cmd"]:
-                    relationships.append({
-                        "source": record["cmd"]["id"],
-                        "target": evt["id"],
-                        "type": "EMITS"
-                    })
-        
-        # Deduplicate relationships
-        unique_rels = []
-        seen_rels = set()
-        for rel in relationships:
-            key = (rel["source"], rel["target"], rel["type"])
-            if key not in seen_rels:
-                seen_rels.add(key)
-                unique_rels.append(rel)
-        
-        return {
-            "sourceEventId": event_id,
-            "nodes": nodes,
-            "relationships": unique_rels
-        }
+                for evt in invoke["resultEvts"]:
+                    add_node(nodes_by_id, evt, "Event", bcId=bc_id)
+                    add_relationship(relationships, cmd["id"], evt["id"], "EMITS")
+    
+    payload = {
+        "sourceEventId": event_id,
+        "nodes": list(nodes_by_id.values()),
+        "relationships": relationship_dicts(relationships)
+    }
+    cache_event_triggers(event_id, payload, generation)
+    return payload
 
 
 # =============================================
@@ -1478,7 +1281,7 @@ class CQRSWhereCreate(BaseModel):
 
 
 @app.post("/api/readmodel/{readmodel_id}/cqrs")
-async def create_cqrs_config(readmodel_id: str) -> dict[str, Any]:
+def create_cqrs_config(readmodel_id: str) -> dict[str, Any]:
     """
     Create a CQRSConfig for a ReadModel.
     If one already exists, return the existing one.
@@ -1495,7 +1298,7 @@ async def create_cqrs_config(readmodel_id: str) -> dict[str, Any]:
 
 
 @app.get("/api/readmodel/{readmodel_id}/cqrs")
-async def get_cqrs_config(readmodel_id: str) -> dict[str, Any]:
+def get_cqrs_config(readmodel_id: str) -> dict[str, Any]:
     """
     Get the full CQRS configuration for a ReadModel,
     including all operations, mappings, and where conditions.
@@ -1515,7 +1318,7 @@ async def get_cqrs_config(readmodel_id: str) -> dict[str, Any]:
 
 
 @app.delete("/api/readmodel/{readmodel_id}/cqrs")
-async def delete_cqrs_config(readmodel_id: str) -> dict[str, Any]:
+def delete_cqrs_config(readmodel_id: str) -> dict[str, Any]:
     """Delete the entire CQRS configuration for a ReadModel."""
     client = get_neo4j_client()
     deleted = client.delete_cqrs_config(readmodel_id)
@@ -1523,7 +1326,7 @@ async def delete_cqrs_config(readmodel_id: str) -> dict[str, Any]:
 
 
 @app.get("/api/readmodel/{readmodel_id}/cqrs/events")
-async def get_events_for_cqrs(readmodel_id: str) -> list[dict[str, Any]]:
+def get_events_for_cqrs(readmodel_id: str) -> list[dict[str, Any]]:
     """
     Get all available events that can be used as triggers for CQRS operations.
     Each event includes its properties for mapping configuration.
@@ -1533,7 +1336,7 @@ async def get_events_for_cqrs(readmodel_id: str) -> list[dict[str, Any]]:
 
 
 @app.get("/api/readmodel/{readmodel_id}/properties")
-async def get_readmodel_properties(readmodel_id: str) -> list[dict[str, Any]]:
+def get_readmodel_properties(readmodel_id: str) -> list[dict[str, Any]]:
     """
     Get all properties of a ReadModel for CQRS mapping configuration.
     """
@@ -1542,7 +1345,7 @@ async def get_readmodel_properties(readmodel_id: str) -> list[dict[str, Any]]:
 
 
 @app.post("/api/readmodel/{readmodel_id}/cqrs/operations")
-async def create_cqrs_operation(
+def create_cqrs_operation(
     readmodel_id: str,
     operation: CQRSOperationCreate
 ) -> dict[str, Any]:
@@ -1566,7 +1369,7 @@ async def create_cqrs_operation(
 
 
 @app.delete("/api/cqrs/operation/{operation_id}")
-async def delete_cqrs_operation(operation_id: str) -> dict[str, Any]:
+def delete_cqrs_operation(operation_id: str) -> dict[str, Any]:
     """Delete a CQRS operation and all its mappings/where conditions."""
     client = get_neo4j_client()
     deleted = client.delete_cqrs_operation(operation_id)
@@ -1574,7 +1377,7 @@ async def delete_cqrs_operation(operation_id: str) -> dict[str, Any]:
 
 
 @app.post("/api/cqrs/operation/{operation_id}/mappings")
-async def create_cqrs_mapping(
+def create_cqrs_mapping(
     operation_id: str,
     mapping: CQRSMappingCreate
 ) -> dict[str, Any]:
@@ -1592,7 +1395,7 @@ async def create_cqrs_mapping(
 
 
 @app.delete("/api/cqrs/mapping/{mapping_id}")
-async def delete_cqrs_mapping(mapping_id: str) -> dict[str, Any]:
+def delete_cqrs_mapping(mapping_id: str) -> dict[str, Any]:
     """Delete a CQRS field mapping."""
     client = get_neo4j_client()
     deleted = client.delete_cqrs_mapping(mapping_id)
@@ -1600,7 +1403,7 @@ async def delete_cqrs_mapping(mapping_id: str) -> dict[str, Any]:
 
 
 @app.post("/api/cqrs/operation/{operation_id}/where")
-async def create_cqrs_where(
+def create_cqrs_where(
     operation_id: str,
     where: CQRSWhereCreate
 ) -> dict[str, Any]:
@@ -1617,7 +1420,7 @@ async def create_cqrs_where(
 
 
 @app.delete("/api/cqrs/where/{where_id}")
-async def delete_cqrs_where(where_id: str) -> dict[str, Any]:
+def delete_cqrs_where(where_id: str) -> dict[str, Any]:
     """Delete a CQRS WHERE condition."""
     client = get_neo4j_client()
     deleted = client.delete_cqrs_where(where_id)
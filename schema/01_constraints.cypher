@@ -104,6 +104,13 @@ CREATE CONSTRAINT constraint_property_name IF NOT EXISTS
 FOR (prop:Property)
 REQUIRE prop.name IS NOT NULL;
 
+// ------------------------------------------------------------
+// ReadModel: 조회 모델 (CQRS)
+// ------------------------------------------------------------
+CREATE CONSTRAINT constraint_readmodel_id IF NOT EXISTS
+FOR (rm:ReadModel)
+REQUIRE rm.id IS UNIQUE;
+
 // ------------------------------------------------------------
 // UI: 와이어프레임 (Command/ReadModel에 부착)
 // ------------------------------------------------------------
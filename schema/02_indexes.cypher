@@ -99,3 +99,27 @@ ON (ui.name);
 CREATE INDEX index_ui_attached IF NOT EXISTS
 FOR (ui:UI)
 ON (ui.attachedToId);
+
+// ------------------------------------------------------------
+// 레거시 분석 노드 인덱스 (robo-analyzer 생성)
+// ------------------------------------------------------------
+
+// Table 사용자/프로젝트 필터 (legacy_analysis 로더)
+CREATE INDEX index_table_user_project IF NOT EXISTS
+FOR (t:Table)
+ON (t.user_id, t.project_name);
+
+// PROCEDURE 사용자/프로젝트 필터
+CREATE INDEX index_procedure_user_project IF NOT EXISTS
+FOR (p:PROCEDURE)
+ON (p.user_id, p.project_name);
+
+// FUNCTION 사용자/프로젝트 필터
+CREATE INDEX index_function_user_project IF NOT EXISTS
+FOR (f:FUNCTION)
+ON (f.user_id, f.project_name);
+
+// TRIGGER 사용자/프로젝트 필터
+CREATE INDEX index_trigger_user_project IF NOT EXISTS
+FOR (tr:TRIGGER)
+ON (tr.user_id, tr.project_name);
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Cypher 스크립트 일괄 실행 도우미
+
+load_all.py / load_schema.py 가 공유합니다.
+같은 모양(리터럴 값만 다른)의 연속된 문장을 하나의
+`UNWIND $rows AS row ...` 쿼리로 묶어 Bolt 왕복 횟수를 줄입니다.
+"""
+
+import hashlib
+import json
+import re
+from itertools import groupby
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+# 한 트랜잭션에서 처리할 최대 row 수
+BATCH_SIZE = 10_000
+# 여러 묶음을 한 트랜잭션으로 합칠 때의 최대 문장 수
+TX_STATEMENT_LIMIT = 500
+
+# 파싱된 문장 목록 캐시 위치
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "cypher"
+# iter_statements 의 결과가 바뀌면 올려서 이전 캐시를 무효화
+PARSER_VERSION = 1
+
+# .cypher 파일을 읽을 때의 버퍼 크기
+READ_BUFFER_SIZE = 1 << 20
+
+# 문자열 리터럴, 그리고 맵 값 위치(`key: ...`)의 숫자/불리언 리터럴
+LITERAL = re.compile(
+    r'"((?:[^"\\]|\\.)*)"|\'((?:[^\'\\]|\\.)*)\''
+    r'|(?<=:)(\s*)(-?\d+(?:\.\d+)?|true|false)\b(?![\w.])'
+)
+# Cypher 문자열 이스케이프 (\uXXXX, \UXXXXXXXX 포함)
+ESCAPE_SEQUENCE = re.compile(r"\\(u[0-9a-fA-F]{4}|U[0-9a-fA-F]{8}|.)", re.DOTALL)
+ESCAPES = {
+    "t": "\t", "b": "\b", "n": "\n", "r": "\r", "f": "\f",
+    "'": "'", '"': '"', "\\": "\\",
+}
+# 템플릿이 쓰는 row 변수와 이름이 겹치는 문장은 묶지 않음
+ROW_VARIABLE = re.compile(r"\brow\b")
+
+# 스키마 명령은 파라미터화/트랜잭션 묶음이 불가하므로 한 문장씩 실행
+NON_BATCHABLE = re.compile(
+    r"^\s*(?:(?:CREATE|DROP)\s+(?:\w+\s+)?(?:CONSTRAINT|INDEX)\b|SHOW\b|CALL\b)",
+    re.IGNORECASE,
+)
+
+
+def iter_statements(path: Path) -> Iterator[str]:
+    """파일을 한 줄씩 읽으며 주석/빈 줄을 건너뛰고 줄 끝 세미콜론 단위로 문장 생성"""
+    current_statement = []
+
+    with path.open("r", encoding="utf-8", buffering=READ_BUFFER_SIZE) as f:
+        for line in f:
+            stripped = line.strip()
+            if stripped.startswith('//') or not stripped:
+                continue
+            current_statement.append(line.rstrip('\n'))
+            if stripped.endswith(';'):
+                yield '\n'.join(current_statement).strip().rstrip(';')
+                current_statement = []
+
+    # 마지막 문장 (세미콜론 없는 경우)
+    if current_statement:
+        yield '\n'.join(current_statement).strip().rstrip(';')
+
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(READ_BUFFER_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_statements(path: Path) -> list[str]:
+    """iter_statements 결과를 파서 버전 + 파일 내용 해시 기준으로 .cache/cypher 에 캐시"""
+    cache_path = CACHE_DIR / f"v{PARSER_VERSION}-{_file_digest(path)}.json"
+    try:
+        return json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        pass
+
+    statements = list(iter_statements(path))
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(statements, ensure_ascii=False), encoding="utf-8")
+    except OSError:
+        pass
+    return statements
+
+
+def _unescape(value: str) -> str:
+    """Cypher 문자열 리터럴 본문을 실제 값으로 변환. 모르는 이스케이프는 ValueError"""
+    def replace(match: re.Match) -> str:
+        escape = match.group(1)
+        if len(escape) > 1:
+            return chr(int(escape[1:], 16))
+        if escape not in ESCAPES:
+            raise ValueError(f"unsupported escape sequence: \\{escape}")
+        return ESCAPES[escape]
+    
+    # \uD83D\uDE00 처럼 UTF-16 서로게이트 쌍으로 적힌 문자를 합침 (짝 없는 서로게이트는 ValueError)
+    return ESCAPE_SEQUENCE.sub(replace, value).encode("utf-16", "surrogatepass").decode("utf-16")
+
+
+def _parse_scalar(value: str):
+    if value in ("true", "false"):
+        return value == "true"
+    return float(value) if "." in value else int(value)
+
+
+def to_template(stmt: str) -> tuple[str, Optional[dict]]:
+    """
+    리터럴 값을 row.pN 참조로 바꾼 템플릿과 값 dict 반환.
+    묶을 수 없는 문장은 (원문, None).
+    """
+    if NON_BATCHABLE.match(stmt) or ROW_VARIABLE.search(stmt):
+        return stmt, None
+
+    params = {}
+
+    def replace(match: re.Match) -> str:
+        key = f"p{len(params)}"
+        double_quoted, single_quoted, spacing, scalar = match.groups()
+        if scalar is not None:
+            params[key] = _parse_scalar(scalar)
+            return f"{spacing}row.{key}"
+        params[key] = _unescape(double_quoted if double_quoted is not None else single_quoted)
+        return f"row.{key}"
+
+    try:
+        template = LITERAL.sub(replace, stmt)
+    except ValueError:
+        # 값을 그대로 옮길 수 없는 리터럴이 있으면 원문 그대로 실행
+        return stmt, None
+    if not params:
+        return stmt, None
+
+    # 문장 안에서 다시 참조되지 않는 노드 변수는 제거 (CREATE (bcOrder:...) → CREATE (:...))
+    # 변수명만 다른 CREATE 문들이 같은 템플릿으로 묶이도록 함
+    def drop_unused_variable(match: re.Match) -> str:
+        name = match.group(1)
+        if len(re.findall(rf"\b{name}\b", template)) == 1:
+            return "(:"
+        return match.group(0)
+
+    template = re.sub(r"\((\w+):", drop_unused_variable, template)
+    return template, params
+
+
+# (첫 문장 번호, 쿼리, rows) — rows 가 None 이면 쿼리를 그대로 한 번 실행
+Batch = tuple[int, str, Optional[list[dict]]]
+
+
+def plan_batches(statements: Iterable[str]) -> Iterator[Batch]:
+    """
+    연속된 같은 템플릿의 문장을 묶어 (첫 문장 번호, 쿼리, rows) 생성.
+    rows 가 None 이면 쿼리를 그대로 한 번 실행합니다.
+    """
+    planned = ((i, stmt, *to_template(stmt)) for i, stmt in enumerate(statements, 1))
+
+    for template, group in groupby(planned, key=lambda item: item[2]):
+        group = list(group)
+        first_index, first_stmt, _, params = group[0]
+        if params is None:
+            for index, stmt, _, _ in group:
+                yield index, stmt, None
+        elif len(group) == 1:
+            yield first_index, first_stmt, None
+        else:
+            yield first_index, f"UNWIND $rows AS row\n{template}", [item[3] for item in group]
+
+
+def batch_size(batch: Batch) -> int:
+    """묶음에 포함된 원래 문장 수"""
+    return len(batch[2]) if batch[2] else 1
+
+
+def group_transactions(batches: Iterable[Batch]) -> Iterator[list[Batch]]:
+    """
+    스키마 명령은 단독으로, 나머지 연속 묶음은 문장 수 합이
+    TX_STATEMENT_LIMIT 이하가 되도록 하나의 write 트랜잭션 그룹으로 묶음.
+    """
+    pending: list[Batch] = []
+    pending_size = 0
+
+    for batch in batches:
+        size = batch_size(batch)
+        if NON_BATCHABLE.match(batch[1]):
+            if pending:
+                yield pending
+                pending, pending_size = [], 0
+            yield [batch]
+            continue
+        if pending and pending_size + size > TX_STATEMENT_LIMIT:
+            yield pending
+            pending, pending_size = [], 0
+        pending.append(batch)
+        pending_size += size
+
+    if pending:
+        yield pending
+
+
+def _run_query(tx, query: str):
+    tx.run(query).consume()
+
+
+def _run_rows(tx, query: str, rows: list[dict]):
+    tx.run(query, rows=rows).consume()
+
+
+def _run_group(tx, group: list[Batch]):
+    for _, query, rows in group:
+        if rows is None:
+            tx.run(query).consume()
+        else:
+            tx.run(query, rows=rows).consume()
+
+
+def run_batch(session, query: str, rows: Optional[list[dict]]):
+    """
+    스키마 명령은 auto-commit 으로, 나머지 단일 문장은 write 트랜잭션으로,
+    묶음은 BATCH_SIZE 단위 write 트랜잭션으로 실행 (일시적 오류는 드라이버가 재시도)
+    """
+    if rows is None:
+        if NON_BATCHABLE.match(query):
+            session.run(query).consume()
+        else:
+            session.execute_write(_run_query, query)
+        return
+
+    for start in range(0, len(rows), BATCH_SIZE):
+        session.execute_write(_run_rows, query, rows[start:start + BATCH_SIZE])
+
+
+def run_group(session, group: list[Batch]):
+    """group_transactions 의 그룹 하나를 실행 (여러 묶음이면 한 트랜잭션, 커밋 1회)"""
+    if len(group) == 1:
+        _, query, rows = group[0]
+        run_batch(session, query, rows)
+    else:
+        session.execute_write(_run_group, group)
+
+
+# 독립적으로 병렬 실행 가능한 묶음의 종류
+# - "create": MATCH/MERGE 없이 노드만 생성
+# - "link":   기존 노드를 MATCH 해서 관계만 생성 (새 노드 생성 없음)
+# 그 외(스키마 명령, MERGE/SET/DELETE 등)는 "serial" 로 순서대로 실행
+SERIAL_KEYWORDS = re.compile(r"\b(?:MERGE|SET|REMOVE|DELETE|DETACH|CALL|FOREACH|LOAD)\b", re.IGNORECASE)
+MATCH_KEYWORD = re.compile(r"\bMATCH\b", re.IGNORECASE)
+LABELED_NODE_AFTER_CREATE = re.compile(r"\bCREATE\b.*\(\w*:", re.IGNORECASE | re.DOTALL)
+
+
+def batch_kind(query: str) -> str:
+    if NON_BATCHABLE.match(query) or SERIAL_KEYWORDS.search(query):
+        return "serial"
+    if not MATCH_KEYWORD.search(query):
+        return "create"
+    if LABELED_NODE_AFTER_CREATE.search(query):
+        return "serial"
+    return "link"
+
+
+def plan_waves(statements: Iterable[str]) -> Iterator[list[list[Batch]]]:
+    """
+    plan_batches 결과를 순서를 지키는 wave 로 묶음. wave 는 트랜잭션 그룹의 목록이며,
+    같은 wave 의 그룹끼리는 서로 의존하지 않으므로 동시에 실행할 수 있습니다.
+    순서대로 실행할 묶음들은 group_transactions 로 트랜잭션을 합칩니다.
+    """
+    serial: list[Batch] = []
+
+    for kind, group in groupby(plan_batches(statements), key=lambda batch: batch_kind(batch[1])):
+        group = list(group)
+        if kind == "serial" or len(group) == 1:
+            serial.extend(group)
+            continue
+        for tx_group in group_transactions(serial):
+            yield [tx_group]
+        serial = []
+        yield [[batch] for batch in group]
+
+    for tx_group in group_transactions(serial):
+        yield [tx_group]
+
+
+async def _run_query_async(tx, query: str):
+    result = await tx.run(query)
+    await result.consume()
+
+
+async def _run_rows_async(tx, query: str, rows: list[dict]):
+    result = await tx.run(query, rows=rows)
+    await result.consume()
+
+
+async def _run_group_async(tx, group: list[Batch]):
+    for _, query, rows in group:
+        result = await (tx.run(query) if rows is None else tx.run(query, rows=rows))
+        await result.consume()
+
+
+async def run_batch_async(session, query: str, rows: Optional[list[dict]]):
+    """run_batch 의 AsyncSession 버전"""
+    if rows is None:
+        if NON_BATCHABLE.match(query):
+            result = await session.run(query)
+            await result.consume()
+        else:
+            await session.execute_write(_run_query_async, query)
+        return
+
+    for start in range(0, len(rows), BATCH_SIZE):
+        await session.execute_write(_run_rows_async, query, rows[start:start + BATCH_SIZE])
+
+
+async def run_group_async(session, group: list[Batch]):
+    """run_group 의 AsyncSession 버전"""
+    if len(group) == 1:
+        _, query, rows = group[0]
+        await run_batch_async(session, query, rows)
+    else:
+        await session.execute_write(_run_group_async, group)
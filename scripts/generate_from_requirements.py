@@ -11,6 +11,8 @@ Usage:
 
 import os
 import sys
+from functools import lru_cache
+from pathlib import Path
 from typing import List
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -68,6 +70,7 @@ User Story ID는 US-001, US-002 형식으로 순차적으로 부여하세요.
 """
 
 
+@lru_cache(maxsize=1)
 def get_llm():
     """Get the configured LLM instance."""
     provider = os.getenv("LLM_PROVIDER", "openai")
@@ -81,12 +84,17 @@ def get_llm():
         return ChatOpenAI(model=model, temperature=0)
 
 
+@lru_cache(maxsize=1)
+def get_structured_llm():
+    """LLM bound to the UserStoryList schema (built once per process)."""
+    return get_llm().with_structured_output(UserStoryList)
+
+
 def extract_user_stories(requirements_text: str) -> List[GeneratedUserStory]:
     """Extract user stories from requirements text using LLM."""
     from langchain_core.messages import HumanMessage, SystemMessage
 
-    llm = get_llm()
-    structured_llm = llm.with_structured_output(UserStoryList)
+    structured_llm = get_structured_llm()
 
     system_prompt = """당신은 도메인 주도 설계(DDD) 전문가입니다. 
 요구사항을 User Story로 변환하는 작업을 수행합니다.
@@ -102,25 +110,14 @@ User Story는 명확하고 테스트 가능해야 합니다."""
     return response.user_stories
 
 
-def save_user_stories_to_neo4j(user_stories: List[GeneratedUserStory]):
-    """Save user stories to Neo4j."""
+def save_user_stories_to_neo4j(user_stories: List[GeneratedUserStory]) -> int:
+    """Save user stories to Neo4j in a single UNWIND write. Returns the number saved."""
     from agent.neo4j_client import get_neo4j_client
 
     client = get_neo4j_client()
-    saved = []
-
-    for us in user_stories:
-        result = client.create_user_story(
-            id=us.id,
-            role=us.role,
-            action=us.action,
-            benefit=us.benefit,
-            priority=us.priority,
-            status="draft"
-        )
-        saved.append(result)
-
-    return saved
+    return client.create_user_stories_bulk(
+        [{**us.model_dump(), "status": "draft"} for us in user_stories]
+    )
 
 
 def run_event_storming_workflow():
@@ -177,13 +174,12 @@ def main():
     requirements_text = None
     if len(sys.argv) > 2 and sys.argv[1] == "--file":
         filepath = sys.argv[2]
-        if os.path.exists(filepath):
-            with open(filepath, "r", encoding="utf-8") as f:
-                requirements_text = f.read()
-            console.print(f"\n[green]✓ 파일에서 요구사항 로드: {filepath}[/green]")
-        else:
+        try:
+            requirements_text = Path(filepath).read_text(encoding="utf-8")
+        except FileNotFoundError:
             console.print(f"[red]파일을 찾을 수 없음: {filepath}[/red]")
             return 1
+        console.print(f"\n[green]✓ 파일에서 요구사항 로드: {filepath}[/green]")
 
     # If no file, use sample or prompt
     if not requirements_text:
@@ -239,14 +235,14 @@ def main():
         console.print(f"[green]✓ {len(user_stories)}개의 User Story 추출 완료[/green]\n")
 
         # Display extracted stories
-        table = Table(title="추출된 User Stories", show_header=True)
+        table = Table(title="추출된 User Stories", show_header=True, expand=False)
         table.add_column("ID", style="cyan")
         table.add_column("Role", style="green")
-        table.add_column("Action")
+        table.add_column("Action", max_width=43, no_wrap=True, overflow="ellipsis")
         table.add_column("Priority", style="yellow")
 
         for us in user_stories:
-            table.add_row(us.id, us.role, us.action[:40] + "..." if len(us.action) > 40 else us.action, us.priority)
+            table.add_row(us.id, us.role, us.action, us.priority)
 
         console.print(table)
 
@@ -258,7 +254,7 @@ def main():
     console.print("\n[bold cyan]💾 Step 2: Neo4j에 저장 중...[/bold cyan]")
     try:
         saved = save_user_stories_to_neo4j(user_stories)
-        console.print(f"[green]✓ {len(saved)}개의 User Story 저장 완료[/green]")
+        console.print(f"[green]✓ {saved}개의 User Story 저장 완료[/green]")
     except Exception as e:
         console.print(f"[bold red]Neo4j 저장 실패: {e}[/bold red]")
         return 1
@@ -281,13 +277,13 @@ def main():
             for bc in final_state.approved_bcs:
                 console.print(f"    - {bc.name}: {bc.description[:50]}...")
 
-            agg_count = sum(len(aggs) for aggs in final_state.approved_aggregates.values())
+            agg_count = sum(map(len, final_state.approved_aggregates.values()))
             console.print(f"  • Aggregates: {agg_count}")
 
-            cmd_count = sum(len(cmds) for cmds in final_state.command_candidates.values())
+            cmd_count = sum(map(len, final_state.command_candidates.values()))
             console.print(f"  • Commands: {cmd_count}")
 
-            evt_count = sum(len(evts) for evts in final_state.event_candidates.values())
+            evt_count = sum(map(len, final_state.event_candidates.values()))
             console.print(f"  • Events: {evt_count}")
 
             console.print(f"  • Policies: {len(final_state.approved_policies)}")
@@ -8,6 +8,8 @@ from neo4j import GraphDatabase
 from pathlib import Path
 import sys
 
+from cypher_batch import batch_size, group_transactions, load_statements, plan_batches, run_group
+
 # Neo4j 연결 설정
 NEO4J_URI = "bolt://localhost:7687"
 NEO4J_USER = "neo4j"
@@ -24,43 +26,26 @@ def load_cypher_file(driver, filepath: Path, description: str):
     print(f"   File: {filepath.name}")
     print('='*60)
     
-    content = filepath.read_text(encoding='utf-8')
-    
     # 주석과 빈 줄을 제외한 실제 쿼리문 추출
-    # 세미콜론으로 구분된 각 문장을 개별 실행
-    statements = []
-    current_statement = []
-    
-    for line in content.split('\n'):
-        stripped = line.strip()
-        # 주석이나 빈 줄 건너뛰기
-        if stripped.startswith('//') or not stripped:
-            continue
-        current_statement.append(line)
-        if stripped.endswith(';'):
-            statements.append('\n'.join(current_statement))
-            current_statement = []
-    
-    # 마지막 문장 (세미콜론 없는 경우)
-    if current_statement:
-        statements.append('\n'.join(current_statement))
+    statements = load_statements(filepath)
     
     success_count = 0
     error_count = 0
     
     with driver.session() as session:
-        for i, stmt in enumerate(statements, 1):
-            stmt = stmt.strip()
-            if not stmt:
-                continue
+        # 같은 모양의 연속 문장은 UNWIND 한 번으로 묶고,
+        # 스키마 명령 외의 묶음은 최대 TX_STATEMENT_LIMIT 문장씩 한 트랜잭션으로 실행
+        for group in group_transactions(plan_batches(statements)):
+            i = group[0][0]
+            count = sum(map(batch_size, group))
             try:
-                session.run(stmt)
-                success_count += 1
+                run_group(session, group)
+                success_count += count
                 # 진행 상황 표시 (10개마다)
-                if success_count % 10 == 0:
+                if success_count // 10 > (success_count - count) // 10:
                     print(f"   ✓ {success_count} statements executed...")
             except Exception as e:
-                error_count += 1
+                error_count += count
                 print(f"   ✗ Error in statement {i}: {str(e)[:80]}")
     
     print(f"\n   ✅ Success: {success_count} statements")